@@ -0,0 +1,150 @@
+#----------NZ Flags Microbenchmark----------
+#
+# Times CPU.run() on the raw_6502asm_rom_loader sample loop (LDX #imm, INY, DEX, BNE, ASL A) two ways:
+#   helpers : the core's handler table, with LDX/INY/DEX swapped for versions that set N and Z
+#             with sr = zero_flag(v, sr); sr = negative_flag(v, sr)   (how the core used to do it)
+#   table   : the core's handler table as it is, sr = (sr & 0x7D) | NZ_FLAGS[v]
+#
+# Both run the same program through the same run() loop, so the difference per instruction is the
+# saving, and a slower NZ_FLAGS path in mos_6502_cpu.py shows up here.
+#
+#   python "Benchmarks/nz_flags_benchmark.py"
+
+from array import array
+from pathlib import Path
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "Rom Loaders"))
+
+from mos_6502_cpu import CPU, NZ_FLAGS
+import raw_6502asm_rom_loader
+
+
+CYCLES = 2_000_000
+
+# One pass of the sample is 41 instructions in 92 cycles: LDX, INY, DEX, BNE, then 9 x (ASL A, INY,
+# DEX, BNE) since BNE -5 lands on the LDX operand ($0A, ASL A), then JMP. Checked by count_pass().
+PASS_INSTRUCTIONS = 41
+PASS_CYCLES = 92
+
+
+
+def negative_flag(ac, sr):
+    #Negative Flag (N)
+    if ac & 0x80:
+        sr |= 0x80
+    else:
+        sr &= ~0x80
+    return sr
+
+def zero_flag(ac, sr):
+    #Zero Flag (Z)
+    if ac == 0:
+        sr |= 0x02
+    else:
+        sr &= ~0x02
+    return sr
+
+
+
+def ldx_immediate(cpu, pc, operand_lower, operand_higher): #LDX Immediate
+    sr = cpu.sr
+
+    x = operand_lower
+
+    sr = zero_flag(x, sr)
+    sr = negative_flag(x, sr)
+
+    pc += 2
+
+    cpu.x = x
+    cpu.sr = sr
+    return pc
+
+def iny(cpu, pc, operand_lower, operand_higher): #INY (Increment Y)
+    sr = cpu.sr
+
+    y = (cpu.y + 1) & 0xFF
+
+    sr = zero_flag(y, sr)
+    sr = negative_flag(y, sr)
+
+    pc += 1
+
+    cpu.y = y
+    cpu.sr = sr
+    return pc
+
+def dex(cpu, pc, operand_lower, operand_higher): #DEX (Decrement X)
+    sr = cpu.sr
+
+    x = (cpu.x - 1) & 0xFF
+
+    sr = zero_flag(x, sr)
+    sr = negative_flag(x, sr)
+
+    pc += 1
+
+    cpu.x = x
+    cpu.sr = sr
+    return pc
+
+HELPER_HANDLERS = {0xA2: ldx_immediate, 0xC8: iny, 0xCA: dex}
+
+
+
+def sample_program():
+    # The loader's sample loop, with the BRK it falls into replaced by JMP $0000 so it runs for the whole budget
+    ram_64KB = array('B', raw_6502asm_rom_loader.ram_64KB)
+    ram_64KB[0x0006:0x0009] = array('B', [0x4C, 0x00, 0x00])
+    return ram_64KB
+
+
+def new_cpu(helpers):
+    cpu = CPU(sample_program(), raw_6502asm_rom_loader.pc)
+    if helpers:
+        table = list(cpu.opcode_table)
+        for opcode, handler in HELPER_HANDLERS.items():
+            table[opcode] = handler
+        cpu.opcode_table = table
+    return cpu
+
+
+def count_pass():
+    # Instructions and cycles from $0000 back to $0000, one step at a time
+    cpu = new_cpu(False)
+    instructions = 0
+    while instructions == 0 or cpu.pc != 0x0000:
+        cpu.step()
+        instructions += 1
+    return instructions, cpu.cycle_count
+
+
+def time_per_instruction(helpers):
+    cpu = new_cpu(helpers)
+    start = time.perf_counter()
+    cpu.run(CYCLES)
+    elapsed = time.perf_counter() - start
+    return elapsed / (CYCLES * PASS_INSTRUCTIONS / PASS_CYCLES) * 1e9
+
+
+
+if __name__ == "__main__":
+    assert count_pass() == (PASS_INSTRUCTIONS, PASS_CYCLES)
+
+    # Same program, same registers at the end
+    with_helpers = new_cpu(True)
+    with_table = new_cpu(False)
+    with_helpers.run(10000)
+    with_table.run(10000)
+    assert with_helpers.snapshot() == with_table.snapshot()
+    assert all(NZ_FLAGS[value] == zero_flag(value, negative_flag(value, 0)) for value in range(256))
+
+    helpers_ns = min(time_per_instruction(True) for i in range(3))
+    table_ns = min(time_per_instruction(False) for i in range(3))
+
+    print(f"zero_flag/negative_flag : {helpers_ns:7.1f} ns per instruction")
+    print(f"NZ_FLAGS table          : {table_ns:7.1f} ns per instruction")
+    print(f"saving                  : {helpers_ns - table_ns:7.1f} ns per instruction ({(1 - table_ns / helpers_ns) * 100:.0f}%)")
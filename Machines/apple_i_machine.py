@@ -0,0 +1,358 @@
+#----------Apple I----------
+# Woz Monitor and Integer BASIC, the 40x24 text display and the keyboard
+#   python -m mos_6502_cpu apple1 [--rom FOLDER] [--headless | --terminal] [--turbo] [--frames N] [--core CORE]
+from collections import deque
+import contextlib
+import sys
+import time
+
+from mos_6502_cpu import machine_cpu
+import apple_i_roms_loader
+
+
+
+#Character Generator
+# The 2513's 64 glyphs, 8 rows of 7 pixels each (top row first, bit 6 is the leftmost pixel)
+APPLE_I_GLYPHS = bytes([
+    0x00, 0x1C, 0x22, 0x2A, 0x2E, 0x2C, 0x20, 0x1E,  #@
+    0x00, 0x08, 0x14, 0x22, 0x22, 0x3E, 0x22, 0x22,  #A
+    0x00, 0x3C, 0x22, 0x22, 0x3C, 0x22, 0x22, 0x3C,  #B
+    0x00, 0x1C, 0x22, 0x20, 0x20, 0x20, 0x22, 0x1C,  #C
+    0x00, 0x3C, 0x22, 0x22, 0x22, 0x22, 0x22, 0x3C,  #D
+    0x00, 0x3E, 0x20, 0x20, 0x3E, 0x20, 0x20, 0x3E,  #E
+    0x00, 0x3E, 0x20, 0x20, 0x3C, 0x20, 0x20, 0x20,  #F
+    0x00, 0x1E, 0x20, 0x20, 0x20, 0x26, 0x22, 0x1E,  #G
+    0x00, 0x22, 0x22, 0x22, 0x3E, 0x22, 0x22, 0x22,  #H
+    0x00, 0x1C, 0x08, 0x08, 0x08, 0x08, 0x08, 0x1C,  #I
+    0x00, 0x02, 0x02, 0x02, 0x02, 0x02, 0x22, 0x1C,  #J
+    0x00, 0x22, 0x24, 0x28, 0x30, 0x28, 0x24, 0x22,  #K
+    0x00, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x3E,  #L
+    0x00, 0x22, 0x36, 0x2A, 0x2A, 0x22, 0x22, 0x22,  #M
+    0x00, 0x22, 0x22, 0x32, 0x2A, 0x26, 0x22, 0x22,  #N
+    0x00, 0x1C, 0x22, 0x22, 0x22, 0x22, 0x22, 0x1C,  #O
+    0x00, 0x3C, 0x22, 0x22, 0x3C, 0x20, 0x20, 0x20,  #P
+    0x00, 0x1C, 0x22, 0x22, 0x22, 0x2A, 0x24, 0x1A,  #Q
+    0x00, 0x3C, 0x22, 0x22, 0x3C, 0x28, 0x24, 0x22,  #R
+    0x00, 0x1C, 0x22, 0x20, 0x1C, 0x02, 0x22, 0x1C,  #S
+    0x00, 0x3E, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08,  #T
+    0x00, 0x22, 0x22, 0x22, 0x22, 0x22, 0x22, 0x1C,  #U
+    0x00, 0x22, 0x22, 0x22, 0x22, 0x22, 0x14, 0x08,  #V
+    0x00, 0x22, 0x22, 0x22, 0x2A, 0x2A, 0x36, 0x22,  #W
+    0x00, 0x22, 0x22, 0x14, 0x08, 0x14, 0x22, 0x22,  #X
+    0x00, 0x22, 0x22, 0x14, 0x08, 0x08, 0x08, 0x08,  #Y
+    0x00, 0x3E, 0x02, 0x04, 0x08, 0x10, 0x20, 0x3E,  #Z
+    0x00, 0x3E, 0x30, 0x30, 0x30, 0x30, 0x30, 0x3E,  #[
+    0x00, 0x00, 0x20, 0x10, 0x08, 0x04, 0x02, 0x00,  #\
+    0x00, 0x3E, 0x06, 0x06, 0x06, 0x06, 0x06, 0x3E,  #]
+    0x00, 0x00, 0x00, 0x08, 0x14, 0x22, 0x00, 0x00,  #^
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x3E,  #_
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  # 
+    0x00, 0x08, 0x08, 0x08, 0x08, 0x08, 0x00, 0x08,  #!
+    0x00, 0x14, 0x14, 0x14, 0x00, 0x00, 0x00, 0x00,  #"
+    0x00, 0x14, 0x14, 0x3E, 0x14, 0x3E, 0x14, 0x14,  ##
+    0x00, 0x08, 0x1E, 0x28, 0x1C, 0x0A, 0x3C, 0x08,  #$
+    0x00, 0x30, 0x32, 0x04, 0x08, 0x10, 0x26, 0x06,  #%
+    0x00, 0x10, 0x28, 0x28, 0x10, 0x2A, 0x24, 0x1A,  #&
+    0x00, 0x08, 0x08, 0x08, 0x00, 0x00, 0x00, 0x00,  #'
+    0x00, 0x08, 0x10, 0x20, 0x20, 0x20, 0x10, 0x08,  #(
+    0x00, 0x08, 0x04, 0x02, 0x02, 0x02, 0x04, 0x08,  #)
+    0x00, 0x08, 0x2A, 0x1C, 0x08, 0x1C, 0x2A, 0x08,  #*
+    0x00, 0x00, 0x08, 0x08, 0x3E, 0x08, 0x08, 0x00,  #+
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x08, 0x10,  #,
+    0x00, 0x00, 0x00, 0x00, 0x3E, 0x00, 0x00, 0x00,  #-
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08,  #.
+    0x00, 0x00, 0x02, 0x04, 0x08, 0x10, 0x20, 0x00,  #/
+    0x00, 0x1C, 0x22, 0x26, 0x2A, 0x32, 0x22, 0x1C,  #0
+    0x00, 0x08, 0x18, 0x08, 0x08, 0x08, 0x08, 0x1C,  #1
+    0x00, 0x1C, 0x22, 0x02, 0x0C, 0x10, 0x20, 0x3E,  #2
+    0x00, 0x3E, 0x02, 0x04, 0x0C, 0x02, 0x22, 0x1C,  #3
+    0x00, 0x04, 0x0C, 0x14, 0x24, 0x3E, 0x04, 0x04,  #4
+    0x00, 0x3E, 0x20, 0x3C, 0x02, 0x02, 0x22, 0x1C,  #5
+    0x00, 0x0E, 0x10, 0x20, 0x3C, 0x22, 0x22, 0x1C,  #6
+    0x00, 0x3E, 0x02, 0x04, 0x08, 0x10, 0x10, 0x10,  #7
+    0x00, 0x1C, 0x22, 0x22, 0x1C, 0x22, 0x22, 0x1C,  #8
+    0x00, 0x1C, 0x22, 0x22, 0x1E, 0x02, 0x04, 0x08,  #9
+    0x00, 0x00, 0x00, 0x08, 0x00, 0x08, 0x00, 0x00,  #:
+    0x00, 0x00, 0x00, 0x08, 0x00, 0x08, 0x08, 0x10,  #;
+    0x00, 0x04, 0x08, 0x10, 0x20, 0x10, 0x08, 0x04,  #<
+    0x00, 0x00, 0x00, 0x3E, 0x00, 0x3E, 0x00, 0x00,  #=
+    0x00, 0x10, 0x08, 0x04, 0x02, 0x04, 0x08, 0x10,  #>
+    0x00, 0x1C, 0x22, 0x04, 0x08, 0x08, 0x00, 0x08,  #?
+])
+
+# Glyph shown for each character code: 0x40-0x5F are glyphs 0-31, 0x20-0x3F glyphs 32-63,
+# anything else shows as a space
+GLYPH_INDEX = bytes(code - 0x40 if 0x40 <= code <= 0x5F else code if 0x20 <= code <= 0x3F else 0x20
+                    for code in range(256))
+
+
+
+def main(args):
+    # Headless: no window and no graphics imports. The machine runs as fast as the core can go and
+    # the screen is only kept in screen_ring (see screen_text())
+    # Terminal: headless, with the keyboard read from stdin and the display written to stdout, so a
+    # BASIC program or monitor commands can be piped in and the output collected. Runs until
+    # stdin is used up.
+    # Returns the CPU and the screen as 24 lines of text.
+    terminal = args.terminal
+    headless = args.headless or terminal
+    turbo = args.turbo
+    max_frames = args.frames #Stop after this many frames (None: run until the window is closed)
+
+    # Only the Apple I's own output goes to stdout in terminal mode
+    with contextlib.redirect_stdout(sys.stderr if terminal else sys.stdout):
+        if args.rom is not None:
+            ram_64KB, pc = apple_i_roms_loader.load(args.rom)
+        else:
+            ram_64KB, pc = apple_i_roms_loader.load()
+
+    # The display and keyboard are a device on the bus (see #PIA), so the Apple I runs
+    # a frame at a time like the other machines
+    cpu = machine_cpu(ram_64KB, pc, args.core)
+
+    # Translated ROM code is cached on disk between runs
+    cpu.map_rom(0xE000, 0xF000) #Integer BASIC
+    cpu.map_rom(0xFF00, 0x10000) #Woz Monitor
+
+
+    #Display
+    # The 24 rows of 40 characters are a ring: screen row 0 is ring row top_row, so a scroll
+    # moves top_row down one and clears the row that comes round to the bottom
+    screen_ring = bytearray(960)
+    top_row = 0
+    blank_row = bytes(40)
+
+    cursor_xpos = 0
+    cursor_ypos = 0
+
+    # Screen cells (by screen row, not ring row) written since the window was last drawn (all of
+    # them to begin with, the texture starts out undefined)
+    dirty_cells = bytearray(b"\x01" * 960)
+
+    def display_write(character):
+        # One character from the PIA. Carriage return and the 40th column start a new line,
+        # the bottom line scrolls the screen
+        nonlocal cursor_xpos, cursor_ypos, top_row
+
+        if character != 0x0D:
+            screen_ring[(top_row + cursor_ypos) % 24 * 40 + cursor_xpos] = character
+            dirty_cells[cursor_ypos * 40 + cursor_xpos] = 1
+            cursor_xpos += 1
+            if cursor_xpos < 40:
+                return
+
+        cursor_xpos = 0
+        if cursor_ypos < 23:
+            cursor_ypos += 1
+        else:
+            top_row = (top_row + 1) % 24
+            bottom = (top_row + 23) % 24 * 40
+            screen_ring[bottom:bottom + 40] = blank_row
+            dirty_cells[:] = b"\x01" * 960 #Every row moved
+
+    def screen_text():
+        # The screen as 24 lines of 40 characters (what the window shows, for headless runs)
+        lines = []
+        for row in range(24):
+            start = (top_row + row) % 24 * 40
+            lines.append("".join(chr(character) if 0x20 <= character <= 0x5F else " "
+                                 for character in screen_ring[start:start + 40]))
+        return lines
+
+
+
+    #Keyboard
+    # Keystrokes waiting for the Woz Monitor, as Apple I key codes (bit 7 set). The window's
+    # callbacks queue them, the PIA takes the next one each time the last one has been read
+    key_queue = deque()
+    key_queue_size = 64
+
+    def queue_key(code):
+        if len(key_queue) < key_queue_size: #Typed ahead of a full queue: the key is dropped
+            key_queue.append(code)
+
+
+    #Terminal
+    # stdin is only read when the program wants a key and the queue is empty, a line at a time
+    terminal_keys = {0x0A: 0x8D, 0x08: 0xDF, 0x7F: 0xDF, 0x1B: 0x9B} #Newline, backspaces (as _), escape
+    stdin_done = False
+
+    def terminal_read():
+        nonlocal stdin_done
+        sys.stdout.flush() #Show the prompt before waiting for the line
+        line = sys.stdin.buffer.readline()
+        if not line:
+            stdin_done = True
+            cpu.request_stop()
+            return
+
+        for character in line:
+            if 0x61 <= character <= 0x7A:
+                character -= 0x20
+            if 0x20 <= character <= 0x5F:
+                key_queue.append(character | 0x80)
+            elif character in terminal_keys:
+                key_queue.append(terminal_keys[character])
+
+    def terminal_write(character):
+        if character == 0x0D:
+            sys.stdout.write("\n")
+        elif 0x20 <= character <= 0x5F:
+            sys.stdout.write(chr(character))
+
+    display_output = terminal_write if terminal else display_write
+
+
+    #PIA
+    # The 6820 on the bus at $D010-$D013 (A4 selects it, A0-A1 the register, so it repeats
+    # through the page):
+    #   $D010 KBD   : the last key, reading it clears the strobe
+    #   $D011 KBDCR : bit 7 is the strobe, set when a key is waiting in KBD
+    #   $D012 DSP   : every character written goes to the display, bit 7 (busy) always reads clear
+    #   $D013 DSPCR
+    # Bit 2 of a control register picks the port's data register, clear it picks the data
+    # direction register (the Woz Monitor sets DSP's up that way at reset).
+    pia_registers = bytearray(4) #KBD, KBDCR, DSP, DSPCR
+    pia_directions = bytearray(4) #DDRA at 0, DDRB at 2
+
+    def pia_read(address):
+        if not address & 0x10:
+            return ram_64KB[address]
+        register = address & 0x03
+
+        if register & 0x01: #Control register
+            if register == 1 and not pia_registers[1] & 0x80:
+                if terminal and not key_queue:
+                    terminal_read()
+                if key_queue:
+                    # The last key has been read: latch the next one and raise the strobe
+                    pia_registers[0] = key_queue.popleft()
+                    pia_registers[1] |= 0x80
+            return pia_registers[register]
+
+        if not pia_registers[register + 1] & 0x04:
+            return pia_directions[register]
+        if register == 0:
+            pia_registers[1] &= 0x7F
+            return pia_registers[0]
+        return pia_registers[2] & 0x7F
+
+    def pia_write(address, value):
+        if not address & 0x10:
+            ram_64KB[address] = value
+            return
+        register = address & 0x03
+
+        if register & 0x01: #Control register, bits 6-7 are the interrupt flags and read only
+            pia_registers[register] = (pia_registers[register] & 0xC0) | (value & 0x3F)
+        elif not pia_registers[register + 1] & 0x04:
+            pia_directions[register] = value
+        elif register == 2:
+            pia_registers[2] = value
+            display_output(value & 0x7F)
+
+    cpu.map_io(0xD000, 0xD100, pia_read, pia_write)
+
+
+    #Window Scale Value
+    scalevar = 5
+
+
+    apple1_width = 280
+    apple1_height = 192
+
+    apple1_cycles_per_frame = 17050 # 1.023 MHz / 60 Hz
+
+    if not headless:
+        import glfw
+        import glfw_frontend
+
+        window, texture = glfw_frontend.open_window("Apple I  -  Ellie's Ems", "Apple_1_Icon-64x64.png",
+                                                    apple1_width * scalevar, apple1_height * scalevar,
+                                                    apple1_width, apple1_height, turbo)
+        framebuffer = glfw_frontend.new_framebuffer(apple1_width, apple1_height)
+
+        # Keys come in as GLFW events, so nothing is polled per frame and no keystroke is missed
+        # or repeated however fast the emulator runs. Held keys repeat at the host's rate.
+        apple1_special_keys = {
+            glfw.KEY_ENTER: 0x8D,
+            glfw.KEY_KP_ENTER: 0x8D,
+            glfw.KEY_BACKSPACE: 0xDF, #The Woz Monitor and BASIC take _ as backspace
+            glfw.KEY_ESCAPE: 0x9B,
+        }
+
+        def on_char(window, codepoint):
+            # Printable characters, in upper case (the Apple I has no lower case)
+            if 0x61 <= codepoint <= 0x7A:
+                codepoint -= 0x20
+            if 0x20 <= codepoint <= 0x5F:
+                queue_key(codepoint | 0x80)
+
+        def on_key(window, key, scancode, action, mods):
+            if action != glfw.RELEASE and key in apple1_special_keys:
+                queue_key(apple1_special_keys[key])
+
+        glfw.set_char_callback(window, on_char)
+        glfw.set_key_callback(window, on_key)
+
+        # Glyph atlas: [glyph, row, column] -> RGB, white on black
+        import numpy as np
+        glyph_bits = np.unpackbits(np.frombuffer(APPLE_I_GLYPHS, dtype=np.uint8)).reshape(64, 8, 8)[:, :, 1:]
+        glyph_atlas = np.repeat(glyph_bits[..., np.newaxis] * np.uint8(255), 3, axis=3)
+        glyph_index = np.frombuffer(GLYPH_INDEX, dtype=np.uint8)
+
+        # Views of the same memory: the character codes as [ring row, column], the dirty flags,
+        # and the framebuffer as [row, column] cells of 8x7 pixels, top row first (the texture's
+        # first pixel row is the bottom of the window)
+        ring_codes = np.frombuffer(screen_ring, dtype=np.uint8).reshape(24, 40)
+        dirty_flags = np.frombuffer(dirty_cells, dtype=np.uint8)
+        framebuffer_cells = framebuffer[::-1].reshape(24, 8, 40, 7, 3).transpose(0, 2, 1, 3, 4)
+
+
+    def update_texture():
+        # Draw the cells written since the last frame, each one's glyph out of the atlas in one go.
+        # Nothing written (the usual case at the prompt): nothing to draw or upload.
+        if dirty_cells.find(1) == -1:
+            return
+
+        rows, columns = np.divmod(np.flatnonzero(dirty_flags), 40)
+        dirty_cells[:] = bytes(960)
+        framebuffer_cells[rows, columns] = glyph_atlas[glyph_index[ring_codes[(rows + top_row) % 24, columns]]]
+
+        glfw_frontend.upload_texture(texture, framebuffer, apple1_width, apple1_height)
+
+
+    # Frames end on fixed cycle boundaries (an event every frame), so overshoot from the last
+    # instruction of one frame is taken out of the next one
+    def apple1_frame_end(cycle):
+        cpu.request_stop()
+        cpu.schedule(cycle + apple1_cycles_per_frame, apple1_frame_end)
+
+    cpu.schedule(cpu.cycle_count + apple1_cycles_per_frame, apple1_frame_end)
+
+    frames = 0
+    start = time.perf_counter()
+    while frames != max_frames and not stdin_done:
+        if not headless:
+            if not glfw_frontend.draw_frame(window):
+                break
+
+        # Runs until the frame end event stops it
+        cpu.run(2 * apple1_cycles_per_frame)
+
+        if not headless:
+            update_texture()
+        frames += 1
+
+    if terminal:
+        sys.stdout.flush()
+    elif headless:
+        print("\n".join(screen_text()))
+        elapsed = time.perf_counter() - start
+        print(f"{frames} frames, {cpu.cycle_count} cycles in {elapsed:.2f} s ({cpu.cycle_count / elapsed / 1e6:.2f} MHz)")
+        if cpu.fusions:
+            print(cpu.fusion_report())
+    else:
+        glfw_frontend.close()
+
+    return cpu, screen_text()
@@ -0,0 +1,108 @@
+#----------Atari 2600----------
+# The cartridge runs on the CPU, the TIA and RIOT are not emulated yet
+#   python -m mos_6502_cpu atari2600 --rom CARTRIDGE.bin [--headless] [--turbo] [--frames N] [--core CORE]
+import time
+
+from mos_6502_cpu import machine_cpu
+import atari_2600_roms_loader
+
+
+
+def main(args):
+    # Headless: no window and no graphics imports. The machine runs as fast as the core can go and
+    # the screen is only kept in framebuffer. Returns the CPU and the framebuffer.
+    headless = args.headless
+    turbo = args.turbo
+    max_frames = args.frames #Stop after this many frames (None: run until the window is closed)
+
+    ram_64KB, pc = atari_2600_roms_loader.load(args.rom)
+
+    cpu = machine_cpu(ram_64KB, pc, args.core)
+
+    # Translated ROM code is cached on disk between runs
+    cpu.map_rom(0xF000, 0x10000) #Cartridge
+
+
+
+    #Window Scale Value
+    scalevar = 5
+
+
+    atari2600_width = 160
+    atari2600_height = 192
+
+    atari2600_cycles_per_frame = 76 * 262 # 76 cycles per scanline, 262 scanlines (NTSC)
+
+    if not headless:
+        import glfw_frontend
+
+        window, texture = glfw_frontend.open_window("Atari® 2600™  -  Ellie's Ems", "Atari_2600_Icon-64x64.png",
+                                                    256 * scalevar, atari2600_height * scalevar,
+                                                    atari2600_width, atari2600_height, turbo)
+        framebuffer = glfw_frontend.new_framebuffer(atari2600_width, atari2600_height)
+    else:
+        # RGB pixels, rows in the same order as the window's framebuffer
+        framebuffer = bytearray(atari2600_height * atari2600_width * 3)
+
+
+
+    def set_pixel(x, y, rgb):
+        if headless:
+            offset = (y * atari2600_width + x) * 3
+            framebuffer[offset:offset + 3] = bytes(rgb)
+        else:
+            framebuffer[y, x] = rgb
+
+    def draw_picture():
+        # The TIA isn't emulated yet, so the picture is only a test pixel
+        set_pixel(1, 1, (255, 255, 255))
+
+    def update_texture():
+        glfw_frontend.upload_texture(texture, framebuffer, atari2600_width, atari2600_height)
+
+
+
+    def atari_2600_tia():
+        print("a")
+
+
+
+
+
+    # Frames end on fixed cycle boundaries (an event every frame), so overshoot from the last
+    # instruction of one frame is taken out of the next one
+    def atari_2600_frame_end(cycle):
+        cpu.request_stop()
+        cpu.schedule(cycle + atari2600_cycles_per_frame, atari_2600_frame_end)
+
+    cpu.schedule(cpu.cycle_count + atari2600_cycles_per_frame, atari_2600_frame_end)
+
+    frames = 0
+    start = time.perf_counter()
+    while frames != max_frames:
+        if not headless:
+            if not glfw_frontend.draw_frame(window):
+                break
+
+
+
+
+
+
+        # Runs until the frame end event stops it
+        cpu.run(2 * atari2600_cycles_per_frame)
+
+        draw_picture()
+        if not headless:
+            update_texture()
+        frames += 1
+
+    if headless:
+        elapsed = time.perf_counter() - start
+        print(f"{frames} frames, {cpu.cycle_count} cycles in {elapsed:.2f} s ({cpu.cycle_count / elapsed / 1e6:.2f} MHz)")
+        if cpu.fusions:
+            print(cpu.fusion_report())
+    else:
+        glfw_frontend.close()
+
+    return cpu, framebuffer
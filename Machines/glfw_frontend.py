@@ -0,0 +1,95 @@
+#----------GLFW Frontend----------
+# A window with one RGB texture stretched over it, for the machines that aren't run headless.
+# Only imported when a window is wanted, so headless runs never load glfw, OpenGL, PIL or numpy.
+from pathlib import Path
+
+from PIL import Image
+
+import glfw
+import numpy as np
+from OpenGL.GL import *
+
+assets_path = Path(__file__).parent.parent / "Assets"
+
+
+
+def open_window(title, icon, window_width, window_height, texture_width, texture_height, turbo=False):
+    # Open the window and make its texture. Returns (window, texture).
+    if not glfw.init():
+        raise Exception("GLFW can't be initialized")
+
+    # Request legacy context
+    glfw.window_hint(glfw.CONTEXT_VERSION_MAJOR, 2)
+    glfw.window_hint(glfw.CONTEXT_VERSION_MINOR, 1)
+    glfw.window_hint(glfw.OPENGL_PROFILE, glfw.OPENGL_ANY_PROFILE)
+
+    glfw.window_hint(glfw.RESIZABLE, glfw.FALSE)
+
+    window = glfw.create_window(window_width, window_height, title, None, None)
+    if not window:
+        glfw.terminate()
+        raise Exception("GLFW window can't be created")
+
+
+
+    #Set Icon
+    img = Image.open(assets_path / icon).convert("RGBA")
+    width, height = img.size
+    pixels = np.array(img, dtype=np.uint8)
+
+    glfw.set_window_icon(window, 1, [(width, height, pixels)])
+
+
+
+    glfw.make_context_current(window)
+    glfw.swap_interval(0 if turbo else 1)  # vsync, unless turbo
+
+    glClearColor(0.0, 0.0, 0.0, 1.0)
+
+    # Create texture
+    texture = glGenTextures(1)
+    glBindTexture(GL_TEXTURE_2D, texture)
+    glTexImage2D(GL_TEXTURE_2D, 0, GL_RGB, texture_width, texture_height, 0, GL_RGB, GL_UNSIGNED_BYTE, None)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+    glEnable(GL_TEXTURE_2D)
+
+    return window, texture
+
+
+def new_framebuffer(width, height):
+    # RGB pixels for the texture, indexed [y, x]
+    return np.zeros((height, width, 3), dtype=np.uint8)
+
+
+def draw_frame(window):
+    # Show the texture. Returns False once the window has been closed.
+    if glfw.window_should_close(window):
+        return False
+
+    glfw.poll_events()
+    glClear(GL_COLOR_BUFFER_BIT)
+
+    # Draw quad
+    glBegin(GL_QUADS)
+    glTexCoord2f(0, 0); glVertex2f(-1, -1)
+    glTexCoord2f(1, 0); glVertex2f(1, -1)
+    glTexCoord2f(1, 1); glVertex2f(1, 1)
+    glTexCoord2f(0, 1); glVertex2f(-1, 1)
+    glEnd()
+
+    glfw.swap_buffers(window)
+    return True
+
+
+def upload_texture(texture, framebuffer, width, height):
+    # Copy framebuffer into the texture, it shows from the next draw_frame()
+    glBindTexture(GL_TEXTURE_2D, texture)
+    glTexSubImage2D(GL_TEXTURE_2D, 0, 0, 0,
+                    width, height,
+                    GL_RGB, GL_UNSIGNED_BYTE,
+                    np.ascontiguousarray(framebuffer))
+
+
+def close():
+    glfw.terminate()
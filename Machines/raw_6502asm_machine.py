@@ -0,0 +1,40 @@
+#----------Custom 6502 ASM----------
+# A bare 6502 with 64KB of RAM, running until it hits BRK (or jams on a KIL)
+#   python -m mos_6502_cpu raw [--rom BINARY --start ADDR] [--core CORE]
+from array import array
+
+from mos_6502_cpu import machine_cpu
+
+
+
+def main(args):
+    if args.rom is not None:
+        ram_64KB = array('B', [0] * 65536)
+        rom_data = args.rom.read_bytes()[:0x10000 - args.start]
+        ram_64KB[args.start:args.start + len(rom_data)] = array('B', rom_data)
+        pc = args.start
+        print(f"{args.rom.name} loaded at {hex(args.start)}, PC = {hex(pc)} in General 6502 ram\n")
+    else:
+        import raw_6502asm_rom_loader
+
+        ram_64KB = raw_6502asm_rom_loader.ram_64KB
+        pc = raw_6502asm_rom_loader.pc
+
+    cpu = machine_cpu(ram_64KB, pc, args.core)
+
+
+
+    custom6502_cycles_per_run = 10000
+
+    while cpu.halt == False and not cpu.jammed:
+        cpu.run(custom6502_cycles_per_run)
+
+    if cpu.jammed:
+        print(f"CPU JAMMED AT {cpu.pc:#06x}")
+    else:
+        print("BREAK OCCURED")
+
+    if cpu.fusions:
+        print(cpu.fusion_report())
+
+    return cpu
@@ -1,7909 +1,7609 @@
-#----------Miscellaneous----------
-from pathlib import Path
-from array import array
-import time
-
-
-
-#----------Roms----------
-
-#Custom 6502 ASM
-import raw_6502asm_rom_loader
-
-
-#Apple I
-import apple_i_roms_loader
-
-
-#Atari 2600
-import atari_2600_roms_loader
-
-
-
-
-#----------Graphics----------
-from PIL import Image
-
-import glfw
-import numpy as np
-from OpenGL.GL import *
-
-base_path = Path(__file__).parent
-
-
-option = 1
-
-if option == 0:
-    custom6502 = True
-    apple_i = False
-    atari_2600 = False
-    
-
-elif option == 1:
-    apple_i = True
-    custom6502 = False
-    atari_2600 = False
-
-
-elif option == 2:
-    atari_2600 = True
-    custom6502 = False
-    apple_i = False
-
-
-
-
-if custom6502 == True:
-    ram_64KB = raw_6502asm_rom_loader.ram_64KB
-
-    pc = raw_6502asm_rom_loader.pc
-
-if apple_i == True:
-    ram_64KB = apple_i_roms_loader.program
-
-    pc = apple_i_roms_loader.pc
-
-if atari_2600 == True:
-    ram_64KB = atari_2600_roms_loader.program
-
-    pc = atari_2600_roms_loader.pc
-
-
-
-
-#----------Registers----------
-
-#Accumulator
-ac = 0
-
-#X Register
-x = 0 
-
-#Y Register
-y = 0 
-
-#Status Register [NV-BDIZC]	
-sr = 0x00 
-
-#Stack Pointer
-sp = 0xFF 
-
-halt = False #For break (BRK)
-
-# SR FLAGS : N V - B D I Z C
-
-
-
-def negative_flag(ac, sr):
-    #Negative Flag (N)
-    if ac & 0x80:
-        sr |= 0x80
-    else:
-        sr &= ~0x80
-    return sr
-
-def zero_flag(ac, sr):
-    #Zero Flag (Z)
-    if ac == 0:
-        sr |= 0x02
-    else:
-        sr &= ~0x02
-    return sr
-
-def interrupt_test_chip(a):
-    a += 1
-    if a == 10:
-        set_nmi(False)
-    elif a == 12:
-        set_nmi(False)
-    return a
-
-def push_byte(value):
-    global sp
-    ram_64KB[0x0100 + sp] = value & 0xFF
-    sp = (sp - 1) & 0xFF 
-
-def pull_byte():
-    global sp
-    sp = (sp + 1) & 0xFF
-    return ram_64KB[0x0100 + sp]
-
-def take_interrupt(pc, sr, vector, break_flag=False, pc_offset=0):
-    
-    addr_to_push = (pc + pc_offset) & 0xFFFF
-    push_byte((addr_to_push >> 8) & 0xFF)
-    push_byte(addr_to_push & 0xFF)
-
-    status_to_push = sr | 0x20
-    if break_flag:
-        status_to_push |= 0x10
-    else:
-        status_to_push &= ~0x10
-
-    push_byte(status_to_push)
-
-    # Set Interrupt Disable flag
-    sr |= 0x04
-
-    # Load vector
-    pc = ram_64KB[vector] | (ram_64KB[vector + 1] << 8)
-
-    return pc, sr
-
-def set_nmi(level):
-    global nmi_line, nmi_latched
-    if level and not nmi_line:  #rising edge
-        nmi_latched = True
-    nmi_line = level
-
-def check_interrupts(pc, sr):
-    global nmi_latched, irq
-    if nmi_latched:
-        
-        nmi_latched = False
-        pc, sr = take_interrupt(pc, sr, 0xFFFA)
-    elif irq and not (sr & 0x04):
-        
-        pc, sr, = take_interrupt(pc, sr, 0xFFFE)
-    return pc, sr
-
-#Initialize CPU
-
-a = 0
-irq = False
-
-nmi_line = False
-nmi_latched = False
-
-
-opcode = 0
-operand_lower = 0
-operand_higher = 0
-
-cycle_count = 0
-
-def perform_opcode(pc, opcode, operand_lower, operand_higher, ac, x, y, sr, sp, cycle_count):
-    halt = False
-
-
-#Legal Opcodes
-
-    if opcode == 0x69: #ADC Immediate
-
-        old_ac = ac
-
-        if sr & 0x01:
-            cin = 1
-        else:
-            cin = 0
-
-        
-        result = ac + operand_lower + cin
-
-        #Carry Flag (C)
-        if result > 0xFF:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-        ac = result & 0xFF
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        #Overflow Flag (V)
-        if (~(old_ac ^ operand_lower) & (old_ac ^ ac) & 0x80) != 0:
-            sr |= 0x40
-        else:
-            sr &= ~0x40
-
-        pc += 2
-        cycle_count += 2
-
-    elif opcode == 0x65: #ADC Zero Page
-
-        old_ac = ac
-
-        if sr & 0x01:
-            cin = 1
-        else:
-            cin = 0
-
-        value = ram_64KB[operand_lower]
-        result = ac + value + cin
-
-        #Carry Flag (C)
-        if result > 0xFF:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-        ac = result & 0xFF
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        #Overflow Flag (V)
-        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
-            sr |= 0x40
-        else:
-            sr &= ~0x40
-
-        pc += 2
-        cycle_count += 3
-    
-    elif opcode == 0x75: #ADC Zero Page, X
-
-        old_ac = ac
-
-        if sr & 0x01:
-            cin = 1
-        else:
-            cin = 0
-
-        addr = (operand_lower + x) & 0xFF
-        value = ram_64KB[addr]
-        result = ac + value + cin
-
-        #Carry Flag (C)
-        if result > 0xFF:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-        ac = result & 0xFF
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        #Overflow Flag (V)
-        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
-            sr |= 0x40
-        else:
-            sr &= ~0x40
-
-        pc += 2
-        cycle_count += 4
-
-    elif opcode == 0x6D: #ADC Absolute
-
-        old_ac = ac
-
-        if sr & 0x01:
-            cin = 1
-        else:
-            cin = 0
-
-        addr = (operand_higher << 8) | operand_lower
-        value = ram_64KB[addr]
-        result = ac + value + cin
-
-        #Carry Flag (C)
-        if result > 0xFF:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-        ac = result & 0xFF
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        #Overflow Flag (V)
-        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
-            sr |= 0x40
-        else:
-            sr &= ~0x40
-
-        pc += 3
-        cycle_count += 4
-
-    elif opcode == 0x7D: #ADC Absolute, X
-
-        old_ac = ac
-
-        if sr & 0x01:
-            cin = 1
-        else:
-            cin = 0
-
-        base = (operand_higher << 8) | operand_lower
-        addr = (base + x) & 0xFFFF
-        value = ram_64KB[addr]
-
-        result = ac + value + cin
-
-        #Carry Flag (C)
-        if result > 0xFF:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-        ac = result & 0xFF
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        #Overflow Flag (V)
-        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
-            sr |= 0x40
-        else:
-            sr &= ~0x40
-
-        pc += 3
-        cycle_count += 4
-
-    elif opcode == 0x79: #ADC Absolute, Y
-
-        old_ac = ac
-
-        if sr & 0x01:
-            cin = 1
-        else:
-            cin = 0
-
-        base = (operand_higher << 8) | operand_lower
-        addr = (base + y) & 0xFFFF
-        value = ram_64KB[addr]
-        
-        result = ac + value + cin
-
-        #Carry Flag (C)
-        if result > 0xFF:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-        ac = result & 0xFF
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        #Overflow Flag (V)
-        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
-            sr |= 0x40
-        else:
-            sr &= ~0x40
-
-        pc += 3
-        cycle_count += 4
-
-    elif opcode == 0x61: #ADC Indirect, X
-
-        old_ac = ac
-
-        if sr & 0x01:
-            cin = 1
-        else:
-            cin = 0
-
-        zp = (operand_lower + x) & 0xFF
-
-        low = ram_64KB[zp]
-        high = ram_64KB[(zp + 1) & 0xFF]
-
-        addr = (high << 8) | low
-        value = ram_64KB[addr]
-        
-        result = ac + value + cin
-
-        #Carry Flag (C)
-        if result > 0xFF:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-        ac = result & 0xFF
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        #Overflow Flag (V)
-        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
-            sr |= 0x40
-        else:
-            sr &= ~0x40
-
-        pc += 2
-        cycle_count += 6
-
-    elif opcode == 0x71: #ADC Indirect, Y
-
-        old_ac = ac
-
-        if sr & 0x01:
-            cin = 1
-        else:
-            cin = 0
-
-        zp = operand_lower
-
-        low = ram_64KB[zp]
-        high = ram_64KB[(zp + 1) & 0xFF]
-
-        base = (high << 8) | low
-        addr = (base + y) & 0xFFFF
-        value = ram_64KB[addr]
-        
-        result = ac + value + cin
-
-        #Carry Flag (C)
-        if result > 0xFF:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-        ac = result & 0xFF
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        #Overflow Flag (V)
-        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
-            sr |= 0x40
-        else:
-            sr &= ~0x40
-
-        pc += 2
-        cycle_count += 5
-
-
-
-    elif opcode == 0x29: #AND Immediate
-        
-        result = ac & operand_lower
-
-        sr = zero_flag(result, sr)
-        sr = negative_flag(result, sr)
-
-        ac = result
-
-        pc += 2
-        cycle_count += 2
-
-    elif opcode == 0x25: #AND Zero Page
-        
-        value = ram_64KB[operand_lower]
-        result = ac & value
-
-        sr = zero_flag(result, sr)
-        sr = negative_flag(result, sr)
-
-        ac = result
-
-        pc += 2
-        cycle_count += 3
-
-    elif opcode == 0x35: #AND Zero Page, X
-        
-        addr = (operand_lower + x) & 0xFF
-        value = ram_64KB[addr]
-        result = ac & value
-
-        sr = zero_flag(result, sr)
-        sr = negative_flag(result, sr)
-
-        ac = result
-
-        pc += 2
-        cycle_count += 4
-
-    elif opcode == 0x2D: #AND Absolute
-        
-        addr = (operand_higher << 8) | operand_lower
-        value = ram_64KB[addr]
-        result = ac & value
-
-        sr = zero_flag(result, sr)
-        sr = negative_flag(result, sr)
-
-        ac = result
-
-        pc += 3
-        cycle_count += 4
-
-    elif opcode == 0x3D: #AND Absolute, X
-        
-        base = (operand_higher << 8) | operand_lower
-        addr = (base + x) & 0xFFFF
-        value = ram_64KB[addr]
-        result = ac & value
-
-        sr = zero_flag(result, sr)
-        sr = negative_flag(result, sr)
-
-        ac = result
-
-        pc += 3
-        cycle_count += 4
-
-    elif opcode == 0x39: #AND Absolute, Y
-        
-        base = (operand_higher << 8) | operand_lower
-        addr = (base + y) & 0xFFFF
-        value = ram_64KB[addr]
-        result = ac & value
-
-        sr = zero_flag(result, sr)
-        sr = negative_flag(result, sr)
-
-        ac = result
-
-        pc += 3
-        cycle_count += 4
-
-    elif opcode == 0x21: #AND Indirect, X
-        
-        zp = (operand_lower + x) & 0xFF
-
-        low = ram_64KB[zp]
-        high = ram_64KB[(zp + 1) & 0xFF]
-
-        addr = (high << 8) | low
-        value = ram_64KB[addr]
-
-        result = ac & value
-
-        sr = zero_flag(result, sr)
-        sr = negative_flag(result, sr)
-
-        ac = result
-
-        pc += 2
-        cycle_count += 6
-
-    elif opcode == 0x31: #AND Indirect, Y
-        
-        zp = operand_lower
-
-        low = ram_64KB[zp]
-        high = ram_64KB[(zp + 1) & 0xFF]
-
-        base = (high << 8) | low
-        addr = (base + y) & 0xFFFF
-        value = ram_64KB[addr]
-        
-        result = ac & value
-
-        sr = zero_flag(result, sr)
-        sr = negative_flag(result, sr)
-
-        ac = result
-
-        pc += 2
-        cycle_count += 5
-
-
-
-    elif opcode == 0x0A: #ASL Accumulator
-        
-        #Carry Flag
-        if ac & 0x80:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        ac = (ac << 1) & 0xFF
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        pc += 1
-        cycle_count += 2
-
-    elif opcode == 0x06: #ASL Zero Page
-        
-        value = ram_64KB[operand_lower]
-
-        #Carry Flag
-        if value & 0x80:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        value = (value << 1) & 0xFF
-        ram_64KB[operand_lower] = value
-
-        sr = zero_flag(value, sr)
-
-        sr = negative_flag(value, sr)
-
-        pc += 2
-        cycle_count += 5
-
-    elif opcode == 0x16: #ASL Zero Page, X
-        
-        addr = (operand_lower + x) & 0xFF
-        value = ram_64KB[addr]
-
-        #Carry Flag
-        if value & 0x80:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        value = (value << 1) & 0xFF
-        ram_64KB[addr] = value
-
-        sr = zero_flag(value, sr)
-
-        sr = negative_flag(value, sr)
-
-        pc += 2
-        cycle_count += 6
-
-    elif opcode == 0x0E: #ASL Absolute
-        
-        addr = (operand_higher << 8) | operand_lower
-        value = ram_64KB[addr]
-
-        #Carry Flag
-        if value & 0x80:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        value = (value << 1) & 0xFF
-        ram_64KB[addr] = value
-
-        sr = zero_flag(value, sr)
-
-        sr = negative_flag(value, sr)
-
-        pc += 3
-        cycle_count += 6
-
-    elif opcode == 0x1E: #ASL Absolute, X
-        
-        base = (operand_higher << 8) | operand_lower
-        addr = (base + x) & 0xFFFF
-        value = ram_64KB[addr]
-
-        #Carry Flag
-        if value & 0x80:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        value = (value << 1) & 0xFF
-
-        sr = zero_flag(value, sr)
-
-        sr = negative_flag(value, sr)
-
-        pc += 3
-        cycle_count += 7
-
-
-
-    elif opcode == 0x24: #BIT Zero Page
-        addr = operand_lower
-        value = ram_64KB[addr]
-
-        sr = zero_flag(ac & value, sr)
-
-        sr = (sr & ~0xC0) | (value & 0xC0)
-
-
-        
-        pc += 2
-        cycle_count += 3
-
-    elif opcode == 0x2C: #BIT Absolute
-        addr = (operand_higher << 8) | operand_lower
-        value = ram_64KB[addr]
-
-        sr = zero_flag(ac & value, sr)
-
-        sr = (sr & ~0xC0) | (value & 0xC0)
-
-        
-
-        pc += 3
-        cycle_count += 4
-
-
-
-#Branch Instructions
-
-    elif opcode == 0x10: #BPL (Branch on Plus)
-        offset = operand_lower
-        if offset & 0x80:
-            offset -= 0x100
-
-        if not (sr & 0x80):
-            pc = (pc + 2 + offset) & 0xFFFF
-            cycle_count += 3
-        else:
-            pc += 2
-            cycle_count += 2
-
-    elif opcode == 0x30: #BMI (Branch on Minus)
-        offset = operand_lower
-        if offset & 0x80:
-            offset -= 0x100
-
-        if sr & 0x80:
-            pc = (pc + 2 + offset) & 0xFFFF
-            cycle_count += 3
-        else:
-            pc += 2
-            cycle_count += 2
-        
-    elif opcode == 0x50: #BVC (Branch on Overflow Clear)
-        offset = operand_lower
-        if offset & 0x80:
-            offset -= 0x100
-
-        if not (sr & 0x40):
-            pc = (pc + 2 + offset) & 0xFFFF
-            cycle_count += 3
-        else:
-            pc += 2
-            cycle_count += 2
-
-    elif opcode == 0x70: #BVS (Branch on Overflow Set)
-        offset = operand_lower
-        if offset & 0x80:
-            offset -= 0x100
-
-        if sr & 0x40:
-            pc = (pc + 2 + offset) & 0xFFFF
-            cycle_count += 3
-        else:
-            pc += 2
-            cycle_count += 2
-
-    elif opcode == 0x90: #BCC (Branch on Carry Clear)
-        offset = operand_lower
-        if offset & 0x80:
-            offset -= 0x100
-
-        if not (sr & 0x01):
-            pc = (pc + 2 + offset) & 0xFFFF
-            cycle_count += 3
-        else:
-            pc += 2
-            cycle_count += 2
-
-    elif opcode == 0xB0: #BCS (Branch on Carry Set)
-        offset = operand_lower
-        if offset & 0x80:
-            offset -= 0x100
-
-        if sr & 0x01:
-            pc = (pc + 2 + offset) & 0xFFFF
-            cycle_count += 3
-        else:
-            pc += 2
-            cycle_count += 2
-
-    elif opcode == 0xD0:  #BNE (Branch Not Equal)
-        offset = ram_64KB[(pc + 1) & 0xFFFF]  # next byte after opcode
-        if offset & 0x80:
-            offset -= 0x100  # signed
-        if not (sr & 0x02):  # Zero flag clear
-            pc = (pc + 2 + offset) & 0xFFFF
-            cycle_count += 3
-        else:
-            pc += 2
-            cycle_count += 2
-        
-    elif opcode == 0xF0: #BEQ (Branch on Equal)
-        offset = operand_lower
-        if offset & 0x80:
-            offset -= 0x100
-
-        if sr & 0x02:
-            pc = (pc + 2 + offset) & 0xFFFF
-            cycle_count += 3
-        else:
-            pc += 2
-            cycle_count += 2
-
-
-
-    elif opcode == 0x00: #BRK Implied
-        # Increment PC first
-        
-        # Then push PC & flags, then vector
-        pc, sr = take_interrupt(pc, sr, vector=0xFFFE, break_flag=True, pc_offset=2)
-
-        cycle_count += 7
-
-        halt = True
-        print("BREAK OCCURED")
-
-
-
-    elif opcode == 0xC9: #CMP Immediate
-
-        value = operand_lower & 0xFF
-        ac8 = ac & 0xFF        # ensure 8-bit value
-
-        temp = (ac8 - value) & 0xFF
-
-        # Carry flag (set if A >= M)
-        if ac8 >= value:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        # Zero
-        if temp == 0:
-            sr |= 0x02     # Zero flag is bit 1
-        else:
-            sr &= ~0x02
-
-        # Negative
-        if temp & 0x80:
-            sr |= 0x80     # Negative flag is bit 7
-        else:
-            sr &= ~0x80
-
-        pc += 2
-        cycle_count += 2
-
-    elif opcode == 0xC5: #CMP Zero Page
-
-        value = ram_64KB[operand_lower]
-        temp = (ac - value) & 0xFF
-
-        # Carry
-        if ac >= value:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        # Zero
-        if temp == 0:
-            sr |= 0x02     # Zero flag is bit 1
-        else:
-            sr &= ~0x02
-
-        # Negative
-        if temp & 0x80:
-            sr |= 0x80     # Negative flag is bit 7
-        else:
-            sr &= ~0x80
-
-        pc += 2
-        cycle_count += 3
-
-    elif opcode == 0xD5: #CMP Zero Page, X
-
-        addr = (operand_lower + x) & 0xFF
-        value = ram_64KB[addr]
-        temp = (ac - value) & 0xFF
-
-        # Carry
-        if ac >= value:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        # Zero
-        if temp == 0:
-            sr |= 0x02     # Zero flag is bit 1
-        else:
-            sr &= ~0x02
-
-        # Negative
-        if temp & 0x80:
-            sr |= 0x80     # Negative flag is bit 7
-        else:
-            sr &= ~0x80
-
-        pc += 2
-        cycle_count += 4
-
-    elif opcode == 0xCD: #CMP Absolute
-
-        addr = (operand_higher << 8) | operand_lower
-        value = ram_64KB[addr]
-        temp = (ac - value) & 0xFF
-
-                # Carry
-        if ac >= value:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        # Zero
-        if temp == 0:
-            sr |= 0x02     # Zero flag is bit 1
-        else:
-            sr &= ~0x02
-
-        # Negative
-        if temp & 0x80:
-            sr |= 0x80     # Negative flag is bit 7
-        else:
-            sr &= ~0x80
-        pc += 3
-        cycle_count += 4
-
-    elif opcode == 0xDD: #CMP Absolute, X
-
-        base = (operand_higher << 8) | operand_lower
-        addr = (base + x) & 0xFFFF
-        value = ram_64KB[addr]
-        temp = (ac - value) & 0xFF
-
-        # Carry
-        if ac >= value:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        # Zero
-        if temp == 0:
-            sr |= 0x02     # Zero flag is bit 1
-        else:
-            sr &= ~0x02
-
-        # Negative
-        if temp & 0x80:
-            sr |= 0x80     # Negative flag is bit 7
-        else:
-            sr &= ~0x80
-
-        pc += 3
-        cycle_count += 4
-
-    elif opcode == 0xD9: #CMP Absolute, Y
-
-        base = (operand_higher << 8) | operand_lower
-        addr = (base + y) & 0xFFFF
-        value = ram_64KB[addr]
-        temp = (ac - value) & 0xFF
-
-        # Carry
-        if ac >= value:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        # Zero
-        if temp == 0:
-            sr |= 0x02     # Zero flag is bit 1
-        else:
-            sr &= ~0x02
-
-        # Negative
-        if temp & 0x80:
-            sr |= 0x80     # Negative flag is bit 7
-        else:
-            sr &= ~0x80
-
-        pc += 3
-        cycle_count += 4
-
-    elif opcode == 0xC1: #CMP Indriect, X
-
-        zp = (operand_lower + x) & 0xFF
-
-        low = ram_64KB[zp]
-        high = ram_64KB[(zp + 1) & 0xFF]
-
-        addr = (high << 8) | low
-        value = ram_64KB[addr]
-        temp = (ac - value) & 0xFF
-
-        # Carry
-        if ac >= value:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        # Zero
-        if temp == 0:
-            sr |= 0x02     # Zero flag is bit 1
-        else:
-            sr &= ~0x02
-
-        # Negative
-        if temp & 0x80:
-            sr |= 0x80     # Negative flag is bit 7
-        else:
-            sr &= ~0x80
-
-        pc += 2
-        cycle_count += 6
-
-    elif opcode == 0xD1: #CMP Indriect, Y
-
-        zp = operand_lower
-
-        low = ram_64KB[zp]
-        high = ram_64KB[(zp + 1) & 0xFF]
-
-        base = (high << 8) | low
-        addr = (base + y) & 0xFFFF
-        value = ram_64KB[addr]
-        temp = (ac - value) & 0xFF
-
-        # Carry
-        if ac >= value:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        # Zero
-        if temp == 0:
-            sr |= 0x02     # Zero flag is bit 1
-        else:
-            sr &= ~0x02
-
-        # Negative
-        if temp & 0x80:
-            sr |= 0x80     # Negative flag is bit 7
-        else:
-            sr &= ~0x80
-
-        pc += 2
-        cycle_count += 5
-
-
-
-    elif opcode == 0xE0: #CPX Immediate
-
-        # Carry: set if X >= value
-        if x >= operand_lower:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        value = (x - operand_lower) & 0xFF
-
-        sr = zero_flag(value, sr)
-
-        sr = negative_flag(value, sr)
-
-        pc += 2
-        cycle_count += 2
-
-    elif opcode == 0xE4: #CPX Zero Page
-
-        # Carry: set if X >= value
-
-        addr = ram_64KB[operand_lower]
-
-        if x >= addr:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-        
-        value = (x - addr) & 0xFF
-
-        sr = zero_flag(value, sr)
-
-        sr = negative_flag(value, sr)
-
-        pc += 2
-        cycle_count += 3
-
-    elif opcode == 0xEC: #CPX Absolite
-
-        # Carry: set if X >= value
-
-        addr = (operand_higher << 8) | operand_lower
-        value = ram_64KB[addr]
-
-        if x >= value:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-        
-        result = (x - addr) & 0xFF
-
-        sr = zero_flag(result, sr)
-
-        sr = negative_flag(result, sr)
-
-        pc += 3
-        cycle_count += 4
-
-
-
-    elif opcode == 0xC0: #CPY Immediate
-
-        # Carry: set if Y >= value
-        if y >= operand_lower:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        value = (y - operand_lower) & 0xFF
-
-        sr = zero_flag(value, sr)
-
-        sr = negative_flag(value, sr)
-
-        pc += 2
-        cycle_count += 2
-
-    elif opcode == 0xC4: #CPY Zero Page
-
-        # Carry: set if Y >= value
-
-        addr = ram_64KB[operand_lower]
-
-        if y >= addr:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-        
-        value = (y - addr) & 0xFF
-
-        sr = zero_flag(value, sr)
-
-        sr = negative_flag(value, sr)
-
-        pc += 2
-        cycle_count += 3
-
-    elif opcode == 0xCC: #CPY Absolite
-
-        # Carry: set if Y >= value
-
-        addr = (operand_higher << 8) | operand_lower
-        value = ram_64KB[addr]
-
-        if y >= value:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-        
-        result = (y - addr) & 0xFF
-
-        sr = zero_flag(result, sr)
-
-        sr = negative_flag(result, sr)
-
-        pc += 3
-        cycle_count += 4
-
-
-
-    elif opcode == 0xC6: #DEC Zero Page
-        addr = operand_lower
-        value = (ram_64KB[addr] - 1) & 0xFF
-        ram_64KB[addr] = value
-
-        sr = zero_flag(value, sr)
-
-        sr = negative_flag(value, sr)
-
-        pc += 2
-        cycle_count += 5
-
-    elif opcode == 0xD6: #DEC Zero Page, X
-        addr = (operand_lower + x) & 0xFF
-        value = (ram_64KB[addr] - 1) & 0xFF
-        ram_64KB[addr] = value
-        
-        sr = zero_flag(value, sr)
-
-        sr = negative_flag(value, sr)
-
-        pc += 2
-        cycle_count += 6
-
-    elif opcode == 0xCE: #DEC Absolute
-        addr = (operand_higher << 8) | operand_lower
-        value = (ram_64KB[addr] - 1) & 0xFF
-        ram_64KB[addr] = value
-
-        sr = zero_flag(value, sr)
-
-        sr = negative_flag(value, sr)
-
-        pc += 3
-        cycle_count += 6
-
-    elif opcode == 0xDE: #DEC Absolute, X
-        addr = ((operand_higher << 8) | operand_lower) + x
-        addr &= 0xFFFF
-
-        value = (ram_64KB[addr] - 1) & 0xFF
-        ram_64KB[addr] = value
-
-        sr = zero_flag(value, sr)
-
-        sr = negative_flag(value, sr)
-
-        pc += 3
-        cycle_count += 7
-
-
-
-    elif opcode == 0x49: #EOR Immediate
-
-        ac = (ac ^ operand_lower) & 0xFF
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        pc += 2
-        cycle_count += 2
-
-    elif opcode == 0x45: #EOR Zero Page
-
-        addr = operand_lower
-        value = ram_64KB[addr]
-        ac = (ac ^ value) & 0xFF
-
-        sr = zero_flag(ac, sr)
-        
-        sr = negative_flag(ac, sr)
-
-        pc += 2
-        cycle_count += 3
-
-    elif opcode == 0x55: #EOR Zero Page, X
-
-        addr = (operand_lower + x) & 0xFF
-        value = ram_64KB[addr]
-        ac = (ac ^ value) & 0xFF
-
-        sr = zero_flag(ac, sr)
-        
-        sr = negative_flag(ac, sr)
-
-        pc += 2
-        cycle_count += 4
-
-    elif opcode == 0x4D: #EOR Absolute
-
-        addr = (operand_higher << 8) | operand_lower
-        value = ram_64KB[addr]
-        ac = (ac ^ value) & 0xFF
-
-        sr = zero_flag(ac, sr)
-        
-        sr = negative_flag(ac, sr)
-
-        pc += 3
-        cycle_count += 4
-
-    elif opcode == 0x5D: #EOR Absolute, X
-
-        addr = ((operand_higher << 8) | operand_lower) + x
-        addr &= 0xFFFF
-
-        value = ram_64KB[addr]
-        ac = (ac ^ value) & 0xFF
-
-        sr = zero_flag(ac, sr)
-        
-        sr = negative_flag(ac, sr)
-
-        pc += 3
-        cycle_count += 4
-
-    elif opcode == 0x59: #EOR Absolute, Y
-
-        addr = ((operand_higher << 8) | operand_lower) + y
-        addr &= 0xFFFF
-
-        value = ram_64KB[addr]
-        ac = (ac ^ value) & 0xFF
-
-        sr = zero_flag(ac, sr)
-        
-        sr = negative_flag(ac, sr)
-
-        pc += 3
-        cycle_count += 4
-
-    elif opcode == 0x41: #EOR Indirect, X
-
-        zp = (operand_lower + x) & 0xFF
-
-        low = ram_64KB[zp]
-        high = ram_64KB[(zp + 1) & 0xFF]
-
-        addr = (high << 8) | low
-        value = ram_64KB[addr]
-        ac = (ac ^ value) & 0xFF
-
-        sr = zero_flag(ac, sr)
-        
-        sr = negative_flag(ac, sr)
-
-        pc += 3
-        cycle_count += 6
-
-    elif opcode == 0x51: #EOR Indirect, Y
-
-        zp = (operand_lower + y) & 0xFF
-
-        low = ram_64KB[zp]
-        high = ram_64KB[(zp + 1) & 0xFF]
-
-        addr = (high << 8) | low
-        value = ram_64KB[addr]
-        ac = (ac ^ value) & 0xFF
-
-        sr = zero_flag(ac, sr)
-        
-        sr = negative_flag(ac, sr)
-
-        pc += 3
-        cycle_count += 5
-
-
-
-#Flag (Processor Status) Instructions
-
-    elif opcode == 0x18: #CLC (Clear Carry)
-        sr &= ~0x01
-        pc += 1
-        cycle_count += 2
-
-    elif opcode == 0x38: #SEC (Set Carry)
-        sr |= 0x01
-        pc += 1
-        cycle_count += 2
-
-    elif opcode == 0x58: #CLI (Clear Interrupt)
-        sr &= ~0x04
-        pc += 1
-        cycle_count += 2
-
-    elif opcode == 0x78: #SEI (Set Interrupt)
-        sr |= 0x04
-        pc += 1
-        cycle_count += 2
-
-    elif opcode == 0xB8: #CLV (Clear Overflow)
-        sr &= ~0x40
-        pc += 1
-        cycle_count += 2
-
-    elif opcode == 0xD8: #CLD (Clear Decimal)
-        sr &= ~0x08
-        pc += 1
-        cycle_count += 2
-
-    elif opcode == 0xF8: #SED (Set Decimal)
-        sr |= 0x08
-        pc += 1
-        cycle_count += 2
-    
-
-
-    elif opcode == 0xE6: #INC Zero Page
-        addr = operand_lower
-        value = (ram_64KB[addr] + 1) & 0xFF
-        ram_64KB[addr] = value
-
-        sr = zero_flag(value, sr)
-
-        sr = negative_flag(value, sr)
-
-        pc += 2
-        cycle_count += 5
-
-    elif opcode == 0xF6: #INC Zero Page, X
-        addr = (operand_lower + x) & 0xFF
-        value = (ram_64KB[addr] + 1) & 0xFF
-        ram_64KB[addr] = value
-        
-        sr = zero_flag(value, sr)
-
-        sr = negative_flag(value, sr)
-
-        pc += 2
-        cycle_count += 6
-
-    elif opcode == 0xEE: #INC Absolute
-        addr = (operand_higher << 8) | operand_lower
-        value = (ram_64KB[addr] + 1) & 0xFF
-        ram_64KB[addr] = value
-
-        sr = zero_flag(value, sr)
-
-        sr = negative_flag(value, sr)
-
-        pc += 3
-        cycle_count += 6
-
-    elif opcode == 0xFE: #INC Absolute, X
-        addr = ((operand_higher << 8) | operand_lower) + x
-        addr &= 0xFFFF
-
-        value = (ram_64KB[addr] + 1) & 0xFF
-        ram_64KB[addr] = value
-
-        sr = zero_flag(value, sr)
-
-        sr = negative_flag(value, sr)
-
-        pc += 3
-        cycle_count += 7
-
-
-
-    elif opcode == 0x4C: #JMP Absolute
-        pc = (operand_higher << 8) | operand_lower
-        cycle_count += 3
-    
-    elif opcode == 0x6C: #JMP Indirect
-        ptr = (operand_higher << 8) | operand_lower
-
-        low = ram_64KB[ptr]
-
-        # 6502 hardware bug emulation
-        if (ptr & 0x00FF) == 0x00FF:
-            high = ram_64KB[ptr & 0xFF00]
-        else:
-            high = ram_64KB[ptr + 1]
-
-        pc = (high << 8) | low
-        cycle_count += 5
-
-
-
-    elif opcode == 0x20: #JSR Absolute
-        target = (operand_higher << 8) | operand_lower
-        return_addr = pc + 2
-
-        ram_64KB[0x0100 + sp] = (return_addr >> 8) & 0xFF
-        sp = (sp - 1) & 0xFF
-
-        ram_64KB[0x0100 + sp] = return_addr & 0xFF
-        sp = (sp - 1) & 0xFF
-
-        pc = target
-        cycle_count += 6
-
-
-
-    elif opcode == 0xA9: #LDA Immediate
-        ac = operand_lower
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        pc += 2
-        cycle_count += 2
-
-    elif opcode == 0xA5: #LDA Zero Page
-        ac = ram_64KB[operand_lower]
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        pc += 2
-        cycle_count += 3
-
-    elif opcode == 0xB5: #LDA Zero Page, X
-
-        addr = (operand_lower + x) & 0xFF
-        ac = ram_64KB[addr]
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        pc += 2
-        cycle_count += 4
-
-    elif opcode == 0xAD: #LDA Absolute
-
-        addr = (operand_higher << 8) | operand_lower
-        ac = ram_64KB[addr]
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        pc += 3
-        cycle_count += 4
-    
-    elif opcode == 0xBD: #LDA Absolute, X
-
-        base = (operand_higher << 8) | operand_lower
-        addr = (base + x) & 0xFFFF
-
-        ac = ram_64KB[addr]
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        pc += 3
-        cycle_count += 4
-
-    elif opcode == 0xB9: #LDA Absolute, Y
-
-        base = (operand_higher << 8) | operand_lower
-        addr = (base + y) & 0xFFFF
-
-        ac = ram_64KB[addr]
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        pc += 3
-        cycle_count += 4
-
-    elif opcode == 0xA1: #LDA Indirect, X
-
-        zp_addr = (operand_lower + x) & 0xFF
-
-        low_byte = ram_64KB[zp_addr]
-        high_byte = ram_64KB[(zp_addr + 1) & 0xFF]
-
-        base_addr = (high_byte << 8) | low_byte
-
-        ac = ram_64KB[base_addr]
-
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        pc += 2
-        cycle_count += 6
-
-    elif opcode == 0xB1: #LDA Indirect, Y
-
-        zp_addr = operand_lower
-
-        low_byte = ram_64KB[zp_addr]
-        high_byte = ram_64KB[(zp_addr + 1) & 0xFF]
-
-        base_addr = (high_byte << 8) | low_byte
-        addr = (base_addr + y) & 0xFFFF
-
-        ac = ram_64KB[addr]
-
-        sr = zero_flag(ac, sr)
-        sr = negative_flag(ac, sr)
-
-        pc += 2
-        cycle_count += 5
-
-
-
-    elif opcode == 0xA2: #LDX Immediate
-        x = operand_lower
-
-        sr = zero_flag(x, sr)
-
-        sr = negative_flag(x, sr)
-
-        pc += 2
-        cycle_count += 2
-
-    elif opcode == 0xA6: #LDX Zero Page
-        x = ram_64KB[operand_lower]
-
-        sr = zero_flag(x, sr)
-
-        sr = negative_flag(x, sr)
-
-        pc += 2
-        cycle_count += 3
-
-    elif opcode == 0xB6: #LDX Zero Page, Y
-        addr = (operand_lower + y) & 0xFF
-        x = ram_64KB[addr]
-
-        sr = zero_flag(x, sr)
-
-        sr = negative_flag(x, sr)
-
-        pc += 2
-        cycle_count += 4
-
-    elif opcode == 0xAE: #LDX Absolute
-        addr = (operand_higher << 8) | operand_lower
-        x = ram_64KB[addr]
-
-        sr = zero_flag(x, sr)
-
-        sr = negative_flag(x, sr)
-
-        pc += 3
-        cycle_count += 4
-
-    elif opcode == 0xBE: #LDX Absolute, Y
-        base = (operand_higher << 8) | operand_lower
-        addr = (base + y) & 0xFFFF
-        x = ram_64KB[addr]
-
-        sr = zero_flag(x, sr)
-
-        sr = negative_flag(x, sr)
-
-        pc += 3
-        cycle_count += 4
-
-
-
-    elif opcode == 0xA0: #LDY Immediate
-        y = operand_lower
-
-        sr = zero_flag(y, sr)
-
-        sr = negative_flag(y, sr)
-
-        pc += 2
-        cycle_count += 2
-
-    elif opcode == 0xA4: #LDY Zero Page
-        y = ram_64KB[operand_lower]
-
-        sr = zero_flag(y, sr)
-
-        sr = negative_flag(y, sr)
-
-        pc += 2
-        cycle_count += 3
-
-    elif opcode == 0xB4: #LDY Zero Page, X
-        addr = (operand_lower + x) & 0xFF
-        y = ram_64KB[addr]
-
-        sr = zero_flag(y, sr)
-
-        sr = negative_flag(y, sr)
-
-        pc += 2
-        cycle_count += 4
-
-    elif opcode == 0xAC: #LDY Absolute
-        addr = (operand_higher << 8) | operand_lower
-        y = ram_64KB[addr]
-
-        sr = zero_flag(y, sr)
-
-        sr = negative_flag(y, sr)
-
-        pc += 3
-        cycle_count += 4
-
-    elif opcode == 0xBC: #LDY Absolute, X
-        base = (operand_higher << 8) | operand_lower
-        addr = (base + x) & 0xFFFF
-        y = ram_64KB[addr]
-
-        sr = zero_flag(y, sr)
-
-        sr = negative_flag(y, sr)
-
-        pc += 3
-        cycle_count += 4
-
-
-
-    elif opcode == 0x4A: #LSR Accumulator
-        #Carry Flag (C)
-        if ac & 0x01:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        ac = (ac >> 1) & 0xFF
-
-        sr = zero_flag(ac, sr)
-        sr &= ~0x80
-        
-        pc += 1
-        cycle_count += 2
-
-    elif opcode == 0x46: #LSR Zero Page
-
-        value = ram_64KB[operand_lower]
-
-        #Carry Flag (C)
-        if value & 0x01:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        value = (value >> 1) & 0xFF
-        ram_64KB[value] = value
-
-        sr = zero_flag(ac, sr)
-        sr &= ~0x80
-        
-        pc += 2
-        cycle_count += 5
-
-    elif opcode == 0x56: #LSR Zero Page, X
-
-        value = (operand_lower + x) & 0xFF
-
-        #Carry Flag (C)
-        if value & 0x01:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        value = (value >> 1) & 0xFF
-        ram_64KB[addr] = value
-
-        sr = zero_flag(ac, sr)
-        sr &= ~0x80
-        
-        pc += 2
-        cycle_count += 6
-
-    elif opcode == 0x4E: #LSR Absolute
-
-        addr = (operand_higher << 8) | operand_lower
-        value = ram_64KB[addr]
-
-        # Carry Flag (C)
-        if value & 0x01:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        value = (value >> 1) & 0xFF
-        ram_64KB[addr] = value
-
-        sr = zero_flag(value, sr)
-        sr = negative_flag(value, sr)  # LSR always clears N flag, optional to keep
-        sr &= ~0x80
-
-        pc += 3
-        cycle_count += 6
-
-    elif opcode == 0x5E: #LSR Absolute, X
-
-        base = (operand_higher << 8) | operand_lower
-        value = (base + x) & 0xFFFF
-
-        #Carry Flag (C)
-        if value & 0x01:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        value = (value >> 1) & 0xFF
-        ram_64KB[value]
-
-        sr = zero_flag(ac, sr)
-        sr &= ~0x80
-        
-        pc += 3
-        cycle_count += 7
-
-
-
-    elif opcode == 0xEA: #NOP Implied
-        pc += 1
-        cycle_count += 2
-
-
-
-    elif opcode == 0x09: #ORA Immediate
-
-        ac = (ac | operand_lower) & 0xFF
-
-        sr = zero_flag(ac, sr)
-        sr = negative_flag(ac, sr)
-
-        pc += 2
-        cycle_count += 2
-
-    elif opcode == 0x05: #ORA Zero Page
-        
-        value = ram_64KB[operand_lower]
-        ac = (ac | value) & 0xFF
-
-        sr = zero_flag(ac, sr)
-        sr = negative_flag(ac, sr)
-
-        pc += 2
-        cycle_count += 3
-
-    elif opcode == 0x15: #ORA Zero Page, X
-        
-        addr = (operand_lower + x) & 0xFF
-        value = ram_64KB[addr]
-        ac = (ac | value) & 0xFF
-
-        sr = zero_flag(ac, sr)
-        sr = negative_flag(ac, sr)
-
-        pc += 2
-        cycle_count += 4
-
-    elif opcode == 0x0D: #ORA Absolute
-        
-        addr = (operand_higher << 8) | operand_lower
-        value = ram_64KB[addr]
-        ac = (ac | value) & 0xFF
-
-        sr = zero_flag(ac, sr)
-        sr = negative_flag(ac, sr)
-
-        pc += 3
-        cycle_count += 4
-
-    elif opcode == 0x1D: #ORA Absolute, X
-        
-        base = (operand_higher << 8) | operand_lower
-        addr = (base + x) & 0xFFFF
-        value = ram_64KB[addr]
-        ac = (ac | value) & 0xFF
-
-        sr = zero_flag(ac, sr)
-        sr = negative_flag(ac, sr)
-
-        pc += 3
-        cycle_count += 4
-
-    elif opcode == 0x19: #ORA Absolute, Y
-        
-        base = (operand_higher << 8) | operand_lower
-        addr = (base + y) & 0xFFFF
-        value = ram_64KB[addr]
-        ac = (ac | value) & 0xFF
-
-        sr = zero_flag(ac, sr)
-        sr = negative_flag(ac, sr)
-
-        pc += 3
-        cycle_count += 4
-
-    elif opcode == 0x01: #ORA Indirect, X
-        
-        zp = (operand_lower + x) & 0xFF
-
-        low = ram_64KB[zp]
-        high = ram_64KB[(zp + 1) & 0xFF]
-
-        addr = (high << 8) | low
-        value = ram_64KB[addr]
-        ac = (ac | value) & 0xFF
-
-        sr = zero_flag(ac, sr)
-        sr = negative_flag(ac, sr)
-
-        pc += 2
-        cycle_count += 6
-
-    elif opcode == 0x11: #ORA Indirect, Y
-        
-        zp = operand_lower
-
-        low = ram_64KB[zp]
-        high = ram_64KB[(zp + 1) & 0xFF]
-
-        base = (high << 8) | low
-        addr = (base + y) & 0xFFFF
-        value = ram_64KB[addr]
-        ac = (ac | value) & 0xFF
-
-        sr = zero_flag(ac, sr)
-        sr = negative_flag(ac, sr)
-
-        pc += 2
-        cycle_count += 5
-
-
-
-#Register Instructions
-
-    elif opcode == 0xAA: #TAX (Transfer A to X)
-        x = ac
-
-        sr = zero_flag(x, sr)
-        sr = negative_flag(x, sr)
-
-        pc += 1
-        cycle_count += 2
-
-    elif opcode == 0x8A: #TXA (Transfer X to A)
-        ac = x
-
-        sr = zero_flag(ac, sr)
-        sr = negative_flag(ac, sr)
-
-        pc += 1
-        cycle_count += 2
-    
-    elif opcode == 0xCA: #DEX (Decrement X)
-        x = (x - 1) & 0xFF
-
-        sr = zero_flag(x, sr)
-        sr = negative_flag(x, sr)
-
-        pc += 1
-        cycle_count += 2
-
-    elif opcode == 0xE8: #INX (Increment X)
-        x = (x + 1) & 0xFF
-
-        sr = zero_flag(x, sr)
-        sr = negative_flag(x, sr)
-
-        pc += 1
-        cycle_count += 2
-
-    elif opcode == 0xA8: #TAY (Transfer A to Y)
-        y = ac
-
-        sr = zero_flag(y, sr)
-        sr = negative_flag(y, sr)
-
-        pc += 1
-        cycle_count += 2
-
-    elif opcode == 0x98: #TYA (Transfer Y to A)
-        ac = y
-
-        sr = zero_flag(ac, sr)
-        sr = negative_flag(ac, sr)
-
-        pc += 1
-        cycle_count += 2
-
-    elif opcode == 0x88: #DEY (Decrement Y)
-        y = (y - 1) & 0xFF
-
-        sr = zero_flag(y, sr)
-        sr = negative_flag(y, sr)
-
-        pc += 1
-        cycle_count += 2
-
-    elif opcode == 0xC8: #INY (Increment Y)
-        y = (y + 1) & 0xFF
-
-        sr = zero_flag(y, sr)
-        sr = negative_flag(y, sr)
-
-        pc += 1
-        cycle_count += 2
-
-
-
-    elif opcode == 0x2A: #ROL Accumulator
-        old_c = sr & 0x01
-
-        # New carry from bit 7
-        if ac & 0x80:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        ac = ((ac << 1) | old_c) & 0xFF
-
-        sr = zero_flag(ac, sr)
-        sr = negative_flag(ac, sr)
-
-        pc += 1
-        cycle_count += 2
-
-    elif opcode == 0x26: #ROL Zero Page
-
-        addr = operand_lower
-        value = ram_64KB[addr]
-
-
-        old_c = sr & 0x01
-
-        # New carry from bit 7
-        if value & 0x80:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        value = ((value << 1) | old_c) & 0xFF
-
-        ram_64KB[addr] = value
-
-        sr = zero_flag(value, sr)
-        sr = negative_flag(value, sr)
-
-        pc += 2
-        cycle_count += 5
-
-    elif opcode == 0x36: #ROL Zero Page, X
-
-        addr = (operand_lower + x) & 0xFF
-        value = ram_64KB[addr]
-
-
-        old_c = sr & 0x01
-
-        # New carry from bit 7
-        if value & 0x80:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        value = ((value << 1) | old_c) & 0xFF
-
-        ram_64KB[addr] = value
-
-        sr = zero_flag(value, sr)
-        sr = negative_flag(value, sr)
-
-        pc += 2
-        cycle_count += 6
-
-    elif opcode == 0x2E: #ROL Absolute
-
-        addr = (operand_higher << 8) | operand_lower
-        value = ram_64KB[addr]
-
-
-        old_c = sr & 0x01
-
-        # New carry from bit 7
-        if value & 0x80:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        value = ((value << 1) | old_c) & 0xFF
-
-        ram_64KB[addr] = value
-
-        sr = zero_flag(value, sr)
-        sr = negative_flag(value, sr)
-
-        pc += 3
-        cycle_count += 6
-
-    elif opcode == 0x3E: #ROL Absolute, X
-
-        base = (operand_higher << 8) | operand_lower
-        addr = (base + x) & 0xFFFF
-        value = ram_64KB[addr]
-
-
-        old_c = sr & 0x01
-
-        # New carry from bit 7
-        if value & 0x80:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        value = ((value << 1) | old_c) & 0xFF
-
-        ram_64KB[addr] = value
-
-        sr = zero_flag(value, sr)
-        sr = negative_flag(value, sr)
-
-        pc += 3
-        cycle_count += 7
-
-
-
-    elif opcode == 0x6A: #ROR Accumulator
-        old_c = sr & 0x01
-
-        # New carry from bit 0
-        if ac & 0x01:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        ac = ((ac >> 1) | (old_c << 7)) & 0xFF
-
-        sr = zero_flag(ac, sr)
-        sr = negative_flag(ac, sr)
-
-        pc += 1
-        cycle_count += 2
-
-    elif opcode == 0x66: #ROR Zero Page
-
-        addr = operand_lower
-        value = ram_64KB[addr]
-
-
-        old_c = sr & 0x01
-
-        # New carry from bit 0
-        if value & 0x01:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        value = ((value >> 1) | (old_c << 7)) & 0xFF
-
-        ram_64KB[addr] = value
-
-        sr = zero_flag(value, sr)
-        sr = negative_flag(value, sr)
-
-        pc += 2
-        cycle_count += 5
-
-    elif opcode == 0x76: #ROR Zero Page, X
-
-        addr = (operand_lower + x) & 0xFF
-        value = ram_64KB[addr]
-
-
-        old_c = sr & 0x01
-
-        # New carry from bit 0
-        if value & 0x01:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        value = ((value >> 1) | (old_c << 7)) & 0xFF
-
-        ram_64KB[addr] = value
-
-        sr = zero_flag(value, sr)
-        sr = negative_flag(value, sr)
-
-        pc += 2
-        cycle_count += 6
-
-    elif opcode == 0x6E: #ROR Absolute
-
-        addr = (operand_higher << 8) | operand_lower
-        value = ram_64KB[addr]
-
-
-        old_c = sr & 0x01
-
-        # New carry from bit 0
-        if value & 0x01:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        value = ((value >> 1) | (old_c << 7)) & 0xFF
-
-        ram_64KB[addr] = value
-
-        sr = zero_flag(value, sr)
-        sr = negative_flag(value, sr)
-
-        pc += 3
-        cycle_count += 6
-
-    elif opcode == 0x7E: #ROR Absolute, X
-
-        base = (operand_higher << 8) | operand_lower
-        addr = (base + x) & 0xFFFF
-        value = ram_64KB[addr]
-
-
-        old_c = sr & 0x01
-
-        # New carry from bit 0
-        if value & 0x01:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-
-        value = ((value >> 1) | (old_c << 7)) & 0xFF
-
-        ram_64KB[addr] = value
-
-        sr = zero_flag(value, sr)
-        sr = negative_flag(value, sr)
-
-        pc += 3
-        cycle_count += 7
-
-
-
-    elif opcode == 0x40:  #RTI Implied
-                # pull SR
-        sp = (sp + 1) & 0xFF
-        sr = ram_64KB[0x0100 + sp]
-        sr &= ~0b00010000
-        sr |=  0b00100000
-
-        # pull PC low
-        sp = (sp + 1) & 0xFF
-        pcl = ram_64KB[0x0100 + sp]
-
-        # pull PC high
-        sp = (sp + 1) & 0xFF
-        pch = ram_64KB[0x0100 + sp]
-
-        pc = (pch << 8) | pcl
-        cycle_count += 6
-
-
-
-    elif opcode == 0x60: #RTS Implied
-        sp = (sp + 1) & 0xFF
-        low = ram_64KB[0x0100 + sp]
-
-        sp = (sp + 1) & 0xFF
-        high = ram_64KB[0x0100 + sp]
-
-        pc = ((high << 8) | low) + 1
-        cycle_count += 6
-
-
-
-    elif opcode == 0xE9: #SBC Immediate
-
-        old_ac = ac
-
-        if sr & 0x01:
-            cin = 1
-        else:
-            cin = 0
-
-        
-        result = ac - operand_lower - (1 - cin)
-
-        
-
-        #Carry Flag (C)
-        if result >= 0:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-        ac = result & 0xFF
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        #Overflow Flag (V)
-        if (~(old_ac ^ operand_lower) & (old_ac ^ ac) & 0x80) != 0:
-            sr |= 0x40
-        else:
-            sr &= ~0x40
-
-        pc += 2
-        cycle_count += 2
-
-    elif opcode == 0xE5: #SBC Zero Page
-
-        old_ac = ac
-
-        if sr & 0x01:
-            cin = 1
-        else:
-            cin = 0
-
-        value = ram_64KB[operand_lower]
-        result = ac - value - (1 - cin)
-
-        #Carry Flag (C)
-        if result >= 0:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-        ac = result & 0xFF
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        #Overflow Flag (V)
-        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
-            sr |= 0x40
-        else:
-            sr &= ~0x40
-
-        pc += 2
-        cycle_count += 3
-    
-    elif opcode == 0xF5: #SBC Zero Page, X
-
-        old_ac = ac
-
-        if sr & 0x01:
-            cin = 1
-        else:
-            cin = 0
-
-        addr = (operand_lower + x) & 0xFF
-        value = ram_64KB[addr]
-        result = ac - value - (1 - cin)
-
-        #Carry Flag (C)
-        if result >= 0:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-        ac = result & 0xFF
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        #Overflow Flag (V)
-        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
-            sr |= 0x40
-        else:
-            sr &= ~0x40
-
-        pc += 2
-        cycle_count += 4
-
-    elif opcode == 0xED: #SBC Absolute
-
-        old_ac = ac
-
-        if sr & 0x01:
-            cin = 1
-        else:
-            cin = 0
-
-        addr = (operand_higher << 8) | operand_lower
-        value = ram_64KB[addr]
-        result = ac - value - (1 - cin)
-
-        #Carry Flag (C)
-        if result >= 0:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-        ac = result & 0xFF
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        #Overflow Flag (V)
-        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
-            sr |= 0x40
-        else:
-            sr &= ~0x40
-
-        pc += 3
-        cycle_count += 4
-
-    elif opcode == 0xFD: #SBC Absolute, X
-
-        old_ac = ac
-
-        if sr & 0x01:
-            cin = 1
-        else:
-            cin = 0
-
-        base = (operand_higher << 8) | operand_lower
-        addr = (base + x) & 0xFFFF
-        value = ram_64KB[addr]
-
-        result = ac - value - (1 - cin)
-
-        #Carry Flag (C)
-        if result >= 0:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-        ac = result & 0xFF
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        #Overflow Flag (V)
-        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
-            sr |= 0x40
-        else:
-            sr &= ~0x40
-
-        pc += 3
-        cycle_count += 4
-
-    elif opcode == 0xF9: #SBC Absolute, Y
-
-        old_ac = ac
-
-        if sr & 0x01:
-            cin = 1
-        else:
-            cin = 0
-
-        base = (operand_higher << 8) | operand_lower
-        addr = (base + y) & 0xFFFF
-        value = ram_64KB[addr]
-        
-        result = ac - value - (1 - cin)
-
-        #Carry Flag (C)
-        if result >= 0:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-        ac = result & 0xFF
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        #Overflow Flag (V)
-        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
-            sr |= 0x40
-        else:
-            sr &= ~0x40
-
-        pc += 3
-        cycle_count += 4
-
-    elif opcode == 0xE1: #SBC Indirect, X
-
-        old_ac = ac
-
-        if sr & 0x01:
-            cin = 1
-        else:
-            cin = 0
-
-        zp = (operand_lower + x) & 0xFF
-
-        low = ram_64KB[zp]
-        high = ram_64KB[(zp + 1) & 0xFF]
-
-        addr = (high << 8) | low
-        value = ram_64KB[addr]
-        
-        result = ac - value - (1 - cin)
-
-        #Carry Flag (C)
-        if result >= 0:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-        ac = result & 0xFF
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        #Overflow Flag (V)
-        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
-            sr |= 0x40
-        else:
-            sr &= ~0x40
-
-        pc += 2
-        cycle_count += 6
-
-    elif opcode == 0xF1: #SBC Indirect, Y
-
-        old_ac = ac
-
-        if sr & 0x01:
-            cin = 1
-        else:
-            cin = 0
-
-        zp = operand_lower
-
-        low = ram_64KB[zp]
-        high = ram_64KB[(zp + 1) & 0xFF]
-
-        base = (high << 8) | low
-        addr = (base + y) & 0xFFFF
-        value = ram_64KB[addr]
-        
-        result = ac - value - (1 - cin)
-
-        #Carry Flag (C)
-        if result >= 0:
-            sr |= 0x01
-        else:
-            sr &= ~0x01
-        ac = result & 0xFF
-
-        sr = zero_flag(ac, sr)
-
-        sr = negative_flag(ac, sr)
-
-        #Overflow Flag (V)
-        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
-            sr |= 0x40
-        else:
-            sr &= ~0x40
-
-        pc += 2
-        cycle_count += 5
-
-
-
-    elif opcode == 0x85: #STA Zero Page
-        ram_64KB[operand_lower] = ac
-
-        pc += 2
-        cycle_count += 3
-
-    elif opcode == 0x95: #STA Zero Page, X
-        ram_64KB[(operand_lower + x) & 0xFF] = ac
-
-        pc += 2
-        cycle_count += 4
-
-    elif opcode == 0x8D: #STA Absolute
-        ram_64KB[(operand_higher << 8) | operand_lower] = ac
-
-        pc += 3
-        cycle_count += 4
-    
-    elif opcode == 0x9D: #STA Absolute, X
-        addr = ((operand_higher << 8) | operand_lower) + x
-        ram_64KB[addr & 0xFFFF] = ac
-
-        pc += 3
-        cycle_count += 5
-
-    elif opcode == 0x99: #STA Absolute, Y
-        addr = ((operand_higher << 8) | operand_lower) + y
-        ram_64KB[addr & 0xFFFF] = ac
-
-        pc += 3
-        cycle_count += 5
-    
-    elif opcode == 0x81: #STA Indirect, X
-
-        zp_addr = (operand_lower + x) & 0xFF
-
-        low_byte = ram_64KB[zp_addr]
-        high_byte = ram_64KB[(zp_addr + 1) & 0xFF]
-
-        base_addr = (high_byte << 8) | low_byte
-
-        target_addr = base_addr
-
-        ram_64KB[target_addr] = ac
-
-
-        pc += 2
-        cycle_count += 6
-
-    elif opcode == 0x91: #STA Indirect, Y
-        zp_addr = operand_lower
-
-        low_byte = ram_64KB[zp_addr]
-        high_byte = ram_64KB[(zp_addr + 1) & 0xFF]
-
-        base_addr = (high_byte << 8) | low_byte
-
-        target_addr = (base_addr + y) & 0xFFFF
-
-        ram_64KB[target_addr] = ac
-
-
-        pc += 2
-        cycle_count += 6
-
-
-
-#Stack Instructions
-
-    elif opcode == 0x9A: #TXS (Transfer X to Stack ptr)
-        sp = x
-        pc += 1
-        cycle_count += 2
-
-    elif opcode == 0xBA: #TSX (Transfer Stack ptr to X)
-        x = sp
-
-        sr = zero_flag(x, sr)
-        sr = negative_flag(x, sr)
-
-        pc += 1
-        cycle_count += 2
-
-    elif opcode == 0x48: #PHA (Push Accumulator)
-        ram_64KB[0x100 + sp] = ac
-        sp = (sp - 1) & 0xFF
-        pc += 1
-        cycle_count += 3
-
-    elif opcode == 0x68: #PLA (Pull Accumulator)
-        sp = (sp + 1) & 0xFF
-        ac = ram_64KB[0x100 + sp]
-
-        sr = zero_flag(ac, sr)
-        sr = negative_flag(ac, sr)
-
-        pc += 1
-        cycle_count += 4
-
-    elif opcode == 0x08: #PHP (Push Processor Status)
-        ram_64KB[0x100 + sp] = sr
-        sp = (sp - 1) & 0xFF
-        pc += 1
-        cycle_count += 3
-
-    elif opcode == 0x28: #PLP (Pull Processor Status)
-        sp = (sp + 1) & 0xFF
-        sr = ram_64KB[0x100 + sp]
-        pc += 1
-        cycle_count += 4
-
-
-
-
-    elif opcode == 0x86: #STX Zero Page
-        ram_64KB[operand_lower] = x
-
-        pc += 2
-        cycle_count += 3
-
-    elif opcode == 0x96: #STX Zero Page, Y
-        ram_64KB[(operand_lower + y) & 0xFF] = x
-
-        pc += 2
-        cycle_count += 4
-        
-    elif opcode == 0x8E: #STX Absolute
-        addr = (operand_higher << 8) | operand_lower
-        ram_64KB[addr] = x
-
-        pc += 3
-        cycle_count += 4
-
-
-
-    elif opcode == 0x84: #STY Zero Page
-        ram_64KB[operand_lower] = y
-
-        pc += 2
-        cycle_count += 3
-
-    elif opcode == 0x94: #STY Zero Page, X
-        ram_64KB[(operand_lower + x) & 0xFF] = y
-
-        pc += 2
-        cycle_count += 4
-        
-    elif opcode == 0x8C: #STY Absolute
-        addr = (operand_higher << 8) | operand_lower
-        ram_64KB[addr] = y
-
-        pc += 3
-        cycle_count += 4
-
-
-
-
-#Illegal Opcodes
-
-    elif opcode == 0x04: #DOP Zero Page
-        pc += 1
-
-    elif opcode == 0x14: #DOP Zero Page, X
-        pc += 1
-
-    elif opcode == 0x34: #DOP Zero Page, X
-        pc += 1
-
-    elif opcode == 0x44: #DOP Zero Page
-        pc += 1
-
-    elif opcode == 0x54: #DOP Zero Page, X
-        pc += 1
-
-    elif opcode == 0x64: #DOP Zero Page
-        pc += 1
-
-    elif opcode == 0x74: #DOP Zero Page, X
-        pc += 1
-
-    elif opcode == 0x80: #DOP Immediate
-        pc += 1
-
-    elif opcode == 0x82: #DOP Immediate
-        pc += 1
-
-    elif opcode == 0x89: #DOP Immediate
-        pc += 1
-
-    elif opcode == 0xC2: #DOP Immediate
-        pc += 1
-
-    elif opcode == 0xD4: #DOP Zero Page, X
-        pc += 1
-
-    elif opcode == 0xE2: #DOP Immediate
-        pc += 1
-
-    elif opcode == 0xF4: #DOP Zero Page, X
-        pc += 1
-
-
-
-    else:
-
-        printerror = False
-
-        if printerror == True:
-            print(f"\nUnknown opcode {opcode:02X} at PC {pc:04X}\n")
-        halt = False
-        pc += 1
-
-    return pc, ac, x, y, sr, sp, halt, cycle_count
-
-
-
-
-
-if custom6502 == True:
-    while (pc + 3) != 65536:
-        pc, ac, x, y, sr, sp, halt, cycle_count = perform_opcode(pc, ram_64KB[pc], ram_64KB[pc+1], ram_64KB[pc+2], ac, x, y, sr, sp, cycle_count)
-        if halt == True:
-            break
-
-if apple_i == True:
-
-    shiftspace = array('B', [0] * 1024)
-    def writeshiftreg1024B(byte, shiftspace, writep):
-        if writep < 1024:
-            shiftspace[writep] = byte
-            writep += 1
-        else:
-            writep = 0
-
-        return writep, shiftspace
-
-    def readshiftreg1024B(shiftspace, readp):
-        if readp < 1024:
-            value111 = shiftspace[readp]
-            readp += 1
-        else:
-            readp = 0
-            value111 = shiftspace[readp]
-    
-
-        return readp, value111
-
-    def shiftdisplay():
-        clear = array('B', [0] * 40)
-
-        shiftspace[0:40] = shiftspace[40:80]                              # Row1  <- Row2
-        shiftspace[40:80] = shiftspace[80:120]                            # Row2  <- Row3
-        shiftspace[80:120] = shiftspace[120:160]                          # Row3  <- Row4
-        shiftspace[120:160] = shiftspace[160:200]                         # Row4  <- Row5
-        shiftspace[160:200] = shiftspace[200:240]                         # Row5  <- Row6
-        shiftspace[200:240] = shiftspace[240:280]                         # Row6  <- Row7
-        shiftspace[240:280] = shiftspace[280:320]                         # Row7  <- Row8
-        shiftspace[280:320] = shiftspace[320:360]                         # Row8  <- Row9
-        shiftspace[320:360] = shiftspace[360:400]                         # Row9  <- Row10
-        shiftspace[360:400] = shiftspace[400:440]                         # Row10 <- Row11
-        shiftspace[400:440] = shiftspace[440:480]                         # Row11 <- Row12
-        shiftspace[440:480] = shiftspace[480:520]                         # Row12 <- Row13
-        shiftspace[480:520] = shiftspace[520:560]                         # Row13 <- Row14
-        shiftspace[520:560] = shiftspace[560:600]                         # Row14 <- Row15
-        shiftspace[560:600] = shiftspace[600:640]                         # Row15 <- Row16
-        shiftspace[600:640] = shiftspace[640:680]                         # Row16 <- Row17
-        shiftspace[640:680] = shiftspace[680:720]                         # Row17 <- Row18
-        shiftspace[680:720] = shiftspace[720:760]                         # Row18 <- Row19
-        shiftspace[720:760] = shiftspace[760:800]                         # Row19 <- Row20
-        shiftspace[760:800] = shiftspace[800:840]                         # Row20 <- Row21
-        shiftspace[800:840] = shiftspace[840:880]                         # Row21 <- Row22
-        shiftspace[840:880] = shiftspace[880:920]                         # Row22 <- Row23
-        shiftspace[880:920] = shiftspace[920:960]                         # Row23 <- Row24
-        shiftspace[920:960] = clear[0:40]    # Row24 <- Clear
-
-
-
-    #Apple I Shift REG Pointers
-    readpointer = 0
-    writepointer = 0
-
-
-    #Keyboard
-    key_repeat_counter = 0
-    key_repeat = 6
-
-    wait1 = 0
-    wait2 = 0
-
-
-    #Display
-    cursor_xpos = 0
-    cursor_ypos = 0
-
-    xpos = 0x00
-    ypos = 0x00
-
-    #Window Scale Value
-    scalevar = 5
-
-
-    apple1_width = 280
-    apple1_height = 192
-
-    if not glfw.init():
-        raise Exception("GLFW can't be initialized")
-
-    # Request legacy context
-    glfw.window_hint(glfw.CONTEXT_VERSION_MAJOR, 2)
-    glfw.window_hint(glfw.CONTEXT_VERSION_MINOR, 1)
-    glfw.window_hint(glfw.OPENGL_PROFILE, glfw.OPENGL_ANY_PROFILE)
-
-    glfw.window_hint(glfw.RESIZABLE, glfw.FALSE)
-
-    window = glfw.create_window((apple1_width * scalevar), (apple1_height * scalevar), "Apple I  -  Ellie's Ems", None, None)
-    if not window:
-        glfw.terminate()
-        raise Exception("GLFW window can't be created")
-    
-
-
-
-
-    #Set Icon
-    img_path = Path(__file__).parent / "Assets" / "Apple_1_Icon-64x64.png"
-    img = Image.open(img_path).convert("RGBA")
-    width, height = img.size
-    pixels = np.array(img, dtype=np.uint8)
-
-    glfw.set_window_icon(window, 1, [(width, height, pixels)])
-
-
-
-
-
-    glfw.make_context_current(window)
-    glfw.swap_interval(1)  # vsync
-
-    glClearColor(0.0, 0.0, 0.0, 1.0)
-
-    # Create texture
-    texture = glGenTextures(1)
-    glBindTexture(GL_TEXTURE_2D, texture)
-    glTexImage2D(GL_TEXTURE_2D, 0, GL_RGB, apple1_width, apple1_height, 0, GL_RGB, GL_UNSIGNED_BYTE, None)
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
-    glEnable(GL_TEXTURE_2D)
-
-    framebuffer = np.zeros((apple1_height, apple1_width, 3), dtype=np.uint8)
-    framebuffer = np.ascontiguousarray(framebuffer)
-
-
-    def update_texture():
-        i1 = 0
-
-        while i1 != 960:
-            character = shiftspace[i1]
-
-            x1 = i1 % 40
-
-            y1 = i1 // 40
-
-            if character == 0x40: # '@'
-                rasterize_char(x1, y1, framebuffer, 0)
-            
-            elif character == 0x41: # 'A'
-                rasterize_char(x1, y1, framebuffer, 1)
-
-            elif character == 0x42: # 'B'
-                rasterize_char(x1, y1, framebuffer, 2)
-            
-            elif character == 0x43: # 'C'
-                rasterize_char(x1, y1, framebuffer, 3)
-
-            elif character == 0x44: # 'D'
-                rasterize_char(x1, y1, framebuffer, 4)
-
-            elif character == 0x45: # 'E'
-                rasterize_char(x1, y1, framebuffer, 5)
-
-            elif character == 0x46: # 'F'
-                rasterize_char(x1, y1, framebuffer, 6)
-
-            elif character == 0x47: # 'G'
-                rasterize_char(x1, y1, framebuffer, 7)
-
-            elif character == 0x48: # 'H'
-                rasterize_char(x1, y1, framebuffer, 8)
-
-            elif character == 0x49: # 'I'
-                rasterize_char(x1, y1, framebuffer, 9)
-
-            elif character == 0x4A: # 'J'
-                rasterize_char(x1, y1, framebuffer, 10)
-
-            elif character == 0x4B: # 'K'
-                rasterize_char(x1, y1, framebuffer, 11)
-
-            elif character == 0x4C: # 'L'
-                rasterize_char(x1, y1, framebuffer, 12)
-
-            elif character == 0x4D: # 'M'
-                rasterize_char(x1, y1, framebuffer, 13)
-
-            elif character == 0x4E: # 'N'
-                rasterize_char(x1, y1, framebuffer, 14)
-
-            elif character == 0x4F: # 'O'
-                rasterize_char(x1, y1, framebuffer, 15)
-
-            elif character == 0x50: # 'P'
-                rasterize_char(x1, y1, framebuffer, 16)
-
-            elif character == 0x51: # 'Q'
-                rasterize_char(x1, y1, framebuffer, 17)
-
-            elif character == 0x52: # 'R'
-                rasterize_char(x1, y1, framebuffer, 18)
-
-            elif character == 0x53: # 'S'
-                rasterize_char(x1, y1, framebuffer, 19)
-
-            elif character == 0x54: # 'T'
-                rasterize_char(x1, y1, framebuffer, 20)
-
-            elif character == 0x55: # 'U'
-                rasterize_char(x1, y1, framebuffer, 21)
-
-            elif character == 0x56: # 'V'
-                rasterize_char(x1, y1, framebuffer, 22)
-
-            elif character == 0x57: # 'W'
-                rasterize_char(x1, y1, framebuffer, 23)
-
-            elif character == 0x58: # 'X'
-                rasterize_char(x1, y1, framebuffer, 24)
-
-            elif character == 0x59: # 'Y'
-                rasterize_char(x1, y1, framebuffer, 25)
-
-            elif character == 0x5A: # 'Z'
-                rasterize_char(x1, y1, framebuffer, 26)
-
-            elif character == 0x5B: # '['
-                rasterize_char(x1, y1, framebuffer, 27)
-
-            elif character == 0x5C: # '\'
-                rasterize_char(x1, y1, framebuffer, 28)
-
-            elif character == 0x5D: # ']'
-                rasterize_char(x1, y1, framebuffer, 29)
-
-            elif character == 0x5E: # '^'
-                rasterize_char(x1, y1, framebuffer, 30)
-
-            elif character == 0x5F: # '_'
-                rasterize_char(x1, y1, framebuffer, 31)
-
-            elif character == 0x00: # ' '
-                rasterize_char(x1, y1, framebuffer, 32)
-            elif character == 0x20: # ' '
-                rasterize_char(x1, y1, framebuffer, 32)
-
-            elif character == 0x21: # '!'
-                rasterize_char(x1, y1, framebuffer, 33)
-
-            elif character == 0x22: # '"'
-                rasterize_char(x1, y1, framebuffer, 34)
-
-            elif character == 0x23: # '#'
-                rasterize_char(x1, y1, framebuffer, 35)
-
-            elif character == 0x24: # '$'
-                rasterize_char(x1, y1, framebuffer, 36)
-
-            elif character == 0x25: # '%'
-                rasterize_char(x1, y1, framebuffer, 37)
-
-            elif character == 0x26: # '&'
-                rasterize_char(x1, y1, framebuffer, 38)
-            
-            elif character == 0x27: # '''
-                rasterize_char(x1, y1, framebuffer, 39)
-
-            elif character == 0x28: # '('
-                rasterize_char(x1, y1, framebuffer, 40)
-
-            elif character == 0x29: # ')'
-                rasterize_char(x1, y1, framebuffer, 41)
-
-            elif character == 0x2A: # '*'
-                rasterize_char(x1, y1, framebuffer, 42)
-
-            elif character == 0x2B: # '+'
-                rasterize_char(x1, y1, framebuffer, 43)
-
-            elif character == 0x2C: # ','
-                rasterize_char(x1, y1, framebuffer, 44)
-
-            elif character == 0x2D: # '-'
-                rasterize_char(x1, y1, framebuffer, 45)
-
-            elif character == 0x2E: # '.'
-                rasterize_char(x1, y1, framebuffer, 46)
-
-            elif character == 0x2F: # '/'
-                rasterize_char(x1, y1, framebuffer, 47)
-
-            elif character == 0x30: # '0'
-                rasterize_char(x1, y1, framebuffer, 48)
-            
-            elif character == 0x31: # '1'
-                rasterize_char(x1, y1, framebuffer, 49)
-
-            elif character == 0x32: # '2'
-                rasterize_char(x1, y1, framebuffer, 50)
-
-            elif character == 0x33: # '3'
-                rasterize_char(x1, y1, framebuffer, 51)
-
-            elif character == 0x34: # '4'
-                rasterize_char(x1, y1, framebuffer, 52)
-
-            elif character == 0x35: # '5'
-                rasterize_char(x1, y1, framebuffer, 53)
-
-            elif character == 0x36: # '6'
-                rasterize_char(x1, y1, framebuffer, 54)
-
-            elif character == 0x37: # '7'
-                rasterize_char(x1, y1, framebuffer, 55)
-
-            elif character == 0x38: # '8'
-                rasterize_char(x1, y1, framebuffer, 56)
-
-            elif character == 0x39: # '9'
-                rasterize_char(x1, y1, framebuffer, 57)
-
-            elif character == 0x3A: # ':'
-                rasterize_char(x1, y1, framebuffer, 58)
-
-            elif character == 0x3B: # ';'
-                rasterize_char(x1, y1, framebuffer, 59)
-
-            elif character == 0x3C: # '<'
-                rasterize_char(x1, y1, framebuffer, 60)
-
-            elif character == 0x3D: # '='
-                rasterize_char(x1, y1, framebuffer, 61)
-
-            elif character == 0x3E: # '>'
-                rasterize_char(x1, y1, framebuffer, 62)
-
-            elif character == 0x3F: # '?'
-                rasterize_char(x1, y1, framebuffer, 63)
-
-            else:
-                rasterize_char(x1, y1, framebuffer, 32)
-
-            i1 += 1
-        
-        glBindTexture(GL_TEXTURE_2D, texture)
-        glTexSubImage2D(GL_TEXTURE_2D, 0, 0, 0,
-                        apple1_width, apple1_height,
-                        GL_RGB, GL_UNSIGNED_BYTE,
-                        np.ascontiguousarray(framebuffer))
-
-
-    def rasterize_char(xposition, yposition, framebuffer, character):
-        xpos = (xposition * 7)
-        ypos = apple1_height - ((yposition * 8) + 1)
-
-        if character == 0: #Character : '@' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 1: #Character : 'A' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-        
-        elif character == 2: #Character : 'B' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 3: #Character : 'C' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 4: #Character : 'D' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 5: #Character : 'E' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 6: #Character : 'F' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 7: #Character : 'G' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 8: #Character : 'H' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 9: #Character : 'I' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 10: #Character : 'J' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 11: #Character : 'K' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 12: #Character : 'L' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 13: #Character : 'M' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 14: #Character : 'N' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 15: #Character : 'O' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 16: #Character : 'P' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 17: #Character : 'Q' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 18: #Character : 'R' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 19: #Character : 'S' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 20: #Character : 'T' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 21: #Character : 'U' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 22: #Character : 'V' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 23: #Character : 'W' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 24: #Character : 'X' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 25: #Character : 'Y' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 26: #Character : 'Z' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 27: #Character : '[' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 28: #Character : '\' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 29: #Character : ']' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 30: #Character : '^' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 31: #Character : '_' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 32: #Character : ' ' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 33: #Character : '!' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 34: #Character : '"' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 35: #Character : '#' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 36: #Character : '$' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 37: #Character : '%' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 38: #Character : '&' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 39: #Character : ''' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 40: #Character : '(' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 41: #Character : ')' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 42: #Character : '*' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 43: #Character : '+' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 44: #Character : ',' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 45: #Character : '-' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 46: #Character : '.' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 47: #Character : '/' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 48: #Character : '0' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 49: #Character : '1' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 50: #Character : '2' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 51: #Character : '3' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 52: #Character : '4' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 53: #Character : '5' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 54: #Character : '6' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 55: #Character : '7' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 56: #Character : '8' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 57: #Character : '9' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 58: #Character : ':' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 59: #Character : ';' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 60: #Character : '<' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 61: #Character : '=' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 62: #Character : '>' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-        elif character == 63: #Character : '?' DONE
-            framebuffer[ypos - 0, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 0, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 1, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 2] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 1, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 1, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 2, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 1] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 2, xpos + 5] = [255 ,255 ,255]
-            framebuffer[ypos - 2, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 3, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 4] = [255 ,255 ,255]
-            framebuffer[ypos - 3, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 3, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 4, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 4, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 4, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 5, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 5, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 5, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 6, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 3] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 6, xpos + 6] = [0 ,0 ,0]
-
-            framebuffer[ypos - 7, xpos + 0] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 1] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 2] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 3] = [255 ,255 ,255]
-            framebuffer[ypos - 7, xpos + 4] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 5] = [0 ,0 ,0]
-            framebuffer[ypos - 7, xpos + 6] = [0 ,0 ,0]
-
-    def key_input():
-        if (ram_64KB[0xD011] & 0x80) == 0:
-                if glfw.get_key(window, glfw.KEY_ENTER) == glfw.PRESS and not (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0x8D
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_SPACE) == glfw.PRESS and not (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xA0
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_1) == glfw.PRESS and (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xA1
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_APOSTROPHE) == glfw.PRESS and (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xA2
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_3) == glfw.PRESS and (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xA3
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_4) == glfw.PRESS and (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xA4
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_5) == glfw.PRESS and (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xA5
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_7) == glfw.PRESS and (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xA6
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_APOSTROPHE) == glfw.PRESS and not (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xA7
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_9) == glfw.PRESS and (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xA8
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_0) == glfw.PRESS and (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xA9
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_8) == glfw.PRESS and (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xAA
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_EQUAL) == glfw.PRESS and (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xAB
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_COMMA) == glfw.PRESS and not (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xAC
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_MINUS) == glfw.PRESS and not (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xAD
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_PERIOD) == glfw.PRESS and not (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xAE
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_SLASH) == glfw.PRESS and not (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xAF
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_0) == glfw.PRESS and not (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xB0
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_1) == glfw.PRESS and not (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xB1
-                    ram_64KB[0xD011] = 0x80
-                    
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_2) == glfw.PRESS and not (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xB2
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_3) == glfw.PRESS and not (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xB3
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_4) == glfw.PRESS and not (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xB4
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_5) == glfw.PRESS and not (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xB5
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_6) == glfw.PRESS and not (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xB6
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_7) == glfw.PRESS and not (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xB7
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_8) == glfw.PRESS and not (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xB8
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_9) == glfw.PRESS and not (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xB9
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_SEMICOLON) == glfw.PRESS and (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xBA
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_SEMICOLON) == glfw.PRESS and not (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xBB
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_COMMA) == glfw.PRESS and (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xBC
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_EQUAL) == glfw.PRESS and not (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xBD
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_PERIOD) == glfw.PRESS and (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xBE
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_SLASH) == glfw.PRESS and (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xBF
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_2) == glfw.PRESS and (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xC0
-                    ram_64KB[0xD011] = 0x80
-
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_A) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xC1
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_B) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xC2
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_C) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xC3
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_D) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xC4
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_E) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xC5
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_F) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xC6
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_G) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xC7
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_H) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xC8
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_I) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xC9
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_J) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xCA
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_K) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xCB
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_L) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xCC
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_M) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xCD
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_N) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xCE
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_O) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xCF
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_P) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xD0
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_Q) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xD1
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_R) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xD2
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_S) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xD3
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_T) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xD4
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_U) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xD5
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_V) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xD6
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_W) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xD7
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_X) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xD8
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_Y) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xD9
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_Z) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xDA
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_LEFT_BRACKET) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xDB
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_BACKSLASH) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xDC
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_RIGHT_BRACKET) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0xDD
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_6) == glfw.PRESS and (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xDE
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                if glfw.get_key(window, glfw.KEY_MINUS) == glfw.PRESS and (glfw.get_key(window, glfw.KEY_LEFT_SHIFT) == glfw.PRESS or glfw.get_key(window, glfw.KEY_RIGHT_SHIFT) == glfw.PRESS):
-                    ram_64KB[0xD010] = 0xDF
-                    ram_64KB[0xD011] = 0x80
-
-                if glfw.get_key(window, glfw.KEY_BACKSPACE) == glfw.PRESS:
-                    ram_64KB[0xD010] = 0x7F
-                    ram_64KB[0xD011] = 0x80
-                        
-                    key_repeat_counter = key_repeat  # reset counter
-                
-                
-        
-        
-
-
-
-    start = time.perf_counter()
-    while not glfw.window_should_close(window):
-        glfw.poll_events()
-        glClear(GL_COLOR_BUFFER_BIT)
-
-        
-
-        # Draw quad
-        glBegin(GL_QUADS)
-        glTexCoord2f(0, 0); glVertex2f(-1, -1)
-        glTexCoord2f(1, 0); glVertex2f(1, -1)
-        glTexCoord2f(1, 1); glVertex2f(1, 1)
-        glTexCoord2f(0, 1); glVertex2f(-1, 1)
-        glEnd()
-
-
-        glfw.swap_buffers(window)
-
-        
-        if key_repeat_counter <= 0:
-            key_input()
-            key_repeat_counter = key_repeat
-        key_repeat_counter -= 1
-
-        if ram_64KB[pc - 1] == 0xD0 and ram_64KB[pc - 2] == 0x12:
-            ram_64KB[0xD012] |= 0x80
-
-        while wait2 != 500:
-            
-            pc, ac, x, y, sr, sp, halt, cycle_count = perform_opcode(pc, ram_64KB[pc], ram_64KB[pc+1], ram_64KB[pc+2], ac, x, y, sr, sp, cycle_count)
-     
-            if ram_64KB[0xD012] & 0x80:    
-                
-                writepointer, shiftspace = writeshiftreg1024B((ram_64KB[0xD012] & 0x7F), shiftspace, writepointer) #Write to shift reg
-                
-                    
-                        
-                        
-                ram_64KB[0xD012] &= 0x7F
-
-                if ram_64KB[0xD012] == 0x0D:
-                            if cursor_ypos == 0:
-                                writepointer = 40
-                            elif cursor_ypos == 1:
-                                writepointer = 80
-                            elif cursor_ypos == 2:
-                                writepointer = 120
-                            elif cursor_ypos == 3:
-                                writepointer = 160
-                            elif cursor_ypos == 4:
-                                writepointer = 200
-                            elif cursor_ypos == 5:
-                                writepointer = 240
-                            elif cursor_ypos == 6:
-                                writepointer = 280
-                            elif cursor_ypos == 7:
-                                writepointer = 320
-                            elif cursor_ypos == 8:
-                                writepointer = 360
-                            elif cursor_ypos == 9:
-                                writepointer = 400
-                            elif cursor_ypos == 10:
-                                writepointer = 440
-                            elif cursor_ypos == 11:
-                                writepointer = 480
-                            elif cursor_ypos == 12:
-                                writepointer = 520
-                            elif cursor_ypos == 13:
-                                writepointer = 560
-                            elif cursor_ypos == 14:
-                                writepointer = 600
-                            elif cursor_ypos == 15:
-                                writepointer = 640
-                            elif cursor_ypos == 16:
-                                writepointer = 680
-                            elif cursor_ypos == 17:
-                                writepointer = 720
-                            elif cursor_ypos == 18:
-                                writepointer = 760
-                            elif cursor_ypos == 19:
-                                writepointer = 800
-                            elif cursor_ypos == 20:
-                                writepointer = 840
-                            elif cursor_ypos == 21:
-                                writepointer = 880
-                            elif cursor_ypos == 22:
-                                writepointer = 920
-                            elif cursor_ypos == 23:
-                                writepointer = 920
-                                shiftdisplay()
-
-                cursor_xpos += 1
-                if cursor_xpos >= 40:
-                        cursor_xpos = 0
-
-                if writepointer == 40:
-                        cursor_ypos = 1
-                elif writepointer == 80:
-                        cursor_ypos = 2
-                elif writepointer == 120:
-                        cursor_ypos = 3
-                elif writepointer == 160:
-                        cursor_ypos = 4
-                elif writepointer == 200:
-                        cursor_ypos = 5
-                elif writepointer == 240:
-                        cursor_ypos = 6
-                elif writepointer == 280:
-                        cursor_ypos = 7
-                elif writepointer == 320:
-                        cursor_ypos = 8
-                elif writepointer == 360:
-                        cursor_ypos = 9
-                elif writepointer == 400:
-                        cursor_ypos = 10
-                elif writepointer == 440:
-                        cursor_ypos = 11
-                elif writepointer == 480:
-                        cursor_ypos = 12
-                elif writepointer == 520:
-                        cursor_ypos = 13
-                elif writepointer == 560:
-                        cursor_ypos = 14
-                elif writepointer == 600:
-                        cursor_ypos = 15
-                elif writepointer == 640:
-                        cursor_ypos = 16
-                elif writepointer == 680:
-                        cursor_ypos = 17
-                elif writepointer == 720:
-                        cursor_ypos = 18
-                elif writepointer == 760:
-                        cursor_ypos = 19
-                elif writepointer == 800:
-                        cursor_ypos = 20
-                elif writepointer == 840:
-                        cursor_ypos = 21
-                elif writepointer == 880:
-                        cursor_ypos = 22
-                elif writepointer == 920:
-                        cursor_ypos = 23
-                elif writepointer > 960:
-                        writepointer = 920
-                        shiftdisplay()
-                        
-                
-            
-            
-
-            if ram_64KB[pc - 1] == 0xD0 and ram_64KB[pc - 2] == 0x10:
-                ram_64KB[0xD011] = 0x7F
-
-            wait2 += 1
-        update_texture()
-        wait2 = 0
-            
-
-
-
-            
-        elapsed = time.perf_counter() - start
-
-if atari_2600 == True:
-
-
-
-
-
-    wait1 = 0
-    wait2 = 0
-
-
-        #Window Scale Value
-    scalevar = 5
-
-
-    atari2600_width = 160
-    atari2600_height = 192
-
-    if not glfw.init():
-        raise Exception("GLFW can't be initialized")
-
-    # Request legacy context
-    glfw.window_hint(glfw.CONTEXT_VERSION_MAJOR, 2)
-    glfw.window_hint(glfw.CONTEXT_VERSION_MINOR, 1)
-    glfw.window_hint(glfw.OPENGL_PROFILE, glfw.OPENGL_ANY_PROFILE)
-
-    glfw.window_hint(glfw.RESIZABLE, glfw.FALSE)
-
-
-    window = glfw.create_window((256 * scalevar), (atari2600_height * scalevar), "Atari® 2600™  -  Ellie's Ems", None, None)
-    if not window:
-        glfw.terminate()
-        raise Exception("GLFW window can't be created")
-    
-
-
-    #Set Icon
-    img_path = Path(__file__).parent / "Assets" / "Atari_2600_Icon-64x64.png"
-    img = Image.open(img_path).convert("RGBA")
-    width, height = img.size
-    pixels = np.array(img, dtype=np.uint8)
-
-    glfw.set_window_icon(window, 1, [(width, height, pixels)])
-
-
-
-    glfw.make_context_current(window)
-    glfw.swap_interval(1)  # vsync
-
-    glClearColor(0.0, 0.0, 0.0, 1.0)
-
-    # Create texture
-    texture = glGenTextures(1)
-    glBindTexture(GL_TEXTURE_2D, texture)
-    glTexImage2D(GL_TEXTURE_2D, 0, GL_RGB, atari2600_width, atari2600_height, 0, GL_RGB, GL_UNSIGNED_BYTE, None)
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
-    glEnable(GL_TEXTURE_2D)
-
-    framebuffer = np.zeros((atari2600_height, atari2600_width, 3), dtype=np.uint8)
-    framebuffer = np.ascontiguousarray(framebuffer)
-
-    
-
-    def update_texture():
-
-        framebuffer[1, 1] = [255,255,255]
-
-
-        glBindTexture(GL_TEXTURE_2D, texture)
-        glTexSubImage2D(GL_TEXTURE_2D, 0, 0, 0,
-                        atari2600_width, atari2600_height,
-                        GL_RGB, GL_UNSIGNED_BYTE,
-                        np.ascontiguousarray(framebuffer))
-        
-
-
-    def atari_2600_tia():
-        print("a")
-
-
-
-
-
-    
-    start = time.perf_counter()
-    while not glfw.window_should_close(window):
-        glfw.poll_events()
-        glClear(GL_COLOR_BUFFER_BIT)
-
-        
-
-        # Draw quad
-        glBegin(GL_QUADS)
-        glTexCoord2f(0, 0); glVertex2f(-1, -1)
-        glTexCoord2f(1, 0); glVertex2f(1, -1)
-        glTexCoord2f(1, 1); glVertex2f(1, 1)
-        glTexCoord2f(0, 1); glVertex2f(-1, 1)
-        glEnd()
-
-        glfw.swap_buffers(window)
-
-
-
-
-
-
-        while wait2 != 500:
-                    
-                pc, ac, x, y, sr, sp, halt, cycle_count = perform_opcode(pc, ram_64KB[pc], ram_64KB[pc+1], ram_64KB[pc+2], ac, x, y, sr, sp, cycle_count)
-            
-                    
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-                wait2 += 1
-        update_texture()
-        wait2 = 0
-
-
-
-        elapsed = time.perf_counter() - start
-
-
-glfw.terminate()
\ No newline at end of file
+#----------Miscellaneous----------
+from pathlib import Path
+from array import array
+import argparse
+import sys
+import heapq
+import ast
+import copy
+import inspect
+import atexit
+import weakref
+import hashlib
+import importlib.util
+import logging
+import marshal
+import os
+
+# Emulator messages (unstable opcodes) go here, not to stdout where a machine's own output goes.
+# With no logging set up, Python shows warnings on stderr.
+log = logging.getLogger("mos_6502_cpu")
+
+
+
+#----------CPU----------
+
+# SR FLAGS : N V - B D I Z C
+
+
+
+# N and Z bits for every 8-bit result, so one lookup sets both:
+#   sr = (sr & 0x7D) | NZ_FLAGS[value]
+NZ_FLAGS = [(value & 0x80) | (0x02 if value == 0 else 0x00) for value in range(256)]
+
+# With lazy flags, N and Z are not kept in sr but in cpu.nz, which holds the last result:
+#   Z is set when (nz & 0xFF) == 0, N is set when nz & 0x180
+# Bit 8 lets BIT (and PLP/RTI) describe N set together with Z set, which no 8-bit result can.
+#   sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+LAZY_NZ_FLAGS = [(0x80 if nz & 0x180 else 0x00) | (0x02 if (nz & 0xFF) == 0 else 0x00) for nz in range(512)]
+
+
+def build_decimal_tables():
+    # NMOS decimal mode ADC/SBC, worked out once for every (carry, A, operand)
+    # Each entry is (A, C and V bits of sr, N/Z in the lazy nz form), indexed by (carry << 16) | (A << 8) | operand
+    #   ADC: Z comes from the binary sum, N and V from the sum after the low digit is adjusted
+    #   SBC: N, V, Z and C are the same as in binary mode, only A is adjusted
+    decimal_adc = []
+    decimal_sbc = []
+    for carry in range(2):
+        for ac in range(256):
+            for value in range(256):
+                #ADC
+                binary = ac + value + carry
+                low = (ac & 0x0F) + (value & 0x0F) + carry
+                if low >= 0x0A:
+                    low = ((low + 0x06) & 0x0F) + 0x10
+                result = (ac & 0xF0) + (value & 0xF0) + low
+                signed = (ac & 0xF0) - (ac & 0x80) * 2 + (value & 0xF0) - (value & 0x80) * 2 + low
+
+                flags = 0x40 if signed < -128 or signed > 127 else 0x00
+                nz = ((result & 0x80) << 1) | (0x00 if binary & 0xFF == 0 else 0x01)
+                if result >= 0xA0:
+                    result += 0x60
+                if result > 0xFF:
+                    flags |= 0x01
+                decimal_adc.append((result & 0xFF, flags, nz))
+
+                #SBC
+                binary = ac - value - (1 - carry)
+                low = (ac & 0x0F) - (value & 0x0F) + carry - 1
+                if low < 0:
+                    low = ((low - 0x06) & 0x0F) - 0x10
+                result = (ac & 0xF0) - (value & 0xF0) + low
+                if result < 0:
+                    result -= 0x60
+
+                flags = 0x01 if binary >= 0 else 0x00
+                if ((ac ^ value) & (ac ^ binary) & 0x80) != 0:
+                    flags |= 0x40
+                decimal_sbc.append((result & 0xFF, flags, binary & 0xFF))
+    return decimal_adc, decimal_sbc
+
+class DecimalTable(dict):
+    # DECIMAL_ADC/DECIMAL_SBC start out empty and are filled in the first time decimal mode is used,
+    # so importing the core doesn't pay for building them
+    def __missing__(self, index):
+        if self:
+            raise KeyError(index)
+        decimal_adc, decimal_sbc = build_decimal_tables()
+        DECIMAL_ADC.update(enumerate(decimal_adc))
+        DECIMAL_SBC.update(enumerate(decimal_sbc))
+        return self[index]
+
+DECIMAL_ADC = DecimalTable()
+DECIMAL_SBC = DecimalTable()
+
+def interrupt_test_chip(cpu, a):
+    a += 1
+    if a == 10:
+        cpu.set_nmi(False)
+    elif a == 12:
+        cpu.set_nmi(False)
+    return a
+
+
+class UnstableOpcodeError(Exception):
+    # Raised for KIL and the unstable undocumented opcodes when cpu.unstable_opcodes is "trap"
+    def __init__(self, opcode, pc):
+        super().__init__(f"Unstable opcode {opcode:02X} at PC {pc:04X}")
+        self.opcode = opcode
+        self.pc = pc
+
+
+class CPU:
+    # One MOS 6502: registers, the 64KB it is wired to and its interrupt lines.
+    # Several of these can live side by side, nothing is kept in module globals.
+    __slots__ = (
+        "ram_64KB", "read_pages", "write_pages", "bus_layout", "dirty_tracking", "dirty_pages",
+        "pc", "ac", "x", "y", "sr", "sp",
+        "cycle_count", "cycle_limit", "run_end", "halt",
+        "events", "event_count",
+        "irq", "nmi_line", "nmi_latched",
+        "lazy_flags", "nz", "opcode_table",
+        "blocks", "step_blocks", "code_bytes", "rom_regions",
+        "fusions", "fusion_counts",
+        "idle_skip", "idle_state", "idle_cycle", "idle_cycles",
+        "unstable_opcodes", "unstable_logged", "jammed",
+    )
+
+    def __init__(self, ram_64KB, pc=0x0000, lazy_flags=False, translate_blocks=False, skip_idle=False,
+                 unstable_opcodes="log", track_dirty=False):
+        self.ram_64KB = ram_64KB
+
+        if unstable_opcodes not in ("jam", "trap", "log"):
+            raise ValueError(f"unstable_opcodes must be 'jam', 'trap' or 'log', not {unstable_opcodes!r}")
+
+        if lazy_flags and translate_blocks:
+            raise ValueError("lazy_flags and translate_blocks can't be used together (blocks drop dead flag updates themselves)")
+
+        # Memory map: one entry per page, None for plain memory in ram_64KB (see #Memory Bus)
+        self.read_pages = [None] * 256
+        self.write_pages = [None] * 256
+        self.bus_layout = None #Which pages are plain memory, None while they all are
+
+        # Dirty pages: with track_dirty on, every store into ram_64KB sets the page's byte here
+        # (see take_dirty_pages()), so the display or a snapshot only has to look at what changed
+        self.dirty_tracking = track_dirty
+        self.dirty_pages = bytearray(256)
+
+        # Lazy flags: N and Z are only worked out of cpu.nz when something looks at them
+        # (N/Z branches, PHP, BRK, interrupts, snapshot()). Everything else is kept in sr.
+        self.lazy_flags = lazy_flags
+
+        # Idle loops: a loop that only reads memory and comes round with the same registers
+        # is skipped forward to cycle_limit (see #Idle Loops)
+        self.idle_skip = skip_idle
+        self.idle_state = None #Loop and registers the last time a loop branched back
+        self.idle_cycle = 0    #cycle_count at that point
+        self.idle_cycles = 0   #Cycles skipped so far
+
+        # Block translation: run() and step() execute compiled blocks of code (see #Block Translator)
+        # instead of calling one handler per instruction
+        if translate_blocks:
+            self.blocks = {}      #Start address -> block
+            self.step_blocks = {} #Start address -> single instruction block, for step()
+        else:
+            self.blocks = None
+            self.step_blocks = None
+        self.code_bytes = bytearray(0x10000) #Number of translated blocks covering each address
+        self.rom_regions = [] #Mapped ROMs, their blocks go through the block cache
+
+        # Superinstructions: opcode sequences run by fused handlers (see fuse())
+        self.fusions = []
+        self.fusion_counts = [] #Times each one ran
+
+        self.memory_map_changed() #Builds the opcode table
+
+        #----------Registers----------
+
+        #Program Counter
+        self.pc = pc
+
+        #Accumulator
+        self.ac = 0
+
+        #X Register
+        self.x = 0
+
+        #Y Register
+        self.y = 0
+
+        #Status Register [NV-BDIZC]
+        self.sr = 0x00
+        self.nz = 0x01 #Last N/Z result when lazy_flags is on (N and Z clear)
+
+        #Stack Pointer
+        self.sp = 0xFF
+
+        self.cycle_count = 0
+        self.cycle_limit = 0 #End of the current batch: the next event, or run_end
+        self.run_end = 0     #End of the current run()
+
+        # Scheduled events, a heap of [cycle, order scheduled, callback] (see schedule())
+        self.events = []
+        self.event_count = 0
+
+        self.halt = False #For break (BRK)
+
+        # What KIL and the unstable undocumented opcodes do (see unstable_opcode())
+        self.unstable_opcodes = unstable_opcodes
+        self.unstable_logged = set() #Addresses already logged
+        self.jammed = False #A KIL (or a jam) stopped the CPU
+
+        #----------Interrupt Lines----------
+        self.irq = False
+
+        self.nmi_line = False
+        self.nmi_latched = False
+
+    def push_byte(self, value):
+        addr = 0x0100 + self.sp
+        write = self.write_pages[1]
+        if write is None:
+            self.ram_64KB[addr] = value & 0xFF
+            self.dirty_pages[1] = 1
+            if self.code_bytes[addr]:
+                self.invalidate_code(addr)
+        else:
+            #Stack page mapped to I/O (or mirrored, like the Atari 2600's zero page RAM)
+            write(addr, value & 0xFF)
+        self.sp = (self.sp - 1) & 0xFF
+
+    def pull_byte(self):
+        self.sp = (self.sp + 1) & 0xFF
+        read = self.read_pages[1]
+        if read is None:
+            return self.ram_64KB[0x0100 + self.sp]
+        return read(0x0100 + self.sp)
+
+    def sync_flags(self):
+        # Bring N and Z in sr up to date (only needed with lazy flags)
+        if self.lazy_flags:
+            self.sr = (self.sr & 0x7D) | LAZY_NZ_FLAGS[self.nz]
+
+    def snapshot(self):
+        # Registers as they would be seen from outside the CPU
+        self.sync_flags()
+        return {
+            "pc": self.pc, "ac": self.ac, "x": self.x, "y": self.y,
+            "sr": self.sr, "sp": self.sp, "cycle_count": self.cycle_count,
+        }
+
+    def idle_loop(self, start, end):
+        # The loop start..end came round with the same registers as last time. If it writes
+        # nothing, every further pass is the same until something outside the CPU changes,
+        # so skip ahead to cycle_limit.
+        if is_pure_loop(self.ram_64KB, start, end):
+            self.skip_idle(self.cycle_count - self.idle_cycle)
+        self.idle_cycle = self.cycle_count
+
+    def skip_idle(self, iteration):
+        # Credit the whole passes of an idle loop (iteration cycles each) that fit before cycle_limit,
+        # the rest of the batch runs normally so it ends on the same instruction it would have
+        if self.idle_skip and iteration > 0:
+            skipped = (self.cycle_limit - self.cycle_count) // iteration * iteration
+            if skipped > 0:
+                self.cycle_count += skipped
+                self.idle_cycles += skipped
+
+    def take_interrupt(self, pc, vector, break_flag=False, pc_offset=0):
+        self.sync_flags()
+        self.idle_state = None
+
+        addr_to_push = (pc + pc_offset) & 0xFFFF
+        self.push_byte((addr_to_push >> 8) & 0xFF)
+        self.push_byte(addr_to_push & 0xFF)
+
+        status_to_push = self.sr | 0x20
+        if break_flag:
+            status_to_push |= 0x10
+        else:
+            status_to_push &= ~0x10
+
+        self.push_byte(status_to_push)
+
+        # Set Interrupt Disable flag
+        self.sr |= 0x04
+
+        return self.read_vector(vector)
+
+    def read_vector(self, vector):
+        read = self.read_pages[vector >> 8]
+        if read is not None:
+            return read(vector) | (read(vector + 1) << 8)
+        return self.ram_64KB[vector] | (self.ram_64KB[vector + 1] << 8)
+
+    def reset(self):
+        # The RESET line: the only way out of a jam. Like a power-up the stack pointer goes down by 3
+        # (nothing is written), I is set and pc is loaded from the vector at $FFFC.
+        self.sync_flags()
+        self.jammed = False
+        self.nmi_latched = False
+        self.idle_state = None
+        self.sp = (self.sp - 3) & 0xFF
+        self.sr |= 0x04
+        self.pc = self.read_vector(0xFFFC)
+        self.cycle_count += 7
+
+    def unstable_opcode(self, pc):
+        # KIL or an unstable undocumented opcode is about to run at pc. Depending on unstable_opcodes:
+        #   "jam"  : the CPU locks up on it like on a KIL, so the program visibly stops there
+        #   "trap" : raise UnstableOpcodeError
+        #   "log"  : log a warning (once per address) and let the handler carry on
+        # Returns True if the handler should carry on.
+        if self.unstable_opcodes == "trap":
+            raise UnstableOpcodeError(self.ram_64KB[pc], pc)
+        if self.unstable_opcodes == "jam":
+            self.jam()
+            return False
+        if pc not in self.unstable_logged:
+            self.unstable_logged.add(pc)
+            log.warning("Unstable opcode %02X at PC %04X", self.ram_64KB[pc], pc)
+        return True
+
+    def jam(self):
+        # Stop fetching instructions until reset(): pc stays where it is and the rest of the batch passes.
+        # While jammed, run() only lets the cycles go by (events still fire) and interrupts aren't taken.
+        self.jammed = True
+        if self.cycle_count < self.cycle_limit:
+            self.cycle_count = self.cycle_limit
+
+    def set_nmi(self, level):
+        if level and not self.nmi_line:  #rising edge
+            self.nmi_latched = True
+            self.cycle_limit = self.cycle_count #Taken at the end of the batch
+        self.nmi_line = level
+
+    def set_irq(self, level):
+        self.irq = level
+        if level and not (self.sr & 0x04):
+            self.cycle_limit = self.cycle_count #Taken at the end of the batch
+        # (when I is set, CLI, PLP and RTI end the batch if they clear it with IRQ still held)
+
+    def schedule(self, cycle, callback):
+        # Call callback(cycle) once cycle_count reaches cycle. run() executes uninterrupted up to
+        # the next event, so devices schedule their IRQ/NMI, timer, scanline and frame events here
+        # instead of being polled after every instruction. Callbacks that repeat schedule the next
+        # one from the cycle they were given, so they don't drift.
+        # Returns the event, for cancel().
+        event = [cycle, self.event_count, callback]
+        self.event_count += 1
+        heapq.heappush(self.events, event)
+        if cycle < self.cycle_limit:
+            self.cycle_limit = cycle
+        return event
+
+    def cancel(self, event):
+        # Drop an event from schedule() that hasn't fired yet
+        event[2] = None
+
+    def fire_events(self):
+        # Run the callbacks of every event that is due
+        events = self.events
+        while events and events[0][0] <= self.cycle_count:
+            cycle, order, callback = heapq.heappop(events)
+            if callback is not None:
+                callback(cycle)
+
+    def check_interrupts(self):
+        if self.jammed:
+            return
+        if self.nmi_latched:
+
+            self.nmi_latched = False
+            self.pc = self.take_interrupt(self.pc, 0xFFFA)
+            self.cycle_count += 7
+        elif self.irq and not (self.sr & 0x04):
+
+            self.pc = self.take_interrupt(self.pc, 0xFFFE)
+            self.cycle_count += 7
+
+    def build_opcode_table(self):
+        # The handler table for the options in use: lazy flags, memory map, fusions, idle loops
+        table = bus_opcode_table(self.lazy_flags, self.bus_layout)
+
+        if self.fusions:
+            fusion_index = {sequence: index for index, sequence in enumerate(self.fusions)}
+            tails = {}
+            for sequence in self.fusions:
+                tails.setdefault(sequence[0], []).append(sequence[1:])
+            table = list(table)
+            for head in tails:
+                table[head] = build_fused_handler(head, tails[head], fusion_index, self.bus_layout)
+
+        if self.idle_skip:
+            table = wrap_idle_branches(table)
+        self.opcode_table = table
+
+    def map_rom(self, start, end, cache_dir=None):
+        # start..end-1 (whole pages) holds a ROM: writes to it are dropped, and blocks translated
+        # from it are saved to the block cache on exit and loaded back the next time the same ROM is mapped
+        if start & 0xFF or end & 0xFF:
+            raise ValueError(f"ROMs are mapped in whole pages, not {start:04X}-{end - 1:04X}")
+        for page in range(start >> 8, end >> 8):
+            self.write_pages[page] = rom_write
+        self.memory_map_changed()
+
+        region = RomRegion(self.ram_64KB, start, end, cache_dir or BLOCK_CACHE_DIR)
+        self.rom_regions.append(region)
+        save_on_exit(region)
+        return region
+
+    def map_io(self, start, end, read=None, write=None):
+        # Send accesses to start..end-1 (whole pages) to a device: read(addr) returns the byte read,
+        # write(addr, value) takes the byte written. Leaving one out keeps that side in ram_64KB.
+        if start & 0xFF or end & 0xFF:
+            raise ValueError(f"I/O is mapped in whole pages, not {start:04X}-{end - 1:04X}")
+        for page in range(start >> 8, end >> 8):
+            self.read_pages[page] = read
+            self.write_pages[page] = write
+        self.memory_map_changed()
+
+    def memory_map_changed(self):
+        # The handlers and translated blocks are made for one memory map, so make them again
+        pages = self.read_pages + self.write_pages
+        if self.dirty_tracking or any(page is not None for page in pages):
+            self.bus_layout = bytes(page is None for page in pages) + bytes([self.dirty_tracking])
+        else:
+            self.bus_layout = None
+        self.build_opcode_table()
+
+        if self.blocks is not None:
+            self.blocks.clear()
+            self.step_blocks.clear()
+            self.code_bytes = bytearray(0x10000)
+
+    def take_dirty_pages(self):
+        # Pages stored to since the last call (a list of page numbers, needs track_dirty), and clear them
+        dirty_pages = self.dirty_pages
+        pages = []
+        page = dirty_pages.find(1)
+        while page != -1:
+            pages.append(page)
+            page = dirty_pages.find(1, page + 1)
+        dirty_pages[:] = bytes(256)
+        return pages
+
+    def save_code_cache(self):
+        # Write out the ROM blocks translated so far (also done on exit)
+        for region in self.rom_regions:
+            region.save()
+
+    def fuse(self, sequences):
+        # Run these opcode sequences, e.g. (0xCA, 0xD0) for DEX; BNE, through fused handlers.
+        # Sequences that can't be fused (BRK, or a jump/branch before the last instruction) are left out.
+        if self.lazy_flags:
+            raise ValueError("fused handlers keep N/Z in sr, they can't be used with lazy_flags")
+        if self.blocks is not None:
+            raise ValueError("fused handlers are in the handler table, translate_blocks runs blocks instead")
+
+        fusions = []
+        for sequence in sequences:
+            sequence = tuple(sequence)
+            if sequence not in fusions and can_fuse(sequence):
+                fusions.append(sequence)
+
+        self.fusions = fusions
+        self.fusion_counts = [0] * len(fusions)
+        self.build_opcode_table()
+
+    def profile_sequences(self, cycle_budget):
+        # run() for cycle_budget cycles (events and interrupts as usual), counting the opcode pairs
+        # and triples executed. Every handler is wrapped in one that counts it for the run.
+        # Returns {sequence: count}
+        if self.blocks is not None:
+            raise ValueError("profiling counts handler table calls, translate_blocks runs blocks instead")
+
+        counts = {}
+        recent = [None, None] #The two opcodes before this one
+
+        def counting(opcode, handler):
+            def counted(cpu, pc, operand_lower, operand_higher):
+                first, previous = recent
+                if previous is not None:
+                    if first is not None:
+                        triple = (first, previous, opcode)
+                        counts[triple] = counts.get(triple, 0) + 1
+                    pair = (previous, opcode)
+                    counts[pair] = counts.get(pair, 0) + 1
+                recent[0] = previous
+                recent[1] = opcode
+                return handler(cpu, pc, operand_lower, operand_higher)
+            return counted
+
+        table = self.opcode_table
+        self.opcode_table = [counting(opcode, handler) for opcode, handler in enumerate(table)]
+        try:
+            self.run(cycle_budget)
+        finally:
+            self.opcode_table = table
+
+        return counts
+
+    def fuse_hot_sequences(self, cycle_budget, max_fusions=16):
+        # Profile the program for cycle_budget cycles and fuse its most frequent sequences
+        counts = self.profile_sequences(cycle_budget)
+        hot = sorted(counts, key=counts.get, reverse=True)
+        self.fuse([sequence for sequence in hot if can_fuse(sequence)][:max_fusions])
+
+    def fusion_report(self):
+        # Which fused sequences ran and how often, most used first
+        fired = sorted(zip(self.fusion_counts, self.fusions), reverse=True)
+        return "\n".join(f"{fusion_name(sequence):40} {count:12,}" for count, sequence in fired if count)
+
+    def translate(self, pc, blocks, max_instructions=None):
+        # Compile the block starting at pc into blocks
+        max_instructions = max_instructions or MAX_BLOCK_INSTRUCTIONS
+        for region in self.rom_regions:
+            if region.start <= pc < region.end:
+                block = region.block(self.ram_64KB, pc, max_instructions, self.bus_layout)
+                break
+        else:
+            block = translate_block(self.ram_64KB, pc, max_instructions, self.bus_layout)
+        code_bytes = self.code_bytes
+        for addr in range(block.start, block.end):
+            code_bytes[addr] += 1
+        blocks[pc] = block
+        return block
+
+    def invalidate_code(self, addr):
+        # addr was written: drop every translated block that covers it
+        code_bytes = self.code_bytes
+        for blocks in (self.blocks, self.step_blocks):
+            for start in range(max(addr - MAX_BLOCK_BYTES + 1, 0), addr + 1):
+                block = blocks.get(start)
+                if block is not None and addr < block.end:
+                    del blocks[start]
+                    for covered in range(block.start, block.end):
+                        code_bytes[covered] -= 1
+
+    def step(self):
+        # Execute one instruction (none while jammed)
+        if self.jammed:
+            return
+        pc = self.pc
+        if self.step_blocks is None:
+            if pc >= 0xFFFD:
+                self.pc = self.execute_wrapped(pc)
+                return
+            ram_64KB = self.ram_64KB
+            opcode = ram_64KB[pc]
+            self.cycle_count += OPCODE_CYCLES[opcode]
+            length = OPCODE_LENGTHS[opcode]
+            if length == 1:
+                self.pc = self.opcode_table[opcode](self, pc, 0, 0)
+            elif length == 2:
+                self.pc = self.opcode_table[opcode](self, pc, ram_64KB[pc + 1], 0)
+            else:
+                self.pc = self.opcode_table[opcode](self, pc, ram_64KB[pc + 1], ram_64KB[pc + 2])
+        else:
+            block = self.step_blocks.get(pc)
+            if block is None:
+                pc &= 0xFFFF
+                block = self.step_blocks.get(pc)
+                if block is None:
+                    block = self.translate(pc, self.step_blocks, 1)
+            self.pc = block(self)
+
+        if self.events and self.events[0][0] <= self.cycle_count:
+            self.fire_events()
+        if self.nmi_latched or self.irq:
+            self.check_interrupts()
+
+    def run(self, cycle_budget):
+        # Execute instructions until cycle_budget cycles have passed or a stop is requested
+        # (BRK, an event calling request_stop()). Instructions run in batches up to the next
+        # scheduled event, with nothing checked in between: pc and the tables stay in locals
+        # for the whole batch and pc is only written back when it ends. Then the events that
+        # are due fire and any interrupt is taken.
+        # Operands are only read as far as OPCODE_LENGTHS says, so implied instructions read none;
+        # an instruction running into the end of memory goes through execute_wrapped().
+        # Returns the number of cycles actually executed.
+        start = self.cycle_count
+        self.run_end = start + cycle_budget
+        self.halt = False
+
+        ram_64KB = self.ram_64KB
+        table = self.opcode_table
+        cycles = OPCODE_CYCLES
+        lengths = OPCODE_LENGTHS
+        events = self.events
+        pc = self.pc
+        blocks = self.blocks
+        try:
+            while self.cycle_count < self.run_end:
+                if events and events[0][0] < self.run_end:
+                    self.cycle_limit = events[0][0]
+                else:
+                    self.cycle_limit = self.run_end
+
+                if self.jammed:
+                    # Nothing runs until reset(), the cycles just go by
+                    if self.cycle_count < self.cycle_limit:
+                        self.cycle_count = self.cycle_limit
+                elif blocks is None:
+                    while self.cycle_count < self.cycle_limit:
+                        if pc >= 0xFFFD:
+                            pc = self.execute_wrapped(pc)
+                            continue
+                        opcode = ram_64KB[pc]
+                        self.cycle_count += cycles[opcode]
+                        length = lengths[opcode]
+                        if length == 1:
+                            pc = table[opcode](self, pc, 0, 0)
+                        elif length == 2:
+                            pc = table[opcode](self, pc, ram_64KB[pc + 1], 0)
+                        else:
+                            pc = table[opcode](self, pc, ram_64KB[pc + 1], ram_64KB[pc + 2])
+                else:
+                    # A whole block runs before the limit is checked again
+                    while self.cycle_count < self.cycle_limit:
+                        block = blocks.get(pc)
+                        if block is None:
+                            # Blocks are only made for $0000-$FFFF (pc may have been set past the end)
+                            pc &= 0xFFFF
+                            block = blocks.get(pc)
+                            if block is None:
+                                block = self.translate(pc, blocks)
+                        pc = block(self)
+
+                self.pc = pc
+                if events and events[0][0] <= self.cycle_count:
+                    self.fire_events()
+                if self.nmi_latched or self.irq:
+                    self.check_interrupts()
+                pc = self.pc
+        finally:
+            self.pc = pc
+
+        return self.cycle_count - start
+
+    def execute_wrapped(self, pc):
+        # Execute the instruction at pc the slow way, for when it runs off the end of memory:
+        # pc and the operand reads wrap around to $0000
+        pc &= 0xFFFF
+        ram_64KB = self.ram_64KB
+        opcode = ram_64KB[pc]
+        self.cycle_count += OPCODE_CYCLES[opcode]
+        pc = self.opcode_table[opcode](self, pc, ram_64KB[(pc + 1) & 0xFFFF], ram_64KB[(pc + 2) & 0xFFFF])
+        return pc & 0xFFFF
+
+    def request_stop(self):
+        # Make run() return after the instruction currently executing
+        self.cycle_limit = self.cycle_count
+        self.run_end = self.cycle_count
+
+
+
+#Legal Opcodes
+
+def adc_immediate(cpu, pc, operand_lower, operand_higher): #ADC Immediate
+    ac = cpu.ac
+    sr = cpu.sr
+
+    old_ac = ac
+
+    if sr & 0x01:
+        cin = 1
+    else:
+        cin = 0
+
+    
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_ADC[(cin << 16) | (ac << 8) | operand_lower]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac + operand_lower + cin
+
+        #Carry Flag (C)
+        if result > 0xFF:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if (~(old_ac ^ operand_lower) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def adc_zero_page(cpu, pc, operand_lower, operand_higher): #ADC Zero Page
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    old_ac = ac
+
+    if sr & 0x01:
+        cin = 1
+    else:
+        cin = 0
+
+    value = ram_64KB[operand_lower]
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_ADC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac + value + cin
+
+        #Carry Flag (C)
+        if result > 0xFF:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def adc_zero_page_x(cpu, pc, operand_lower, operand_higher): #ADC Zero Page, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    old_ac = ac
+
+    if sr & 0x01:
+        cin = 1
+    else:
+        cin = 0
+
+    addr = (operand_lower + x) & 0xFF
+    value = ram_64KB[addr]
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_ADC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac + value + cin
+
+        #Carry Flag (C)
+        if result > 0xFF:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def adc_absolute(cpu, pc, operand_lower, operand_higher): #ADC Absolute
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    old_ac = ac
+
+    if sr & 0x01:
+        cin = 1
+    else:
+        cin = 0
+
+    addr = (operand_higher << 8) | operand_lower
+    value = ram_64KB[addr]
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_ADC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac + value + cin
+
+        #Carry Flag (C)
+        if result > 0xFF:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def adc_absolute_x(cpu, pc, operand_lower, operand_higher): #ADC Absolute, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    old_ac = ac
+
+    if sr & 0x01:
+        cin = 1
+    else:
+        cin = 0
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + x) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    value = ram_64KB[addr]
+
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_ADC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac + value + cin
+
+        #Carry Flag (C)
+        if result > 0xFF:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def adc_absolute_y(cpu, pc, operand_lower, operand_higher): #ADC Absolute, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+    sr = cpu.sr
+
+    old_ac = ac
+
+    if sr & 0x01:
+        cin = 1
+    else:
+        cin = 0
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + y) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    value = ram_64KB[addr]
+    
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_ADC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac + value + cin
+
+        #Carry Flag (C)
+        if result > 0xFF:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def adc_indirect_x(cpu, pc, operand_lower, operand_higher): #ADC Indirect, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    old_ac = ac
+
+    if sr & 0x01:
+        cin = 1
+    else:
+        cin = 0
+
+    zp = (operand_lower + x) & 0xFF
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    addr = (high << 8) | low
+    value = ram_64KB[addr]
+    
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_ADC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac + value + cin
+
+        #Carry Flag (C)
+        if result > 0xFF:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def adc_indirect_y(cpu, pc, operand_lower, operand_higher): #ADC Indirect, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+    sr = cpu.sr
+
+    old_ac = ac
+
+    if sr & 0x01:
+        cin = 1
+    else:
+        cin = 0
+
+    zp = operand_lower
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    base = (high << 8) | low
+    addr = (base + y) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    value = ram_64KB[addr]
+    
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_ADC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac + value + cin
+
+        #Carry Flag (C)
+        if result > 0xFF:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def and_immediate(cpu, pc, operand_lower, operand_higher): #AND Immediate
+    ac = cpu.ac
+    sr = cpu.sr
+
+    result = ac & operand_lower
+
+    sr = (sr & 0x7D) | NZ_FLAGS[result]
+
+    ac = result
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def and_zero_page(cpu, pc, operand_lower, operand_higher): #AND Zero Page
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    value = ram_64KB[operand_lower]
+    result = ac & value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[result]
+
+    ac = result
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def and_zero_page_x(cpu, pc, operand_lower, operand_higher): #AND Zero Page, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    addr = (operand_lower + x) & 0xFF
+    value = ram_64KB[addr]
+    result = ac & value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[result]
+
+    ac = result
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def and_absolute(cpu, pc, operand_lower, operand_higher): #AND Absolute
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    addr = (operand_higher << 8) | operand_lower
+    value = ram_64KB[addr]
+    result = ac & value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[result]
+
+    ac = result
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def and_absolute_x(cpu, pc, operand_lower, operand_higher): #AND Absolute, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + x) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    value = ram_64KB[addr]
+    result = ac & value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[result]
+
+    ac = result
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def and_absolute_y(cpu, pc, operand_lower, operand_higher): #AND Absolute, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + y) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    value = ram_64KB[addr]
+    result = ac & value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[result]
+
+    ac = result
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def and_indirect_x(cpu, pc, operand_lower, operand_higher): #AND Indirect, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    zp = (operand_lower + x) & 0xFF
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    addr = (high << 8) | low
+    value = ram_64KB[addr]
+
+    result = ac & value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[result]
+
+    ac = result
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def and_indirect_y(cpu, pc, operand_lower, operand_higher): #AND Indirect, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+    sr = cpu.sr
+
+    zp = operand_lower
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    base = (high << 8) | low
+    addr = (base + y) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    value = ram_64KB[addr]
+    
+    result = ac & value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[result]
+
+    ac = result
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def asl_accumulator(cpu, pc, operand_lower, operand_higher): #ASL Accumulator
+    ac = cpu.ac
+    sr = cpu.sr
+
+    #Carry Flag
+    if ac & 0x80:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    ac = (ac << 1) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 1
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def asl_zero_page(cpu, pc, operand_lower, operand_higher): #ASL Zero Page
+    ram_64KB = cpu.ram_64KB
+    sr = cpu.sr
+
+    value = ram_64KB[operand_lower]
+
+    #Carry Flag
+    if value & 0x80:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = (value << 1) & 0xFF
+    ram_64KB[operand_lower] = value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def asl_zero_page_x(cpu, pc, operand_lower, operand_higher): #ASL Zero Page, X
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+    sr = cpu.sr
+
+    addr = (operand_lower + x) & 0xFF
+    value = ram_64KB[addr]
+
+    #Carry Flag
+    if value & 0x80:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = (value << 1) & 0xFF
+    ram_64KB[addr] = value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def asl_absolute(cpu, pc, operand_lower, operand_higher): #ASL Absolute
+    ram_64KB = cpu.ram_64KB
+    sr = cpu.sr
+
+    addr = (operand_higher << 8) | operand_lower
+    value = ram_64KB[addr]
+
+    #Carry Flag
+    if value & 0x80:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = (value << 1) & 0xFF
+    ram_64KB[addr] = value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 3
+
+    cpu.sr = sr
+    return pc
+
+
+def asl_absolute_x(cpu, pc, operand_lower, operand_higher): #ASL Absolute, X
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + x) & 0xFFFF
+    value = ram_64KB[addr]
+
+    #Carry Flag
+    if value & 0x80:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = (value << 1) & 0xFF
+    ram_64KB[addr] = value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 3
+
+    cpu.sr = sr
+    return pc
+
+
+def bit_zero_page(cpu, pc, operand_lower, operand_higher): #BIT Zero Page
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    addr = operand_lower
+    value = ram_64KB[addr]
+
+    # N and V are copied from bits 7 and 6 of memory, Z comes from A & M
+    sr = (sr & 0x3D) | (value & 0xC0) | (NZ_FLAGS[ac & value] & 0x02)
+
+
+    
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def bit_absolute(cpu, pc, operand_lower, operand_higher): #BIT Absolute
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    addr = (operand_higher << 8) | operand_lower
+    value = ram_64KB[addr]
+
+    # N and V are copied from bits 7 and 6 of memory, Z comes from A & M
+    sr = (sr & 0x3D) | (value & 0xC0) | (NZ_FLAGS[ac & value] & 0x02)
+
+    
+
+    pc += 3
+
+    cpu.sr = sr
+    return pc
+
+
+#Branch Instructions
+
+def bpl(cpu, pc, operand_lower, operand_higher): #BPL (Branch on Plus)
+    sr = cpu.sr
+
+    offset = operand_lower
+    if offset & 0x80:
+        offset -= 0x100
+
+    pc += 2
+    if not (sr & 0x80):
+        target = (pc + offset) & 0xFFFF
+
+        #Branch Taken (+1 cycle, +1 more into another page)
+        cpu.cycle_count += 1 + (((pc ^ target) >> 8) & 1)
+        pc = target
+
+    return pc
+
+
+def bmi(cpu, pc, operand_lower, operand_higher): #BMI (Branch on Minus)
+    sr = cpu.sr
+
+    offset = operand_lower
+    if offset & 0x80:
+        offset -= 0x100
+
+    pc += 2
+    if sr & 0x80:
+        target = (pc + offset) & 0xFFFF
+
+        #Branch Taken (+1 cycle, +1 more into another page)
+        cpu.cycle_count += 1 + (((pc ^ target) >> 8) & 1)
+        pc = target
+
+    return pc
+
+
+def bvc(cpu, pc, operand_lower, operand_higher): #BVC (Branch on Overflow Clear)
+    sr = cpu.sr
+
+    offset = operand_lower
+    if offset & 0x80:
+        offset -= 0x100
+
+    pc += 2
+    if not (sr & 0x40):
+        target = (pc + offset) & 0xFFFF
+
+        #Branch Taken (+1 cycle, +1 more into another page)
+        cpu.cycle_count += 1 + (((pc ^ target) >> 8) & 1)
+        pc = target
+
+    return pc
+
+
+def bvs(cpu, pc, operand_lower, operand_higher): #BVS (Branch on Overflow Set)
+    sr = cpu.sr
+
+    offset = operand_lower
+    if offset & 0x80:
+        offset -= 0x100
+
+    pc += 2
+    if sr & 0x40:
+        target = (pc + offset) & 0xFFFF
+
+        #Branch Taken (+1 cycle, +1 more into another page)
+        cpu.cycle_count += 1 + (((pc ^ target) >> 8) & 1)
+        pc = target
+
+    return pc
+
+
+def bcc(cpu, pc, operand_lower, operand_higher): #BCC (Branch on Carry Clear)
+    sr = cpu.sr
+
+    offset = operand_lower
+    if offset & 0x80:
+        offset -= 0x100
+
+    pc += 2
+    if not (sr & 0x01):
+        target = (pc + offset) & 0xFFFF
+
+        #Branch Taken (+1 cycle, +1 more into another page)
+        cpu.cycle_count += 1 + (((pc ^ target) >> 8) & 1)
+        pc = target
+
+    return pc
+
+
+def bcs(cpu, pc, operand_lower, operand_higher): #BCS (Branch on Carry Set)
+    sr = cpu.sr
+
+    offset = operand_lower
+    if offset & 0x80:
+        offset -= 0x100
+
+    pc += 2
+    if sr & 0x01:
+        target = (pc + offset) & 0xFFFF
+
+        #Branch Taken (+1 cycle, +1 more into another page)
+        cpu.cycle_count += 1 + (((pc ^ target) >> 8) & 1)
+        pc = target
+
+    return pc
+
+
+def bne(cpu, pc, operand_lower, operand_higher): #BNE (Branch Not Equal)
+    sr = cpu.sr
+
+    offset = operand_lower
+    if offset & 0x80:
+        offset -= 0x100
+
+    pc += 2
+    if not (sr & 0x02):
+        target = (pc + offset) & 0xFFFF
+
+        #Branch Taken (+1 cycle, +1 more into another page)
+        cpu.cycle_count += 1 + (((pc ^ target) >> 8) & 1)
+        pc = target
+
+    return pc
+
+
+def beq(cpu, pc, operand_lower, operand_higher): #BEQ (Branch on Equal)
+    sr = cpu.sr
+
+    offset = operand_lower
+    if offset & 0x80:
+        offset -= 0x100
+
+    pc += 2
+    if sr & 0x02:
+        target = (pc + offset) & 0xFFFF
+
+        #Branch Taken (+1 cycle, +1 more into another page)
+        cpu.cycle_count += 1 + (((pc ^ target) >> 8) & 1)
+        pc = target
+
+    return pc
+
+
+def brk(cpu, pc, operand_lower, operand_higher): #BRK Implied
+    log.info("BRK at PC %04X", pc)
+
+    # Increment PC first
+    
+    # Then push PC & flags, then vector
+    pc = cpu.take_interrupt(pc, vector=0xFFFE, break_flag=True, pc_offset=2)
+
+
+    cpu.halt = True
+    cpu.request_stop()
+    return pc
+
+
+
+def cmp_immediate(cpu, pc, operand_lower, operand_higher): #CMP Immediate
+    ac = cpu.ac
+    sr = cpu.sr
+
+    value = operand_lower & 0xFF
+    ac8 = ac & 0xFF        # ensure 8-bit value
+
+    temp = (ac8 - value) & 0xFF
+
+    # Carry flag (set if A >= M)
+    if ac8 >= value:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    # Zero & Negative
+    sr = (sr & 0x7D) | NZ_FLAGS[temp]
+
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def cmp_zero_page(cpu, pc, operand_lower, operand_higher): #CMP Zero Page
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    value = ram_64KB[operand_lower]
+    temp = (ac - value) & 0xFF
+
+    # Carry
+    if ac >= value:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    # Zero & Negative
+    sr = (sr & 0x7D) | NZ_FLAGS[temp]
+
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def cmp_zero_page_x(cpu, pc, operand_lower, operand_higher): #CMP Zero Page, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    addr = (operand_lower + x) & 0xFF
+    value = ram_64KB[addr]
+    temp = (ac - value) & 0xFF
+
+    # Carry
+    if ac >= value:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    # Zero & Negative
+    sr = (sr & 0x7D) | NZ_FLAGS[temp]
+
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def cmp_absolute(cpu, pc, operand_lower, operand_higher): #CMP Absolute
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    addr = (operand_higher << 8) | operand_lower
+    value = ram_64KB[addr]
+    temp = (ac - value) & 0xFF
+
+            # Carry
+    if ac >= value:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    # Zero & Negative
+    sr = (sr & 0x7D) | NZ_FLAGS[temp]
+    pc += 3
+
+    cpu.sr = sr
+    return pc
+
+
+def cmp_absolute_x(cpu, pc, operand_lower, operand_higher): #CMP Absolute, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + x) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    value = ram_64KB[addr]
+    temp = (ac - value) & 0xFF
+
+    # Carry
+    if ac >= value:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    # Zero & Negative
+    sr = (sr & 0x7D) | NZ_FLAGS[temp]
+
+    pc += 3
+
+    cpu.sr = sr
+    return pc
+
+
+def cmp_absolute_y(cpu, pc, operand_lower, operand_higher): #CMP Absolute, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + y) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    value = ram_64KB[addr]
+    temp = (ac - value) & 0xFF
+
+    # Carry
+    if ac >= value:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    # Zero & Negative
+    sr = (sr & 0x7D) | NZ_FLAGS[temp]
+
+    pc += 3
+
+    cpu.sr = sr
+    return pc
+
+
+def cmp_indirect_x(cpu, pc, operand_lower, operand_higher): #CMP Indirect, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    zp = (operand_lower + x) & 0xFF
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    addr = (high << 8) | low
+    value = ram_64KB[addr]
+    temp = (ac - value) & 0xFF
+
+    # Carry
+    if ac >= value:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    # Zero & Negative
+    sr = (sr & 0x7D) | NZ_FLAGS[temp]
+
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def cmp_indirect_y(cpu, pc, operand_lower, operand_higher): #CMP Indirect, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+    sr = cpu.sr
+
+    zp = operand_lower
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    base = (high << 8) | low
+    addr = (base + y) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    value = ram_64KB[addr]
+    temp = (ac - value) & 0xFF
+
+    # Carry
+    if ac >= value:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    # Zero & Negative
+    sr = (sr & 0x7D) | NZ_FLAGS[temp]
+
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def cpx_immediate(cpu, pc, operand_lower, operand_higher): #CPX Immediate
+    x = cpu.x
+    sr = cpu.sr
+
+    # Carry: set if X >= value
+    if x >= operand_lower:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = (x - operand_lower) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def cpx_zero_page(cpu, pc, operand_lower, operand_higher): #CPX Zero Page
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+    sr = cpu.sr
+
+    # Carry: set if X >= value
+
+    addr = ram_64KB[operand_lower]
+
+    if x >= addr:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+    
+    value = (x - addr) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def cpx_absolute(cpu, pc, operand_lower, operand_higher): #CPX Absolute
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+    sr = cpu.sr
+
+    # Carry: set if X >= value
+
+    addr = (operand_higher << 8) | operand_lower
+    value = ram_64KB[addr]
+
+    if x >= value:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+    
+    result = (x - value) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[result]
+
+    pc += 3
+
+    cpu.sr = sr
+    return pc
+
+
+def cpy_immediate(cpu, pc, operand_lower, operand_higher): #CPY Immediate
+    y = cpu.y
+    sr = cpu.sr
+
+    # Carry: set if Y >= value
+    if y >= operand_lower:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = (y - operand_lower) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def cpy_zero_page(cpu, pc, operand_lower, operand_higher): #CPY Zero Page
+    ram_64KB = cpu.ram_64KB
+    y = cpu.y
+    sr = cpu.sr
+
+    # Carry: set if Y >= value
+
+    addr = ram_64KB[operand_lower]
+
+    if y >= addr:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+    
+    value = (y - addr) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def cpy_absolute(cpu, pc, operand_lower, operand_higher): #CPY Absolute
+    ram_64KB = cpu.ram_64KB
+    y = cpu.y
+    sr = cpu.sr
+
+    # Carry: set if Y >= value
+
+    addr = (operand_higher << 8) | operand_lower
+    value = ram_64KB[addr]
+
+    if y >= value:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+    
+    result = (y - value) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[result]
+
+    pc += 3
+
+    cpu.sr = sr
+    return pc
+
+
+def dec_zero_page(cpu, pc, operand_lower, operand_higher): #DEC Zero Page
+    ram_64KB = cpu.ram_64KB
+    sr = cpu.sr
+
+    addr = operand_lower
+    value = (ram_64KB[addr] - 1) & 0xFF
+    ram_64KB[addr] = value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def dec_zero_page_x(cpu, pc, operand_lower, operand_higher): #DEC Zero Page, X
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+    sr = cpu.sr
+
+    addr = (operand_lower + x) & 0xFF
+    value = (ram_64KB[addr] - 1) & 0xFF
+    ram_64KB[addr] = value
+    
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def dec_absolute(cpu, pc, operand_lower, operand_higher): #DEC Absolute
+    ram_64KB = cpu.ram_64KB
+    sr = cpu.sr
+
+    addr = (operand_higher << 8) | operand_lower
+    value = (ram_64KB[addr] - 1) & 0xFF
+    ram_64KB[addr] = value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 3
+
+    cpu.sr = sr
+    return pc
+
+
+def dec_absolute_x(cpu, pc, operand_lower, operand_higher): #DEC Absolute, X
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+    sr = cpu.sr
+
+    addr = ((operand_higher << 8) | operand_lower) + x
+    addr &= 0xFFFF
+
+    value = (ram_64KB[addr] - 1) & 0xFF
+    ram_64KB[addr] = value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 3
+
+    cpu.sr = sr
+    return pc
+
+
+def eor_immediate(cpu, pc, operand_lower, operand_higher): #EOR Immediate
+    ac = cpu.ac
+    sr = cpu.sr
+
+    ac = (ac ^ operand_lower) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def eor_zero_page(cpu, pc, operand_lower, operand_higher): #EOR Zero Page
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    addr = operand_lower
+    value = ram_64KB[addr]
+    ac = (ac ^ value) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def eor_zero_page_x(cpu, pc, operand_lower, operand_higher): #EOR Zero Page, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    addr = (operand_lower + x) & 0xFF
+    value = ram_64KB[addr]
+    ac = (ac ^ value) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def eor_absolute(cpu, pc, operand_lower, operand_higher): #EOR Absolute
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    addr = (operand_higher << 8) | operand_lower
+    value = ram_64KB[addr]
+    ac = (ac ^ value) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def eor_absolute_x(cpu, pc, operand_lower, operand_higher): #EOR Absolute, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + x) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    value = ram_64KB[addr]
+    ac = (ac ^ value) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def eor_absolute_y(cpu, pc, operand_lower, operand_higher): #EOR Absolute, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + y) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    value = ram_64KB[addr]
+    ac = (ac ^ value) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def eor_indirect_x(cpu, pc, operand_lower, operand_higher): #EOR Indirect, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    zp = (operand_lower + x) & 0xFF
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    addr = (high << 8) | low
+    value = ram_64KB[addr]
+    ac = (ac ^ value) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def eor_indirect_y(cpu, pc, operand_lower, operand_higher): #EOR Indirect, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+    sr = cpu.sr
+
+    zp = operand_lower
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    base = (high << 8) | low
+    addr = (base + y) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    value = ram_64KB[addr]
+    ac = (ac ^ value) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+#Flag (Processor Status) Instructions
+
+def clc(cpu, pc, operand_lower, operand_higher): #CLC (Clear Carry)
+    sr = cpu.sr
+
+    sr &= ~0x01
+    pc += 1
+
+    cpu.sr = sr
+    return pc
+
+
+def sec(cpu, pc, operand_lower, operand_higher): #SEC (Set Carry)
+    sr = cpu.sr
+
+    sr |= 0x01
+    pc += 1
+
+    cpu.sr = sr
+    return pc
+
+
+def cli(cpu, pc, operand_lower, operand_higher): #CLI (Clear Interrupt)
+    sr = cpu.sr
+
+    sr &= ~0x04
+    pc += 1
+
+    #IRQ held while I was set: end the batch so it is taken now
+    if cpu.irq:
+        cpu.cycle_limit = cpu.cycle_count
+
+    cpu.sr = sr
+    return pc
+
+
+def sei(cpu, pc, operand_lower, operand_higher): #SEI (Set Interrupt)
+    sr = cpu.sr
+
+    sr |= 0x04
+    pc += 1
+
+    cpu.sr = sr
+    return pc
+
+
+def clv(cpu, pc, operand_lower, operand_higher): #CLV (Clear Overflow)
+    sr = cpu.sr
+
+    sr &= ~0x40
+    pc += 1
+
+    cpu.sr = sr
+    return pc
+
+
+def cld(cpu, pc, operand_lower, operand_higher): #CLD (Clear Decimal)
+    sr = cpu.sr
+
+    sr &= ~0x08
+    pc += 1
+
+    cpu.sr = sr
+    return pc
+
+
+def sed(cpu, pc, operand_lower, operand_higher): #SED (Set Decimal)
+    sr = cpu.sr
+
+    sr |= 0x08
+    pc += 1
+
+    cpu.sr = sr
+    return pc
+
+
+def inc_zero_page(cpu, pc, operand_lower, operand_higher): #INC Zero Page
+    ram_64KB = cpu.ram_64KB
+    sr = cpu.sr
+
+    addr = operand_lower
+    value = (ram_64KB[addr] + 1) & 0xFF
+    ram_64KB[addr] = value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def inc_zero_page_x(cpu, pc, operand_lower, operand_higher): #INC Zero Page, X
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+    sr = cpu.sr
+
+    addr = (operand_lower + x) & 0xFF
+    value = (ram_64KB[addr] + 1) & 0xFF
+    ram_64KB[addr] = value
+    
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def inc_absolute(cpu, pc, operand_lower, operand_higher): #INC Absolute
+    ram_64KB = cpu.ram_64KB
+    sr = cpu.sr
+
+    addr = (operand_higher << 8) | operand_lower
+    value = (ram_64KB[addr] + 1) & 0xFF
+    ram_64KB[addr] = value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 3
+
+    cpu.sr = sr
+    return pc
+
+
+def inc_absolute_x(cpu, pc, operand_lower, operand_higher): #INC Absolute, X
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+    sr = cpu.sr
+
+    addr = ((operand_higher << 8) | operand_lower) + x
+    addr &= 0xFFFF
+
+    value = (ram_64KB[addr] + 1) & 0xFF
+    ram_64KB[addr] = value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 3
+
+    cpu.sr = sr
+    return pc
+
+
+def jmp_absolute(cpu, pc, operand_lower, operand_higher): #JMP Absolute
+    pc = (operand_higher << 8) | operand_lower
+
+    return pc
+
+
+def jmp_indirect(cpu, pc, operand_lower, operand_higher): #JMP Indirect
+    ram_64KB = cpu.ram_64KB
+
+    ptr = (operand_higher << 8) | operand_lower
+
+    low = ram_64KB[ptr]
+
+    # 6502 hardware bug emulation
+    if (ptr & 0x00FF) == 0x00FF:
+        high = ram_64KB[ptr & 0xFF00]
+    else:
+        high = ram_64KB[ptr + 1]
+
+    pc = (high << 8) | low
+
+    return pc
+
+
+def jsr_absolute(cpu, pc, operand_lower, operand_higher): #JSR Absolute
+    ram_64KB = cpu.ram_64KB
+    sp = cpu.sp
+
+    target = (operand_higher << 8) | operand_lower
+    return_addr = pc + 2
+
+    ram_64KB[0x0100 + sp] = (return_addr >> 8) & 0xFF
+    sp = (sp - 1) & 0xFF
+
+    ram_64KB[0x0100 + sp] = return_addr & 0xFF
+    sp = (sp - 1) & 0xFF
+
+    pc = target
+
+    cpu.sp = sp
+    return pc
+
+
+def lda_immediate(cpu, pc, operand_lower, operand_higher): #LDA Immediate
+    sr = cpu.sr
+
+    ac = operand_lower
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def lda_zero_page(cpu, pc, operand_lower, operand_higher): #LDA Zero Page
+    ram_64KB = cpu.ram_64KB
+    sr = cpu.sr
+
+    ac = ram_64KB[operand_lower]
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def lda_zero_page_x(cpu, pc, operand_lower, operand_higher): #LDA Zero Page, X
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+    sr = cpu.sr
+
+    addr = (operand_lower + x) & 0xFF
+    ac = ram_64KB[addr]
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def lda_absolute(cpu, pc, operand_lower, operand_higher): #LDA Absolute
+    ram_64KB = cpu.ram_64KB
+    sr = cpu.sr
+
+    addr = (operand_higher << 8) | operand_lower
+    ac = ram_64KB[addr]
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def lda_absolute_x(cpu, pc, operand_lower, operand_higher): #LDA Absolute, X
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + x) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    ac = ram_64KB[addr]
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def lda_absolute_y(cpu, pc, operand_lower, operand_higher): #LDA Absolute, Y
+    ram_64KB = cpu.ram_64KB
+    y = cpu.y
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + y) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    ac = ram_64KB[addr]
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def lda_indirect_x(cpu, pc, operand_lower, operand_higher): #LDA Indirect, X
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+    sr = cpu.sr
+
+    zp_addr = (operand_lower + x) & 0xFF
+
+    low_byte = ram_64KB[zp_addr]
+    high_byte = ram_64KB[(zp_addr + 1) & 0xFF]
+
+    base_addr = (high_byte << 8) | low_byte
+
+    ac = ram_64KB[base_addr]
+
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def lda_indirect_y(cpu, pc, operand_lower, operand_higher): #LDA Indirect, Y
+    ram_64KB = cpu.ram_64KB
+    y = cpu.y
+    sr = cpu.sr
+
+    zp_addr = operand_lower
+
+    low_byte = ram_64KB[zp_addr]
+    high_byte = ram_64KB[(zp_addr + 1) & 0xFF]
+
+    base_addr = (high_byte << 8) | low_byte
+    addr = (base_addr + y) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base_addr ^ addr) >> 8) & 1
+
+    ac = ram_64KB[addr]
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def ldx_immediate(cpu, pc, operand_lower, operand_higher): #LDX Immediate
+    sr = cpu.sr
+
+    x = operand_lower
+
+    sr = (sr & 0x7D) | NZ_FLAGS[x]
+
+    pc += 2
+
+    cpu.x = x
+    cpu.sr = sr
+    return pc
+
+
+def ldx_zero_page(cpu, pc, operand_lower, operand_higher): #LDX Zero Page
+    ram_64KB = cpu.ram_64KB
+    sr = cpu.sr
+
+    x = ram_64KB[operand_lower]
+
+    sr = (sr & 0x7D) | NZ_FLAGS[x]
+
+    pc += 2
+
+    cpu.x = x
+    cpu.sr = sr
+    return pc
+
+
+def ldx_zero_page_y(cpu, pc, operand_lower, operand_higher): #LDX Zero Page, Y
+    ram_64KB = cpu.ram_64KB
+    y = cpu.y
+    sr = cpu.sr
+
+    addr = (operand_lower + y) & 0xFF
+    x = ram_64KB[addr]
+
+    sr = (sr & 0x7D) | NZ_FLAGS[x]
+
+    pc += 2
+
+    cpu.x = x
+    cpu.sr = sr
+    return pc
+
+
+def ldx_absolute(cpu, pc, operand_lower, operand_higher): #LDX Absolute
+    ram_64KB = cpu.ram_64KB
+    sr = cpu.sr
+
+    addr = (operand_higher << 8) | operand_lower
+    x = ram_64KB[addr]
+
+    sr = (sr & 0x7D) | NZ_FLAGS[x]
+
+    pc += 3
+
+    cpu.x = x
+    cpu.sr = sr
+    return pc
+
+
+def ldx_absolute_y(cpu, pc, operand_lower, operand_higher): #LDX Absolute, Y
+    ram_64KB = cpu.ram_64KB
+    y = cpu.y
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + y) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    x = ram_64KB[addr]
+
+    sr = (sr & 0x7D) | NZ_FLAGS[x]
+
+    pc += 3
+
+    cpu.x = x
+    cpu.sr = sr
+    return pc
+
+
+def ldy_immediate(cpu, pc, operand_lower, operand_higher): #LDY Immediate
+    sr = cpu.sr
+
+    y = operand_lower
+
+    sr = (sr & 0x7D) | NZ_FLAGS[y]
+
+    pc += 2
+
+    cpu.y = y
+    cpu.sr = sr
+    return pc
+
+
+def ldy_zero_page(cpu, pc, operand_lower, operand_higher): #LDY Zero Page
+    ram_64KB = cpu.ram_64KB
+    sr = cpu.sr
+
+    y = ram_64KB[operand_lower]
+
+    sr = (sr & 0x7D) | NZ_FLAGS[y]
+
+    pc += 2
+
+    cpu.y = y
+    cpu.sr = sr
+    return pc
+
+
+def ldy_zero_page_x(cpu, pc, operand_lower, operand_higher): #LDY Zero Page, X
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+    sr = cpu.sr
+
+    addr = (operand_lower + x) & 0xFF
+    y = ram_64KB[addr]
+
+    sr = (sr & 0x7D) | NZ_FLAGS[y]
+
+    pc += 2
+
+    cpu.y = y
+    cpu.sr = sr
+    return pc
+
+
+def ldy_absolute(cpu, pc, operand_lower, operand_higher): #LDY Absolute
+    ram_64KB = cpu.ram_64KB
+    sr = cpu.sr
+
+    addr = (operand_higher << 8) | operand_lower
+    y = ram_64KB[addr]
+
+    sr = (sr & 0x7D) | NZ_FLAGS[y]
+
+    pc += 3
+
+    cpu.y = y
+    cpu.sr = sr
+    return pc
+
+
+def ldy_absolute_x(cpu, pc, operand_lower, operand_higher): #LDY Absolute, X
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + x) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    y = ram_64KB[addr]
+
+    sr = (sr & 0x7D) | NZ_FLAGS[y]
+
+    pc += 3
+
+    cpu.y = y
+    cpu.sr = sr
+    return pc
+
+
+def lsr_accumulator(cpu, pc, operand_lower, operand_higher): #LSR Accumulator
+    ac = cpu.ac
+    sr = cpu.sr
+
+    #Carry Flag (C)
+    if ac & 0x01:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    ac = (ac >> 1) & 0xFF
+
+    # Bit 7 is always shifted in as 0, so N always ends up clear
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+    
+    pc += 1
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def lsr_zero_page(cpu, pc, operand_lower, operand_higher): #LSR Zero Page
+    ram_64KB = cpu.ram_64KB
+    sr = cpu.sr
+
+    value = ram_64KB[operand_lower]
+
+    #Carry Flag (C)
+    if value & 0x01:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = (value >> 1) & 0xFF
+    ram_64KB[operand_lower] = value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+    
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def lsr_zero_page_x(cpu, pc, operand_lower, operand_higher): #LSR Zero Page, X
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+    sr = cpu.sr
+
+    addr = (operand_lower + x) & 0xFF
+    value = ram_64KB[addr]
+
+    #Carry Flag (C)
+    if value & 0x01:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = (value >> 1) & 0xFF
+    ram_64KB[addr] = value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+    
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def lsr_absolute(cpu, pc, operand_lower, operand_higher): #LSR Absolute
+    ram_64KB = cpu.ram_64KB
+    sr = cpu.sr
+
+    addr = (operand_higher << 8) | operand_lower
+    value = ram_64KB[addr]
+
+    # Carry Flag (C)
+    if value & 0x01:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = (value >> 1) & 0xFF
+    ram_64KB[addr] = value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 3
+
+    cpu.sr = sr
+    return pc
+
+
+def lsr_absolute_x(cpu, pc, operand_lower, operand_higher): #LSR Absolute, X
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + x) & 0xFFFF
+    value = ram_64KB[addr]
+
+    #Carry Flag (C)
+    if value & 0x01:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = (value >> 1) & 0xFF
+    ram_64KB[addr] = value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+    
+    pc += 3
+
+    cpu.sr = sr
+    return pc
+
+
+def nop(cpu, pc, operand_lower, operand_higher): #NOP Implied
+    pc += 1
+
+    return pc
+
+
+def ora_immediate(cpu, pc, operand_lower, operand_higher): #ORA Immediate
+    ac = cpu.ac
+    sr = cpu.sr
+
+    ac = (ac | operand_lower) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def ora_zero_page(cpu, pc, operand_lower, operand_higher): #ORA Zero Page
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    value = ram_64KB[operand_lower]
+    ac = (ac | value) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def ora_zero_page_x(cpu, pc, operand_lower, operand_higher): #ORA Zero Page, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    addr = (operand_lower + x) & 0xFF
+    value = ram_64KB[addr]
+    ac = (ac | value) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def ora_absolute(cpu, pc, operand_lower, operand_higher): #ORA Absolute
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    addr = (operand_higher << 8) | operand_lower
+    value = ram_64KB[addr]
+    ac = (ac | value) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def ora_absolute_x(cpu, pc, operand_lower, operand_higher): #ORA Absolute, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + x) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    value = ram_64KB[addr]
+    ac = (ac | value) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def ora_absolute_y(cpu, pc, operand_lower, operand_higher): #ORA Absolute, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + y) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    value = ram_64KB[addr]
+    ac = (ac | value) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def ora_indirect_x(cpu, pc, operand_lower, operand_higher): #ORA Indirect, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    zp = (operand_lower + x) & 0xFF
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    addr = (high << 8) | low
+    value = ram_64KB[addr]
+    ac = (ac | value) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def ora_indirect_y(cpu, pc, operand_lower, operand_higher): #ORA Indirect, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+    sr = cpu.sr
+
+    zp = operand_lower
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    base = (high << 8) | low
+    addr = (base + y) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    value = ram_64KB[addr]
+    ac = (ac | value) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+#Register Instructions
+
+def tax(cpu, pc, operand_lower, operand_higher): #TAX (Transfer A to X)
+    ac = cpu.ac
+    sr = cpu.sr
+
+    x = ac
+
+    sr = (sr & 0x7D) | NZ_FLAGS[x]
+
+    pc += 1
+
+    cpu.x = x
+    cpu.sr = sr
+    return pc
+
+
+def txa(cpu, pc, operand_lower, operand_higher): #TXA (Transfer X to A)
+    x = cpu.x
+    sr = cpu.sr
+
+    ac = x
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 1
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def dex(cpu, pc, operand_lower, operand_higher): #DEX (Decrement X)
+    x = cpu.x
+    sr = cpu.sr
+
+    x = (x - 1) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[x]
+
+    pc += 1
+
+    cpu.x = x
+    cpu.sr = sr
+    return pc
+
+
+def inx(cpu, pc, operand_lower, operand_higher): #INX (Increment X)
+    x = cpu.x
+    sr = cpu.sr
+
+    x = (x + 1) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[x]
+
+    pc += 1
+
+    cpu.x = x
+    cpu.sr = sr
+    return pc
+
+
+def tay(cpu, pc, operand_lower, operand_higher): #TAY (Transfer A to Y)
+    ac = cpu.ac
+    sr = cpu.sr
+
+    y = ac
+
+    sr = (sr & 0x7D) | NZ_FLAGS[y]
+
+    pc += 1
+
+    cpu.y = y
+    cpu.sr = sr
+    return pc
+
+
+def tya(cpu, pc, operand_lower, operand_higher): #TYA (Transfer Y to A)
+    y = cpu.y
+    sr = cpu.sr
+
+    ac = y
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 1
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def dey(cpu, pc, operand_lower, operand_higher): #DEY (Decrement Y)
+    y = cpu.y
+    sr = cpu.sr
+
+    y = (y - 1) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[y]
+
+    pc += 1
+
+    cpu.y = y
+    cpu.sr = sr
+    return pc
+
+
+def iny(cpu, pc, operand_lower, operand_higher): #INY (Increment Y)
+    y = cpu.y
+    sr = cpu.sr
+
+    y = (y + 1) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[y]
+
+    pc += 1
+
+    cpu.y = y
+    cpu.sr = sr
+    return pc
+
+
+def rol_accumulator(cpu, pc, operand_lower, operand_higher): #ROL Accumulator
+    ac = cpu.ac
+    sr = cpu.sr
+
+    old_c = sr & 0x01
+
+    # New carry from bit 7
+    if ac & 0x80:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    ac = ((ac << 1) | old_c) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 1
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def rol_zero_page(cpu, pc, operand_lower, operand_higher): #ROL Zero Page
+    ram_64KB = cpu.ram_64KB
+    sr = cpu.sr
+
+    addr = operand_lower
+    value = ram_64KB[addr]
+
+
+    old_c = sr & 0x01
+
+    # New carry from bit 7
+    if value & 0x80:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = ((value << 1) | old_c) & 0xFF
+
+    ram_64KB[addr] = value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def rol_zero_page_x(cpu, pc, operand_lower, operand_higher): #ROL Zero Page, X
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+    sr = cpu.sr
+
+    addr = (operand_lower + x) & 0xFF
+    value = ram_64KB[addr]
+
+
+    old_c = sr & 0x01
+
+    # New carry from bit 7
+    if value & 0x80:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = ((value << 1) | old_c) & 0xFF
+
+    ram_64KB[addr] = value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def rol_absolute(cpu, pc, operand_lower, operand_higher): #ROL Absolute
+    ram_64KB = cpu.ram_64KB
+    sr = cpu.sr
+
+    addr = (operand_higher << 8) | operand_lower
+    value = ram_64KB[addr]
+
+
+    old_c = sr & 0x01
+
+    # New carry from bit 7
+    if value & 0x80:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = ((value << 1) | old_c) & 0xFF
+
+    ram_64KB[addr] = value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 3
+
+    cpu.sr = sr
+    return pc
+
+
+def rol_absolute_x(cpu, pc, operand_lower, operand_higher): #ROL Absolute, X
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + x) & 0xFFFF
+    value = ram_64KB[addr]
+
+
+    old_c = sr & 0x01
+
+    # New carry from bit 7
+    if value & 0x80:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = ((value << 1) | old_c) & 0xFF
+
+    ram_64KB[addr] = value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 3
+
+    cpu.sr = sr
+    return pc
+
+
+def ror_accumulator(cpu, pc, operand_lower, operand_higher): #ROR Accumulator
+    ac = cpu.ac
+    sr = cpu.sr
+
+    old_c = sr & 0x01
+
+    # New carry from bit 0
+    if ac & 0x01:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    ac = ((ac >> 1) | (old_c << 7)) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 1
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def ror_zero_page(cpu, pc, operand_lower, operand_higher): #ROR Zero Page
+    ram_64KB = cpu.ram_64KB
+    sr = cpu.sr
+
+    addr = operand_lower
+    value = ram_64KB[addr]
+
+
+    old_c = sr & 0x01
+
+    # New carry from bit 0
+    if value & 0x01:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = ((value >> 1) | (old_c << 7)) & 0xFF
+
+    ram_64KB[addr] = value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def ror_zero_page_x(cpu, pc, operand_lower, operand_higher): #ROR Zero Page, X
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+    sr = cpu.sr
+
+    addr = (operand_lower + x) & 0xFF
+    value = ram_64KB[addr]
+
+
+    old_c = sr & 0x01
+
+    # New carry from bit 0
+    if value & 0x01:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = ((value >> 1) | (old_c << 7)) & 0xFF
+
+    ram_64KB[addr] = value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def ror_absolute(cpu, pc, operand_lower, operand_higher): #ROR Absolute
+    ram_64KB = cpu.ram_64KB
+    sr = cpu.sr
+
+    addr = (operand_higher << 8) | operand_lower
+    value = ram_64KB[addr]
+
+
+    old_c = sr & 0x01
+
+    # New carry from bit 0
+    if value & 0x01:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = ((value >> 1) | (old_c << 7)) & 0xFF
+
+    ram_64KB[addr] = value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 3
+
+    cpu.sr = sr
+    return pc
+
+
+def ror_absolute_x(cpu, pc, operand_lower, operand_higher): #ROR Absolute, X
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + x) & 0xFFFF
+    value = ram_64KB[addr]
+
+
+    old_c = sr & 0x01
+
+    # New carry from bit 0
+    if value & 0x01:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = ((value >> 1) | (old_c << 7)) & 0xFF
+
+    ram_64KB[addr] = value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[value]
+
+    pc += 3
+
+    cpu.sr = sr
+    return pc
+
+
+def rti(cpu, pc, operand_lower, operand_higher): #RTI Implied
+    ram_64KB = cpu.ram_64KB
+    sp = cpu.sp
+
+            # pull SR
+    sp = (sp + 1) & 0xFF
+    sr = ram_64KB[0x0100 + sp]
+    sr &= ~0b00010000
+    sr |=  0b00100000
+
+    # pull PC low
+    sp = (sp + 1) & 0xFF
+    pcl = ram_64KB[0x0100 + sp]
+
+    # pull PC high
+    sp = (sp + 1) & 0xFF
+    pch = ram_64KB[0x0100 + sp]
+
+    pc = (pch << 8) | pcl
+
+    #IRQ held while I was set: end the batch so it is taken now
+    if cpu.irq and not (sr & 0x04):
+        cpu.cycle_limit = cpu.cycle_count
+
+    cpu.sr = sr
+    cpu.sp = sp
+    return pc
+
+
+def rts(cpu, pc, operand_lower, operand_higher): #RTS Implied
+    ram_64KB = cpu.ram_64KB
+    sp = cpu.sp
+
+    sp = (sp + 1) & 0xFF
+    low = ram_64KB[0x0100 + sp]
+
+    sp = (sp + 1) & 0xFF
+    high = ram_64KB[0x0100 + sp]
+
+    pc = (((high << 8) | low) + 1) & 0xFFFF
+
+    cpu.sp = sp
+    return pc
+
+
+def sbc_immediate(cpu, pc, operand_lower, operand_higher): #SBC Immediate
+    ac = cpu.ac
+    sr = cpu.sr
+
+    old_ac = ac
+
+    if sr & 0x01:
+        cin = 1
+    else:
+        cin = 0
+
+    
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_SBC[(cin << 16) | (ac << 8) | operand_lower]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac - operand_lower - (1 - cin)
+
+    
+
+        #Carry Flag (C)
+        if result >= 0:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if ((old_ac ^ operand_lower) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def sbc_zero_page(cpu, pc, operand_lower, operand_higher): #SBC Zero Page
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    old_ac = ac
+
+    if sr & 0x01:
+        cin = 1
+    else:
+        cin = 0
+
+    value = ram_64KB[operand_lower]
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_SBC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac - value - (1 - cin)
+
+        #Carry Flag (C)
+        if result >= 0:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if ((old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def sbc_zero_page_x(cpu, pc, operand_lower, operand_higher): #SBC Zero Page, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    old_ac = ac
+
+    if sr & 0x01:
+        cin = 1
+    else:
+        cin = 0
+
+    addr = (operand_lower + x) & 0xFF
+    value = ram_64KB[addr]
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_SBC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac - value - (1 - cin)
+
+        #Carry Flag (C)
+        if result >= 0:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if ((old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def sbc_absolute(cpu, pc, operand_lower, operand_higher): #SBC Absolute
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    old_ac = ac
+
+    if sr & 0x01:
+        cin = 1
+    else:
+        cin = 0
+
+    addr = (operand_higher << 8) | operand_lower
+    value = ram_64KB[addr]
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_SBC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac - value - (1 - cin)
+
+        #Carry Flag (C)
+        if result >= 0:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if ((old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def sbc_absolute_x(cpu, pc, operand_lower, operand_higher): #SBC Absolute, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    old_ac = ac
+
+    if sr & 0x01:
+        cin = 1
+    else:
+        cin = 0
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + x) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    value = ram_64KB[addr]
+
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_SBC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac - value - (1 - cin)
+
+        #Carry Flag (C)
+        if result >= 0:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if ((old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def sbc_absolute_y(cpu, pc, operand_lower, operand_higher): #SBC Absolute, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+    sr = cpu.sr
+
+    old_ac = ac
+
+    if sr & 0x01:
+        cin = 1
+    else:
+        cin = 0
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + y) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    value = ram_64KB[addr]
+    
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_SBC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac - value - (1 - cin)
+
+        #Carry Flag (C)
+        if result >= 0:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if ((old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def sbc_indirect_x(cpu, pc, operand_lower, operand_higher): #SBC Indirect, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    old_ac = ac
+
+    if sr & 0x01:
+        cin = 1
+    else:
+        cin = 0
+
+    zp = (operand_lower + x) & 0xFF
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    addr = (high << 8) | low
+    value = ram_64KB[addr]
+    
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_SBC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac - value - (1 - cin)
+
+        #Carry Flag (C)
+        if result >= 0:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if ((old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def sbc_indirect_y(cpu, pc, operand_lower, operand_higher): #SBC Indirect, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+    sr = cpu.sr
+
+    old_ac = ac
+
+    if sr & 0x01:
+        cin = 1
+    else:
+        cin = 0
+
+    zp = operand_lower
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    base = (high << 8) | low
+    addr = (base + y) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    value = ram_64KB[addr]
+    
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_SBC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac - value - (1 - cin)
+
+        #Carry Flag (C)
+        if result >= 0:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if ((old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def sta_zero_page(cpu, pc, operand_lower, operand_higher): #STA Zero Page
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+
+    ram_64KB[operand_lower] = ac
+
+    pc += 2
+
+    return pc
+
+
+def sta_zero_page_x(cpu, pc, operand_lower, operand_higher): #STA Zero Page, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+
+    ram_64KB[(operand_lower + x) & 0xFF] = ac
+
+    pc += 2
+
+    return pc
+
+
+def sta_absolute(cpu, pc, operand_lower, operand_higher): #STA Absolute
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+
+    ram_64KB[(operand_higher << 8) | operand_lower] = ac
+
+    pc += 3
+
+    return pc
+
+
+def sta_absolute_x(cpu, pc, operand_lower, operand_higher): #STA Absolute, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+
+    addr = ((operand_higher << 8) | operand_lower) + x
+    ram_64KB[addr & 0xFFFF] = ac
+
+    pc += 3
+
+    return pc
+
+
+def sta_absolute_y(cpu, pc, operand_lower, operand_higher): #STA Absolute, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+
+    addr = ((operand_higher << 8) | operand_lower) + y
+    ram_64KB[addr & 0xFFFF] = ac
+
+    pc += 3
+
+    return pc
+
+
+def sta_indirect_x(cpu, pc, operand_lower, operand_higher): #STA Indirect, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+
+    zp_addr = (operand_lower + x) & 0xFF
+
+    low_byte = ram_64KB[zp_addr]
+    high_byte = ram_64KB[(zp_addr + 1) & 0xFF]
+
+    base_addr = (high_byte << 8) | low_byte
+
+    target_addr = base_addr
+
+    ram_64KB[target_addr] = ac
+
+
+    pc += 2
+
+    return pc
+
+
+def sta_indirect_y(cpu, pc, operand_lower, operand_higher): #STA Indirect, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+
+    zp_addr = operand_lower
+
+    low_byte = ram_64KB[zp_addr]
+    high_byte = ram_64KB[(zp_addr + 1) & 0xFF]
+
+    base_addr = (high_byte << 8) | low_byte
+
+    target_addr = (base_addr + y) & 0xFFFF
+
+    ram_64KB[target_addr] = ac
+
+
+    pc += 2
+
+    return pc
+
+
+#Stack Instructions
+
+def txs(cpu, pc, operand_lower, operand_higher): #TXS (Transfer X to Stack ptr)
+    x = cpu.x
+
+    sp = x
+    pc += 1
+
+    cpu.sp = sp
+    return pc
+
+
+def tsx(cpu, pc, operand_lower, operand_higher): #TSX (Transfer Stack ptr to X)
+    sr = cpu.sr
+    sp = cpu.sp
+
+    x = sp
+
+    sr = (sr & 0x7D) | NZ_FLAGS[x]
+
+    pc += 1
+
+    cpu.x = x
+    cpu.sr = sr
+    return pc
+
+
+def pha(cpu, pc, operand_lower, operand_higher): #PHA (Push Accumulator)
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sp = cpu.sp
+
+    ram_64KB[0x100 + sp] = ac
+    sp = (sp - 1) & 0xFF
+    pc += 1
+
+    cpu.sp = sp
+    return pc
+
+
+def pla(cpu, pc, operand_lower, operand_higher): #PLA (Pull Accumulator)
+    ram_64KB = cpu.ram_64KB
+    sr = cpu.sr
+    sp = cpu.sp
+
+    sp = (sp + 1) & 0xFF
+    ac = ram_64KB[0x100 + sp]
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 1
+
+    cpu.ac = ac
+    cpu.sr = sr
+    cpu.sp = sp
+    return pc
+
+
+def php(cpu, pc, operand_lower, operand_higher): #PHP (Push Processor Status)
+    ram_64KB = cpu.ram_64KB
+    sr = cpu.sr
+    sp = cpu.sp
+
+    ram_64KB[0x100 + sp] = sr
+    sp = (sp - 1) & 0xFF
+    pc += 1
+
+    cpu.sp = sp
+    return pc
+
+
+def plp(cpu, pc, operand_lower, operand_higher): #PLP (Pull Processor Status)
+    ram_64KB = cpu.ram_64KB
+    sp = cpu.sp
+
+    sp = (sp + 1) & 0xFF
+    sr = ram_64KB[0x100 + sp]
+    pc += 1
+
+    #IRQ held while I was set: end the batch so it is taken now
+    if cpu.irq and not (sr & 0x04):
+        cpu.cycle_limit = cpu.cycle_count
+
+    cpu.sr = sr
+    cpu.sp = sp
+    return pc
+
+
+def stx_zero_page(cpu, pc, operand_lower, operand_higher): #STX Zero Page
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+
+    ram_64KB[operand_lower] = x
+
+    pc += 2
+
+    return pc
+
+
+def stx_zero_page_y(cpu, pc, operand_lower, operand_higher): #STX Zero Page, Y
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+    y = cpu.y
+
+    ram_64KB[(operand_lower + y) & 0xFF] = x
+
+    pc += 2
+
+    return pc
+
+
+def stx_absolute(cpu, pc, operand_lower, operand_higher): #STX Absolute
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+
+    addr = (operand_higher << 8) | operand_lower
+    ram_64KB[addr] = x
+
+    pc += 3
+
+    return pc
+
+
+def sty_zero_page(cpu, pc, operand_lower, operand_higher): #STY Zero Page
+    ram_64KB = cpu.ram_64KB
+    y = cpu.y
+
+    ram_64KB[operand_lower] = y
+
+    pc += 2
+
+    return pc
+
+
+def sty_zero_page_x(cpu, pc, operand_lower, operand_higher): #STY Zero Page, X
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+    y = cpu.y
+
+    ram_64KB[(operand_lower + x) & 0xFF] = y
+
+    pc += 2
+
+    return pc
+
+
+def sty_absolute(cpu, pc, operand_lower, operand_higher): #STY Absolute
+    ram_64KB = cpu.ram_64KB
+    y = cpu.y
+
+    addr = (operand_higher << 8) | operand_lower
+    ram_64KB[addr] = y
+
+    pc += 3
+
+    return pc
+
+
+#Illegal Opcodes
+#
+# The undocumented NMOS opcodes. The stable ones are used by real programs (Atari 2600
+# cartridges especially) and behave the same on every chip.
+
+def slo_zero_page(cpu, pc, operand_lower, operand_higher): #SLO (ASL, then ORA) Zero Page
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    addr = operand_lower
+    value = ram_64KB[addr]
+
+    #Carry Flag
+    if value & 0x80:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = (value << 1) & 0xFF
+
+    ram_64KB[addr] = value
+
+    ac |= value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def slo_zero_page_x(cpu, pc, operand_lower, operand_higher): #SLO (ASL, then ORA) Zero Page, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    addr = (operand_lower + x) & 0xFF
+    value = ram_64KB[addr]
+
+    #Carry Flag
+    if value & 0x80:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = (value << 1) & 0xFF
+
+    ram_64KB[addr] = value
+
+    ac |= value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def slo_absolute(cpu, pc, operand_lower, operand_higher): #SLO (ASL, then ORA) Absolute
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    addr = (operand_higher << 8) | operand_lower
+    value = ram_64KB[addr]
+
+    #Carry Flag
+    if value & 0x80:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = (value << 1) & 0xFF
+
+    ram_64KB[addr] = value
+
+    ac |= value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def slo_absolute_x(cpu, pc, operand_lower, operand_higher): #SLO (ASL, then ORA) Absolute, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + x) & 0xFFFF
+    value = ram_64KB[addr]
+
+    #Carry Flag
+    if value & 0x80:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = (value << 1) & 0xFF
+
+    ram_64KB[addr] = value
+
+    ac |= value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def slo_absolute_y(cpu, pc, operand_lower, operand_higher): #SLO (ASL, then ORA) Absolute, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + y) & 0xFFFF
+    value = ram_64KB[addr]
+
+    #Carry Flag
+    if value & 0x80:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = (value << 1) & 0xFF
+
+    ram_64KB[addr] = value
+
+    ac |= value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def slo_indirect_x(cpu, pc, operand_lower, operand_higher): #SLO (ASL, then ORA) Indirect, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    zp = (operand_lower + x) & 0xFF
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    addr = (high << 8) | low
+    value = ram_64KB[addr]
+
+    #Carry Flag
+    if value & 0x80:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = (value << 1) & 0xFF
+
+    ram_64KB[addr] = value
+
+    ac |= value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def slo_indirect_y(cpu, pc, operand_lower, operand_higher): #SLO (ASL, then ORA) Indirect, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+    sr = cpu.sr
+
+    zp = operand_lower
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    base = (high << 8) | low
+    addr = (base + y) & 0xFFFF
+    value = ram_64KB[addr]
+
+    #Carry Flag
+    if value & 0x80:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = (value << 1) & 0xFF
+
+    ram_64KB[addr] = value
+
+    ac |= value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def rla_zero_page(cpu, pc, operand_lower, operand_higher): #RLA (ROL, then AND) Zero Page
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    addr = operand_lower
+    value = ram_64KB[addr]
+
+    old_c = sr & 0x01
+
+    #Carry Flag
+    if value & 0x80:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = ((value << 1) | old_c) & 0xFF
+
+    ram_64KB[addr] = value
+
+    ac &= value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def rla_zero_page_x(cpu, pc, operand_lower, operand_higher): #RLA (ROL, then AND) Zero Page, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    addr = (operand_lower + x) & 0xFF
+    value = ram_64KB[addr]
+
+    old_c = sr & 0x01
+
+    #Carry Flag
+    if value & 0x80:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = ((value << 1) | old_c) & 0xFF
+
+    ram_64KB[addr] = value
+
+    ac &= value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def rla_absolute(cpu, pc, operand_lower, operand_higher): #RLA (ROL, then AND) Absolute
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    addr = (operand_higher << 8) | operand_lower
+    value = ram_64KB[addr]
+
+    old_c = sr & 0x01
+
+    #Carry Flag
+    if value & 0x80:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = ((value << 1) | old_c) & 0xFF
+
+    ram_64KB[addr] = value
+
+    ac &= value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def rla_absolute_x(cpu, pc, operand_lower, operand_higher): #RLA (ROL, then AND) Absolute, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + x) & 0xFFFF
+    value = ram_64KB[addr]
+
+    old_c = sr & 0x01
+
+    #Carry Flag
+    if value & 0x80:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = ((value << 1) | old_c) & 0xFF
+
+    ram_64KB[addr] = value
+
+    ac &= value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def rla_absolute_y(cpu, pc, operand_lower, operand_higher): #RLA (ROL, then AND) Absolute, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + y) & 0xFFFF
+    value = ram_64KB[addr]
+
+    old_c = sr & 0x01
+
+    #Carry Flag
+    if value & 0x80:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = ((value << 1) | old_c) & 0xFF
+
+    ram_64KB[addr] = value
+
+    ac &= value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def rla_indirect_x(cpu, pc, operand_lower, operand_higher): #RLA (ROL, then AND) Indirect, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    zp = (operand_lower + x) & 0xFF
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    addr = (high << 8) | low
+    value = ram_64KB[addr]
+
+    old_c = sr & 0x01
+
+    #Carry Flag
+    if value & 0x80:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = ((value << 1) | old_c) & 0xFF
+
+    ram_64KB[addr] = value
+
+    ac &= value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def rla_indirect_y(cpu, pc, operand_lower, operand_higher): #RLA (ROL, then AND) Indirect, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+    sr = cpu.sr
+
+    zp = operand_lower
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    base = (high << 8) | low
+    addr = (base + y) & 0xFFFF
+    value = ram_64KB[addr]
+
+    old_c = sr & 0x01
+
+    #Carry Flag
+    if value & 0x80:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value = ((value << 1) | old_c) & 0xFF
+
+    ram_64KB[addr] = value
+
+    ac &= value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def sre_zero_page(cpu, pc, operand_lower, operand_higher): #SRE (LSR, then EOR) Zero Page
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    addr = operand_lower
+    value = ram_64KB[addr]
+
+    #Carry Flag
+    if value & 0x01:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value >>= 1
+
+    ram_64KB[addr] = value
+
+    ac ^= value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def sre_zero_page_x(cpu, pc, operand_lower, operand_higher): #SRE (LSR, then EOR) Zero Page, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    addr = (operand_lower + x) & 0xFF
+    value = ram_64KB[addr]
+
+    #Carry Flag
+    if value & 0x01:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value >>= 1
+
+    ram_64KB[addr] = value
+
+    ac ^= value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def sre_absolute(cpu, pc, operand_lower, operand_higher): #SRE (LSR, then EOR) Absolute
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    addr = (operand_higher << 8) | operand_lower
+    value = ram_64KB[addr]
+
+    #Carry Flag
+    if value & 0x01:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value >>= 1
+
+    ram_64KB[addr] = value
+
+    ac ^= value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def sre_absolute_x(cpu, pc, operand_lower, operand_higher): #SRE (LSR, then EOR) Absolute, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + x) & 0xFFFF
+    value = ram_64KB[addr]
+
+    #Carry Flag
+    if value & 0x01:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value >>= 1
+
+    ram_64KB[addr] = value
+
+    ac ^= value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def sre_absolute_y(cpu, pc, operand_lower, operand_higher): #SRE (LSR, then EOR) Absolute, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + y) & 0xFFFF
+    value = ram_64KB[addr]
+
+    #Carry Flag
+    if value & 0x01:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value >>= 1
+
+    ram_64KB[addr] = value
+
+    ac ^= value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def sre_indirect_x(cpu, pc, operand_lower, operand_higher): #SRE (LSR, then EOR) Indirect, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    zp = (operand_lower + x) & 0xFF
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    addr = (high << 8) | low
+    value = ram_64KB[addr]
+
+    #Carry Flag
+    if value & 0x01:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value >>= 1
+
+    ram_64KB[addr] = value
+
+    ac ^= value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def sre_indirect_y(cpu, pc, operand_lower, operand_higher): #SRE (LSR, then EOR) Indirect, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+    sr = cpu.sr
+
+    zp = operand_lower
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    base = (high << 8) | low
+    addr = (base + y) & 0xFFFF
+    value = ram_64KB[addr]
+
+    #Carry Flag
+    if value & 0x01:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    value >>= 1
+
+    ram_64KB[addr] = value
+
+    ac ^= value
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def rra_zero_page(cpu, pc, operand_lower, operand_higher): #RRA (ROR, then ADC) Zero Page
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    addr = operand_lower
+    value = ram_64KB[addr]
+
+    old_c = sr & 0x01
+
+    # The carry out of ROR is the carry into ADC
+    cin = value & 0x01
+    value = (value >> 1) | (old_c << 7)
+
+    ram_64KB[addr] = value
+
+    old_ac = ac
+
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_ADC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac + value + cin
+
+        #Carry Flag (C)
+        if result > 0xFF:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def rra_zero_page_x(cpu, pc, operand_lower, operand_higher): #RRA (ROR, then ADC) Zero Page, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    addr = (operand_lower + x) & 0xFF
+    value = ram_64KB[addr]
+
+    old_c = sr & 0x01
+
+    # The carry out of ROR is the carry into ADC
+    cin = value & 0x01
+    value = (value >> 1) | (old_c << 7)
+
+    ram_64KB[addr] = value
+
+    old_ac = ac
+
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_ADC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac + value + cin
+
+        #Carry Flag (C)
+        if result > 0xFF:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def rra_absolute(cpu, pc, operand_lower, operand_higher): #RRA (ROR, then ADC) Absolute
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    addr = (operand_higher << 8) | operand_lower
+    value = ram_64KB[addr]
+
+    old_c = sr & 0x01
+
+    # The carry out of ROR is the carry into ADC
+    cin = value & 0x01
+    value = (value >> 1) | (old_c << 7)
+
+    ram_64KB[addr] = value
+
+    old_ac = ac
+
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_ADC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac + value + cin
+
+        #Carry Flag (C)
+        if result > 0xFF:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def rra_absolute_x(cpu, pc, operand_lower, operand_higher): #RRA (ROR, then ADC) Absolute, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + x) & 0xFFFF
+    value = ram_64KB[addr]
+
+    old_c = sr & 0x01
+
+    # The carry out of ROR is the carry into ADC
+    cin = value & 0x01
+    value = (value >> 1) | (old_c << 7)
+
+    ram_64KB[addr] = value
+
+    old_ac = ac
+
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_ADC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac + value + cin
+
+        #Carry Flag (C)
+        if result > 0xFF:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def rra_absolute_y(cpu, pc, operand_lower, operand_higher): #RRA (ROR, then ADC) Absolute, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + y) & 0xFFFF
+    value = ram_64KB[addr]
+
+    old_c = sr & 0x01
+
+    # The carry out of ROR is the carry into ADC
+    cin = value & 0x01
+    value = (value >> 1) | (old_c << 7)
+
+    ram_64KB[addr] = value
+
+    old_ac = ac
+
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_ADC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac + value + cin
+
+        #Carry Flag (C)
+        if result > 0xFF:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def rra_indirect_x(cpu, pc, operand_lower, operand_higher): #RRA (ROR, then ADC) Indirect, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    zp = (operand_lower + x) & 0xFF
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    addr = (high << 8) | low
+    value = ram_64KB[addr]
+
+    old_c = sr & 0x01
+
+    # The carry out of ROR is the carry into ADC
+    cin = value & 0x01
+    value = (value >> 1) | (old_c << 7)
+
+    ram_64KB[addr] = value
+
+    old_ac = ac
+
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_ADC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac + value + cin
+
+        #Carry Flag (C)
+        if result > 0xFF:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def rra_indirect_y(cpu, pc, operand_lower, operand_higher): #RRA (ROR, then ADC) Indirect, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+    sr = cpu.sr
+
+    zp = operand_lower
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    base = (high << 8) | low
+    addr = (base + y) & 0xFFFF
+    value = ram_64KB[addr]
+
+    old_c = sr & 0x01
+
+    # The carry out of ROR is the carry into ADC
+    cin = value & 0x01
+    value = (value >> 1) | (old_c << 7)
+
+    ram_64KB[addr] = value
+
+    old_ac = ac
+
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_ADC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac + value + cin
+
+        #Carry Flag (C)
+        if result > 0xFF:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if (~(old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def dcp_zero_page(cpu, pc, operand_lower, operand_higher): #DCP (DEC, then CMP) Zero Page
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    addr = operand_lower
+    value = ram_64KB[addr]
+
+    value = (value - 1) & 0xFF
+
+    ram_64KB[addr] = value
+
+    # Carry flag (set if A >= M)
+    if ac >= value:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    sr = (sr & 0x7D) | NZ_FLAGS[(ac - value) & 0xFF]
+
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def dcp_zero_page_x(cpu, pc, operand_lower, operand_higher): #DCP (DEC, then CMP) Zero Page, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    addr = (operand_lower + x) & 0xFF
+    value = ram_64KB[addr]
+
+    value = (value - 1) & 0xFF
+
+    ram_64KB[addr] = value
+
+    # Carry flag (set if A >= M)
+    if ac >= value:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    sr = (sr & 0x7D) | NZ_FLAGS[(ac - value) & 0xFF]
+
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def dcp_absolute(cpu, pc, operand_lower, operand_higher): #DCP (DEC, then CMP) Absolute
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    addr = (operand_higher << 8) | operand_lower
+    value = ram_64KB[addr]
+
+    value = (value - 1) & 0xFF
+
+    ram_64KB[addr] = value
+
+    # Carry flag (set if A >= M)
+    if ac >= value:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    sr = (sr & 0x7D) | NZ_FLAGS[(ac - value) & 0xFF]
+
+    pc += 3
+
+    cpu.sr = sr
+    return pc
+
+
+def dcp_absolute_x(cpu, pc, operand_lower, operand_higher): #DCP (DEC, then CMP) Absolute, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + x) & 0xFFFF
+    value = ram_64KB[addr]
+
+    value = (value - 1) & 0xFF
+
+    ram_64KB[addr] = value
+
+    # Carry flag (set if A >= M)
+    if ac >= value:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    sr = (sr & 0x7D) | NZ_FLAGS[(ac - value) & 0xFF]
+
+    pc += 3
+
+    cpu.sr = sr
+    return pc
+
+
+def dcp_absolute_y(cpu, pc, operand_lower, operand_higher): #DCP (DEC, then CMP) Absolute, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + y) & 0xFFFF
+    value = ram_64KB[addr]
+
+    value = (value - 1) & 0xFF
+
+    ram_64KB[addr] = value
+
+    # Carry flag (set if A >= M)
+    if ac >= value:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    sr = (sr & 0x7D) | NZ_FLAGS[(ac - value) & 0xFF]
+
+    pc += 3
+
+    cpu.sr = sr
+    return pc
+
+
+def dcp_indirect_x(cpu, pc, operand_lower, operand_higher): #DCP (DEC, then CMP) Indirect, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    zp = (operand_lower + x) & 0xFF
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    addr = (high << 8) | low
+    value = ram_64KB[addr]
+
+    value = (value - 1) & 0xFF
+
+    ram_64KB[addr] = value
+
+    # Carry flag (set if A >= M)
+    if ac >= value:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    sr = (sr & 0x7D) | NZ_FLAGS[(ac - value) & 0xFF]
+
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def dcp_indirect_y(cpu, pc, operand_lower, operand_higher): #DCP (DEC, then CMP) Indirect, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+    sr = cpu.sr
+
+    zp = operand_lower
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    base = (high << 8) | low
+    addr = (base + y) & 0xFFFF
+    value = ram_64KB[addr]
+
+    value = (value - 1) & 0xFF
+
+    ram_64KB[addr] = value
+
+    # Carry flag (set if A >= M)
+    if ac >= value:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    sr = (sr & 0x7D) | NZ_FLAGS[(ac - value) & 0xFF]
+
+    pc += 2
+
+    cpu.sr = sr
+    return pc
+
+
+def isc_zero_page(cpu, pc, operand_lower, operand_higher): #ISC (INC, then SBC) Zero Page
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    addr = operand_lower
+    value = ram_64KB[addr]
+
+    value = (value + 1) & 0xFF
+
+    ram_64KB[addr] = value
+
+    old_ac = ac
+
+    if sr & 0x01:
+        cin = 1
+    else:
+        cin = 0
+
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_SBC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac - value - (1 - cin)
+
+        #Carry Flag (C)
+        if result >= 0:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if ((old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def isc_zero_page_x(cpu, pc, operand_lower, operand_higher): #ISC (INC, then SBC) Zero Page, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    addr = (operand_lower + x) & 0xFF
+    value = ram_64KB[addr]
+
+    value = (value + 1) & 0xFF
+
+    ram_64KB[addr] = value
+
+    old_ac = ac
+
+    if sr & 0x01:
+        cin = 1
+    else:
+        cin = 0
+
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_SBC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac - value - (1 - cin)
+
+        #Carry Flag (C)
+        if result >= 0:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if ((old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def isc_absolute(cpu, pc, operand_lower, operand_higher): #ISC (INC, then SBC) Absolute
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    sr = cpu.sr
+
+    addr = (operand_higher << 8) | operand_lower
+    value = ram_64KB[addr]
+
+    value = (value + 1) & 0xFF
+
+    ram_64KB[addr] = value
+
+    old_ac = ac
+
+    if sr & 0x01:
+        cin = 1
+    else:
+        cin = 0
+
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_SBC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac - value - (1 - cin)
+
+        #Carry Flag (C)
+        if result >= 0:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if ((old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def isc_absolute_x(cpu, pc, operand_lower, operand_higher): #ISC (INC, then SBC) Absolute, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + x) & 0xFFFF
+    value = ram_64KB[addr]
+
+    value = (value + 1) & 0xFF
+
+    ram_64KB[addr] = value
+
+    old_ac = ac
+
+    if sr & 0x01:
+        cin = 1
+    else:
+        cin = 0
+
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_SBC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac - value - (1 - cin)
+
+        #Carry Flag (C)
+        if result >= 0:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if ((old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def isc_absolute_y(cpu, pc, operand_lower, operand_higher): #ISC (INC, then SBC) Absolute, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + y) & 0xFFFF
+    value = ram_64KB[addr]
+
+    value = (value + 1) & 0xFF
+
+    ram_64KB[addr] = value
+
+    old_ac = ac
+
+    if sr & 0x01:
+        cin = 1
+    else:
+        cin = 0
+
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_SBC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac - value - (1 - cin)
+
+        #Carry Flag (C)
+        if result >= 0:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if ((old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def isc_indirect_x(cpu, pc, operand_lower, operand_higher): #ISC (INC, then SBC) Indirect, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    zp = (operand_lower + x) & 0xFF
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    addr = (high << 8) | low
+    value = ram_64KB[addr]
+
+    value = (value + 1) & 0xFF
+
+    ram_64KB[addr] = value
+
+    old_ac = ac
+
+    if sr & 0x01:
+        cin = 1
+    else:
+        cin = 0
+
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_SBC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac - value - (1 - cin)
+
+        #Carry Flag (C)
+        if result >= 0:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if ((old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def isc_indirect_y(cpu, pc, operand_lower, operand_higher): #ISC (INC, then SBC) Indirect, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    y = cpu.y
+    sr = cpu.sr
+
+    zp = operand_lower
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    base = (high << 8) | low
+    addr = (base + y) & 0xFFFF
+    value = ram_64KB[addr]
+
+    value = (value + 1) & 0xFF
+
+    ram_64KB[addr] = value
+
+    old_ac = ac
+
+    if sr & 0x01:
+        cin = 1
+    else:
+        cin = 0
+
+    if sr & 0x08:
+        #Decimal Mode (D)
+        ac, flags, nz = DECIMAL_SBC[(cin << 16) | (ac << 8) | value]
+        sr = (sr & 0xBE) | flags
+        sr = (sr & 0x7D) | LAZY_NZ_FLAGS[nz]
+    else:
+        result = ac - value - (1 - cin)
+
+        #Carry Flag (C)
+        if result >= 0:
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+        ac = result & 0xFF
+
+        sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+        #Overflow Flag (V)
+        if ((old_ac ^ value) & (old_ac ^ ac) & 0x80) != 0:
+            sr |= 0x40
+        else:
+            sr &= ~0x40
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def lax_zero_page(cpu, pc, operand_lower, operand_higher): #LAX (LDA and LDX) Zero Page
+    ram_64KB = cpu.ram_64KB
+    sr = cpu.sr
+
+    addr = operand_lower
+    ac = ram_64KB[addr]
+    x = ac
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.x = x
+    cpu.sr = sr
+    return pc
+
+
+def lax_zero_page_y(cpu, pc, operand_lower, operand_higher): #LAX (LDA and LDX) Zero Page, Y
+    ram_64KB = cpu.ram_64KB
+    y = cpu.y
+    sr = cpu.sr
+
+    addr = (operand_lower + y) & 0xFF
+    ac = ram_64KB[addr]
+    x = ac
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.x = x
+    cpu.sr = sr
+    return pc
+
+
+def lax_absolute(cpu, pc, operand_lower, operand_higher): #LAX (LDA and LDX) Absolute
+    ram_64KB = cpu.ram_64KB
+    sr = cpu.sr
+
+    addr = (operand_higher << 8) | operand_lower
+    ac = ram_64KB[addr]
+    x = ac
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.x = x
+    cpu.sr = sr
+    return pc
+
+
+def lax_absolute_y(cpu, pc, operand_lower, operand_higher): #LAX (LDA and LDX) Absolute, Y
+    ram_64KB = cpu.ram_64KB
+    y = cpu.y
+    sr = cpu.sr
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + y) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    ac = ram_64KB[addr]
+    x = ac
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.x = x
+    cpu.sr = sr
+    return pc
+
+
+def lax_indirect_x(cpu, pc, operand_lower, operand_higher): #LAX (LDA and LDX) Indirect, X
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+    sr = cpu.sr
+
+    zp = (operand_lower + x) & 0xFF
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    addr = (high << 8) | low
+    ac = ram_64KB[addr]
+    x = ac
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.x = x
+    cpu.sr = sr
+    return pc
+
+
+def lax_indirect_y(cpu, pc, operand_lower, operand_higher): #LAX (LDA and LDX) Indirect, Y
+    ram_64KB = cpu.ram_64KB
+    y = cpu.y
+    sr = cpu.sr
+
+    zp = operand_lower
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    base = (high << 8) | low
+    addr = (base + y) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    ac = ram_64KB[addr]
+    x = ac
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.x = x
+    cpu.sr = sr
+    return pc
+
+
+def sax_zero_page(cpu, pc, operand_lower, operand_higher): #SAX (Store A AND X) Zero Page
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+
+    addr = operand_lower
+    ram_64KB[addr] = ac & x
+
+    pc += 2
+
+    return pc
+
+
+def sax_zero_page_y(cpu, pc, operand_lower, operand_higher): #SAX (Store A AND X) Zero Page, Y
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    y = cpu.y
+
+    addr = (operand_lower + y) & 0xFF
+    ram_64KB[addr] = ac & x
+
+    pc += 2
+
+    return pc
+
+
+def sax_absolute(cpu, pc, operand_lower, operand_higher): #SAX (Store A AND X) Absolute
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+
+    addr = (operand_higher << 8) | operand_lower
+    ram_64KB[addr] = ac & x
+
+    pc += 3
+
+    return pc
+
+
+def sax_indirect_x(cpu, pc, operand_lower, operand_higher): #SAX (Store A AND X) Indirect, X
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+
+    zp = (operand_lower + x) & 0xFF
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    addr = (high << 8) | low
+    ram_64KB[addr] = ac & x
+
+    pc += 2
+
+    return pc
+
+
+def anc_immediate(cpu, pc, operand_lower, operand_higher): #ANC (AND, then C = N) Immediate
+    ac = cpu.ac
+    sr = cpu.sr
+
+    ac &= operand_lower
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    #Carry Flag (copy of N)
+    sr = (sr & ~0x01) | (ac >> 7)
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def alr_immediate(cpu, pc, operand_lower, operand_higher): #ALR (AND, then LSR A) Immediate
+    ac = cpu.ac
+    sr = cpu.sr
+
+    ac &= operand_lower
+
+    #Carry Flag
+    sr = (sr & ~0x01) | (ac & 0x01)
+
+    ac >>= 1
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def arr_immediate(cpu, pc, operand_lower, operand_higher): #ARR (AND, then ROR A) Immediate
+    ac = cpu.ac
+    sr = cpu.sr
+
+    value = ac & operand_lower
+    ac = (value >> 1) | ((sr & 0x01) << 7)
+
+    # N and Z come from the rotated value, V from bit 6 changing
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+    sr = (sr & ~0x40) | ((value ^ ac) & 0x40)
+
+    if sr & 0x08:
+        #Decimal Mode (D): each digit of the AND result that is over 5 gets 6 added
+        if (value & 0x0F) + (value & 0x01) > 0x05:
+            ac = (ac & 0xF0) | ((ac + 0x06) & 0x0F)
+        if (value & 0xF0) + (value & 0x10) > 0x50:
+            ac = (ac + 0x60) & 0xFF
+            sr |= 0x01
+        else:
+            sr &= ~0x01
+    else:
+        #Carry Flag (bit 6)
+        sr = (sr & ~0x01) | ((ac >> 6) & 0x01)
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def sbx_immediate(cpu, pc, operand_lower, operand_higher): #SBX (X = A AND X, minus immediate, like CMP) Immediate
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    value = ac & x
+
+    # Carry flag (set if A AND X >= M), D is ignored
+    if value >= operand_lower:
+        sr |= 0x01
+    else:
+        sr &= ~0x01
+
+    x = (value - operand_lower) & 0xFF
+
+    sr = (sr & 0x7D) | NZ_FLAGS[x]
+
+    pc += 2
+
+    cpu.x = x
+    cpu.sr = sr
+    return pc
+
+
+def las_absolute_y(cpu, pc, operand_lower, operand_higher): #LAS (A, X and SP = M AND SP) Absolute, Y
+    ram_64KB = cpu.ram_64KB
+    y = cpu.y
+    sr = cpu.sr
+    sp = cpu.sp
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + y) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    sp &= ram_64KB[addr]
+    ac = sp
+    x = sp
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 3
+
+    cpu.ac = ac
+    cpu.x = x
+    cpu.sr = sr
+    cpu.sp = sp
+    return pc
+
+
+def dop(cpu, pc, operand_lower, operand_higher): #DOP (Double NOP)
+    pc += 2
+
+    return pc
+
+
+def top_absolute(cpu, pc, operand_lower, operand_higher): #TOP (Triple NOP) Absolute
+    pc += 3
+
+    return pc
+
+
+def top_absolute_x(cpu, pc, operand_lower, operand_higher): #TOP (Triple NOP) Absolute, X
+    x = cpu.x
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + x) & 0xFFFF
+
+    #Page Crossing (+1 cycle)
+    cpu.cycle_count += ((base ^ addr) >> 8) & 1
+
+    pc += 3
+
+    return pc
+
+
+#Unstable Opcodes
+#
+# These depend on the chip (and on analog effects on the bus), so what they do is up to
+# cpu.unstable_opcodes (see CPU.unstable_opcode). When they run, they do what most NMOS
+# 6502s do: ANE and LXA use 0xEE for the unknown constant, and the SHA/SHX/SHY/TAS stores
+# AND the value with the high byte of the address + 1 and put it in the high byte when indexing
+# crosses a page.
+
+UNSTABLE_MAGIC = 0xEE
+
+
+def ane_immediate(cpu, pc, operand_lower, operand_higher): #ANE (A = (A OR magic) AND X AND immediate) Immediate
+    if not cpu.unstable_opcode(pc):
+        return pc
+
+    ac = cpu.ac
+    x = cpu.x
+    sr = cpu.sr
+
+    ac = (ac | UNSTABLE_MAGIC) & x & operand_lower
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.sr = sr
+    return pc
+
+
+def lxa_immediate(cpu, pc, operand_lower, operand_higher): #LXA (A and X = (A OR magic) AND immediate) Immediate
+    if not cpu.unstable_opcode(pc):
+        return pc
+
+    ac = cpu.ac
+    sr = cpu.sr
+
+    ac = (ac | UNSTABLE_MAGIC) & operand_lower
+    x = ac
+
+    sr = (sr & 0x7D) | NZ_FLAGS[ac]
+
+    pc += 2
+
+    cpu.ac = ac
+    cpu.x = x
+    cpu.sr = sr
+    return pc
+
+
+def sha_absolute_y(cpu, pc, operand_lower, operand_higher): #SHA (Store A AND X AND H+1) Absolute, Y
+    if not cpu.unstable_opcode(pc):
+        return pc
+
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    y = cpu.y
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + y) & 0xFFFF
+
+    value = ac & x & (((base >> 8) + 1) & 0xFF)
+    if (base ^ addr) & 0x100:
+        addr = (value << 8) | (addr & 0xFF)
+    ram_64KB[addr] = value
+
+    pc += 3
+
+    return pc
+
+
+def sha_indirect_y(cpu, pc, operand_lower, operand_higher): #SHA (Store A AND X AND H+1) Indirect, Y
+    if not cpu.unstable_opcode(pc):
+        return pc
+
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    y = cpu.y
+
+    zp = operand_lower
+
+    low = ram_64KB[zp]
+    high = ram_64KB[(zp + 1) & 0xFF]
+
+    base = (high << 8) | low
+    addr = (base + y) & 0xFFFF
+
+    value = ac & x & ((high + 1) & 0xFF)
+    if (base ^ addr) & 0x100:
+        addr = (value << 8) | (addr & 0xFF)
+    ram_64KB[addr] = value
+
+    pc += 2
+
+    return pc
+
+
+def shx_absolute_y(cpu, pc, operand_lower, operand_higher): #SHX (Store X AND H+1) Absolute, Y
+    if not cpu.unstable_opcode(pc):
+        return pc
+
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+    y = cpu.y
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + y) & 0xFFFF
+
+    value = x & ((operand_higher + 1) & 0xFF)
+    if (base ^ addr) & 0x100:
+        addr = (value << 8) | (addr & 0xFF)
+    ram_64KB[addr] = value
+
+    pc += 3
+
+    return pc
+
+
+def shy_absolute_x(cpu, pc, operand_lower, operand_higher): #SHY (Store Y AND H+1) Absolute, X
+    if not cpu.unstable_opcode(pc):
+        return pc
+
+    ram_64KB = cpu.ram_64KB
+    x = cpu.x
+    y = cpu.y
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + x) & 0xFFFF
+
+    value = y & ((operand_higher + 1) & 0xFF)
+    if (base ^ addr) & 0x100:
+        addr = (value << 8) | (addr & 0xFF)
+    ram_64KB[addr] = value
+
+    pc += 3
+
+    return pc
+
+
+def tas_absolute_y(cpu, pc, operand_lower, operand_higher): #TAS (SP = A AND X, store SP AND H+1) Absolute, Y
+    if not cpu.unstable_opcode(pc):
+        return pc
+
+    ram_64KB = cpu.ram_64KB
+    ac = cpu.ac
+    x = cpu.x
+    y = cpu.y
+
+    base = (operand_higher << 8) | operand_lower
+    addr = (base + y) & 0xFFFF
+
+    sp = ac & x
+    value = sp & ((operand_higher + 1) & 0xFF)
+    if (base ^ addr) & 0x100:
+        addr = (value << 8) | (addr & 0xFF)
+    ram_64KB[addr] = value
+
+    pc += 3
+
+    cpu.sp = sp
+    return pc
+
+
+def kil(cpu, pc, operand_lower, operand_higher): #KIL (Jam)
+    cpu.unstable_opcode(pc)
+    cpu.jam()
+
+    return pc
+
+
+#Opcode Table
+
+opcode_table = [None] * 256
+
+opcode_table[0x00] = brk                     #BRK Implied
+opcode_table[0x01] = ora_indirect_x          #ORA Indirect, X
+opcode_table[0x02] = kil                     #KIL (Jam)
+opcode_table[0x03] = slo_indirect_x          #SLO Indirect, X
+opcode_table[0x04] = dop                     #DOP Zero Page
+opcode_table[0x05] = ora_zero_page           #ORA Zero Page
+opcode_table[0x06] = asl_zero_page           #ASL Zero Page
+opcode_table[0x07] = slo_zero_page           #SLO Zero Page
+opcode_table[0x08] = php                     #PHP (Push Processor Status)
+opcode_table[0x09] = ora_immediate           #ORA Immediate
+opcode_table[0x0A] = asl_accumulator         #ASL Accumulator
+opcode_table[0x0B] = anc_immediate           #ANC Immediate
+opcode_table[0x0C] = top_absolute            #TOP Absolute
+opcode_table[0x0D] = ora_absolute            #ORA Absolute
+opcode_table[0x0E] = asl_absolute            #ASL Absolute
+opcode_table[0x0F] = slo_absolute            #SLO Absolute
+opcode_table[0x10] = bpl                     #BPL (Branch on Plus)
+opcode_table[0x11] = ora_indirect_y          #ORA Indirect, Y
+opcode_table[0x12] = kil                     #KIL (Jam)
+opcode_table[0x13] = slo_indirect_y          #SLO Indirect, Y
+opcode_table[0x14] = dop                     #DOP Zero Page, X
+opcode_table[0x15] = ora_zero_page_x         #ORA Zero Page, X
+opcode_table[0x16] = asl_zero_page_x         #ASL Zero Page, X
+opcode_table[0x17] = slo_zero_page_x         #SLO Zero Page, X
+opcode_table[0x18] = clc                     #CLC (Clear Carry)
+opcode_table[0x19] = ora_absolute_y          #ORA Absolute, Y
+opcode_table[0x1A] = nop                     #NOP Implied (undocumented)
+opcode_table[0x1B] = slo_absolute_y          #SLO Absolute, Y
+opcode_table[0x1C] = top_absolute_x          #TOP Absolute, X
+opcode_table[0x1D] = ora_absolute_x          #ORA Absolute, X
+opcode_table[0x1E] = asl_absolute_x          #ASL Absolute, X
+opcode_table[0x1F] = slo_absolute_x          #SLO Absolute, X
+opcode_table[0x20] = jsr_absolute            #JSR Absolute
+opcode_table[0x21] = and_indirect_x          #AND Indirect, X
+opcode_table[0x22] = kil                     #KIL (Jam)
+opcode_table[0x23] = rla_indirect_x          #RLA Indirect, X
+opcode_table[0x24] = bit_zero_page           #BIT Zero Page
+opcode_table[0x25] = and_zero_page           #AND Zero Page
+opcode_table[0x26] = rol_zero_page           #ROL Zero Page
+opcode_table[0x27] = rla_zero_page           #RLA Zero Page
+opcode_table[0x28] = plp                     #PLP (Pull Processor Status)
+opcode_table[0x29] = and_immediate           #AND Immediate
+opcode_table[0x2A] = rol_accumulator         #ROL Accumulator
+opcode_table[0x2B] = anc_immediate           #ANC Immediate
+opcode_table[0x2C] = bit_absolute            #BIT Absolute
+opcode_table[0x2D] = and_absolute            #AND Absolute
+opcode_table[0x2E] = rol_absolute            #ROL Absolute
+opcode_table[0x2F] = rla_absolute            #RLA Absolute
+opcode_table[0x30] = bmi                     #BMI (Branch on Minus)
+opcode_table[0x31] = and_indirect_y          #AND Indirect, Y
+opcode_table[0x32] = kil                     #KIL (Jam)
+opcode_table[0x33] = rla_indirect_y          #RLA Indirect, Y
+opcode_table[0x34] = dop                     #DOP Zero Page, X
+opcode_table[0x35] = and_zero_page_x         #AND Zero Page, X
+opcode_table[0x36] = rol_zero_page_x         #ROL Zero Page, X
+opcode_table[0x37] = rla_zero_page_x         #RLA Zero Page, X
+opcode_table[0x38] = sec                     #SEC (Set Carry)
+opcode_table[0x39] = and_absolute_y          #AND Absolute, Y
+opcode_table[0x3A] = nop                     #NOP Implied (undocumented)
+opcode_table[0x3B] = rla_absolute_y          #RLA Absolute, Y
+opcode_table[0x3C] = top_absolute_x          #TOP Absolute, X
+opcode_table[0x3D] = and_absolute_x          #AND Absolute, X
+opcode_table[0x3E] = rol_absolute_x          #ROL Absolute, X
+opcode_table[0x3F] = rla_absolute_x          #RLA Absolute, X
+opcode_table[0x40] = rti                     #RTI Implied
+opcode_table[0x41] = eor_indirect_x          #EOR Indirect, X
+opcode_table[0x42] = kil                     #KIL (Jam)
+opcode_table[0x43] = sre_indirect_x          #SRE Indirect, X
+opcode_table[0x44] = dop                     #DOP Zero Page
+opcode_table[0x45] = eor_zero_page           #EOR Zero Page
+opcode_table[0x46] = lsr_zero_page           #LSR Zero Page
+opcode_table[0x47] = sre_zero_page           #SRE Zero Page
+opcode_table[0x48] = pha                     #PHA (Push Accumulator)
+opcode_table[0x49] = eor_immediate           #EOR Immediate
+opcode_table[0x4A] = lsr_accumulator         #LSR Accumulator
+opcode_table[0x4B] = alr_immediate           #ALR Immediate
+opcode_table[0x4C] = jmp_absolute            #JMP Absolute
+opcode_table[0x4D] = eor_absolute            #EOR Absolute
+opcode_table[0x4E] = lsr_absolute            #LSR Absolute
+opcode_table[0x4F] = sre_absolute            #SRE Absolute
+opcode_table[0x50] = bvc                     #BVC (Branch on Overflow Clear)
+opcode_table[0x51] = eor_indirect_y          #EOR Indirect, Y
+opcode_table[0x52] = kil                     #KIL (Jam)
+opcode_table[0x53] = sre_indirect_y          #SRE Indirect, Y
+opcode_table[0x54] = dop                     #DOP Zero Page, X
+opcode_table[0x55] = eor_zero_page_x         #EOR Zero Page, X
+opcode_table[0x56] = lsr_zero_page_x         #LSR Zero Page, X
+opcode_table[0x57] = sre_zero_page_x         #SRE Zero Page, X
+opcode_table[0x58] = cli                     #CLI (Clear Interrupt)
+opcode_table[0x59] = eor_absolute_y          #EOR Absolute, Y
+opcode_table[0x5A] = nop                     #NOP Implied (undocumented)
+opcode_table[0x5B] = sre_absolute_y          #SRE Absolute, Y
+opcode_table[0x5C] = top_absolute_x          #TOP Absolute, X
+opcode_table[0x5D] = eor_absolute_x          #EOR Absolute, X
+opcode_table[0x5E] = lsr_absolute_x          #LSR Absolute, X
+opcode_table[0x5F] = sre_absolute_x          #SRE Absolute, X
+opcode_table[0x60] = rts                     #RTS Implied
+opcode_table[0x61] = adc_indirect_x          #ADC Indirect, X
+opcode_table[0x62] = kil                     #KIL (Jam)
+opcode_table[0x63] = rra_indirect_x          #RRA Indirect, X
+opcode_table[0x64] = dop                     #DOP Zero Page
+opcode_table[0x65] = adc_zero_page           #ADC Zero Page
+opcode_table[0x66] = ror_zero_page           #ROR Zero Page
+opcode_table[0x67] = rra_zero_page           #RRA Zero Page
+opcode_table[0x68] = pla                     #PLA (Pull Accumulator)
+opcode_table[0x69] = adc_immediate           #ADC Immediate
+opcode_table[0x6A] = ror_accumulator         #ROR Accumulator
+opcode_table[0x6B] = arr_immediate           #ARR Immediate
+opcode_table[0x6C] = jmp_indirect            #JMP Indirect
+opcode_table[0x6D] = adc_absolute            #ADC Absolute
+opcode_table[0x6E] = ror_absolute            #ROR Absolute
+opcode_table[0x6F] = rra_absolute            #RRA Absolute
+opcode_table[0x70] = bvs                     #BVS (Branch on Overflow Set)
+opcode_table[0x71] = adc_indirect_y          #ADC Indirect, Y
+opcode_table[0x72] = kil                     #KIL (Jam)
+opcode_table[0x73] = rra_indirect_y          #RRA Indirect, Y
+opcode_table[0x74] = dop                     #DOP Zero Page, X
+opcode_table[0x75] = adc_zero_page_x         #ADC Zero Page, X
+opcode_table[0x76] = ror_zero_page_x         #ROR Zero Page, X
+opcode_table[0x77] = rra_zero_page_x         #RRA Zero Page, X
+opcode_table[0x78] = sei                     #SEI (Set Interrupt)
+opcode_table[0x79] = adc_absolute_y          #ADC Absolute, Y
+opcode_table[0x7A] = nop                     #NOP Implied (undocumented)
+opcode_table[0x7B] = rra_absolute_y          #RRA Absolute, Y
+opcode_table[0x7C] = top_absolute_x          #TOP Absolute, X
+opcode_table[0x7D] = adc_absolute_x          #ADC Absolute, X
+opcode_table[0x7E] = ror_absolute_x          #ROR Absolute, X
+opcode_table[0x7F] = rra_absolute_x          #RRA Absolute, X
+opcode_table[0x80] = dop                     #DOP Immediate
+opcode_table[0x81] = sta_indirect_x          #STA Indirect, X
+opcode_table[0x82] = dop                     #DOP Immediate
+opcode_table[0x83] = sax_indirect_x          #SAX Indirect, X
+opcode_table[0x84] = sty_zero_page           #STY Zero Page
+opcode_table[0x85] = sta_zero_page           #STA Zero Page
+opcode_table[0x86] = stx_zero_page           #STX Zero Page
+opcode_table[0x87] = sax_zero_page           #SAX Zero Page
+opcode_table[0x88] = dey                     #DEY (Decrement Y)
+opcode_table[0x89] = dop                     #DOP Immediate
+opcode_table[0x8A] = txa                     #TXA (Transfer X to A)
+opcode_table[0x8B] = ane_immediate           #ANE Immediate (unstable)
+opcode_table[0x8C] = sty_absolute            #STY Absolute
+opcode_table[0x8D] = sta_absolute            #STA Absolute
+opcode_table[0x8E] = stx_absolute            #STX Absolute
+opcode_table[0x8F] = sax_absolute            #SAX Absolute
+opcode_table[0x90] = bcc                     #BCC (Branch on Carry Clear)
+opcode_table[0x91] = sta_indirect_y          #STA Indirect, Y
+opcode_table[0x92] = kil                     #KIL (Jam)
+opcode_table[0x93] = sha_indirect_y          #SHA Indirect, Y (unstable)
+opcode_table[0x94] = sty_zero_page_x         #STY Zero Page, X
+opcode_table[0x95] = sta_zero_page_x         #STA Zero Page, X
+opcode_table[0x96] = stx_zero_page_y         #STX Zero Page, Y
+opcode_table[0x97] = sax_zero_page_y         #SAX Zero Page, Y
+opcode_table[0x98] = tya                     #TYA (Transfer Y to A)
+opcode_table[0x99] = sta_absolute_y          #STA Absolute, Y
+opcode_table[0x9A] = txs                     #TXS (Transfer X to Stack ptr)
+opcode_table[0x9B] = tas_absolute_y          #TAS Absolute, Y (unstable)
+opcode_table[0x9C] = shy_absolute_x          #SHY Absolute, X (unstable)
+opcode_table[0x9D] = sta_absolute_x          #STA Absolute, X
+opcode_table[0x9E] = shx_absolute_y          #SHX Absolute, Y (unstable)
+opcode_table[0x9F] = sha_absolute_y          #SHA Absolute, Y (unstable)
+opcode_table[0xA0] = ldy_immediate           #LDY Immediate
+opcode_table[0xA1] = lda_indirect_x          #LDA Indirect, X
+opcode_table[0xA2] = ldx_immediate           #LDX Immediate
+opcode_table[0xA3] = lax_indirect_x          #LAX Indirect, X
+opcode_table[0xA4] = ldy_zero_page           #LDY Zero Page
+opcode_table[0xA5] = lda_zero_page           #LDA Zero Page
+opcode_table[0xA6] = ldx_zero_page           #LDX Zero Page
+opcode_table[0xA7] = lax_zero_page           #LAX Zero Page
+opcode_table[0xA8] = tay                     #TAY (Transfer A to Y)
+opcode_table[0xA9] = lda_immediate           #LDA Immediate
+opcode_table[0xAA] = tax                     #TAX (Transfer A to X)
+opcode_table[0xAB] = lxa_immediate           #LXA Immediate (unstable)
+opcode_table[0xAC] = ldy_absolute            #LDY Absolute
+opcode_table[0xAD] = lda_absolute            #LDA Absolute
+opcode_table[0xAE] = ldx_absolute            #LDX Absolute
+opcode_table[0xAF] = lax_absolute            #LAX Absolute
+opcode_table[0xB0] = bcs                     #BCS (Branch on Carry Set)
+opcode_table[0xB1] = lda_indirect_y          #LDA Indirect, Y
+opcode_table[0xB2] = kil                     #KIL (Jam)
+opcode_table[0xB3] = lax_indirect_y          #LAX Indirect, Y
+opcode_table[0xB4] = ldy_zero_page_x         #LDY Zero Page, X
+opcode_table[0xB5] = lda_zero_page_x         #LDA Zero Page, X
+opcode_table[0xB6] = ldx_zero_page_y         #LDX Zero Page, Y
+opcode_table[0xB7] = lax_zero_page_y         #LAX Zero Page, Y
+opcode_table[0xB8] = clv                     #CLV (Clear Overflow)
+opcode_table[0xB9] = lda_absolute_y          #LDA Absolute, Y
+opcode_table[0xBA] = tsx                     #TSX (Transfer Stack ptr to X)
+opcode_table[0xBB] = las_absolute_y          #LAS Absolute, Y
+opcode_table[0xBC] = ldy_absolute_x          #LDY Absolute, X
+opcode_table[0xBD] = lda_absolute_x          #LDA Absolute, X
+opcode_table[0xBE] = ldx_absolute_y          #LDX Absolute, Y
+opcode_table[0xBF] = lax_absolute_y          #LAX Absolute, Y
+opcode_table[0xC0] = cpy_immediate           #CPY Immediate
+opcode_table[0xC1] = cmp_indirect_x          #CMP Indirect, X
+opcode_table[0xC2] = dop                     #DOP Immediate
+opcode_table[0xC3] = dcp_indirect_x          #DCP Indirect, X
+opcode_table[0xC4] = cpy_zero_page           #CPY Zero Page
+opcode_table[0xC5] = cmp_zero_page           #CMP Zero Page
+opcode_table[0xC6] = dec_zero_page           #DEC Zero Page
+opcode_table[0xC7] = dcp_zero_page           #DCP Zero Page
+opcode_table[0xC8] = iny                     #INY (Increment Y)
+opcode_table[0xC9] = cmp_immediate           #CMP Immediate
+opcode_table[0xCA] = dex                     #DEX (Decrement X)
+opcode_table[0xCB] = sbx_immediate           #SBX Immediate
+opcode_table[0xCC] = cpy_absolute            #CPY Absolute
+opcode_table[0xCD] = cmp_absolute            #CMP Absolute
+opcode_table[0xCE] = dec_absolute            #DEC Absolute
+opcode_table[0xCF] = dcp_absolute            #DCP Absolute
+opcode_table[0xD0] = bne                     #BNE (Branch Not Equal)
+opcode_table[0xD1] = cmp_indirect_y          #CMP Indirect, Y
+opcode_table[0xD2] = kil                     #KIL (Jam)
+opcode_table[0xD3] = dcp_indirect_y          #DCP Indirect, Y
+opcode_table[0xD4] = dop                     #DOP Zero Page, X
+opcode_table[0xD5] = cmp_zero_page_x         #CMP Zero Page, X
+opcode_table[0xD6] = dec_zero_page_x         #DEC Zero Page, X
+opcode_table[0xD7] = dcp_zero_page_x         #DCP Zero Page, X
+opcode_table[0xD8] = cld                     #CLD (Clear Decimal)
+opcode_table[0xD9] = cmp_absolute_y          #CMP Absolute, Y
+opcode_table[0xDA] = nop                     #NOP Implied (undocumented)
+opcode_table[0xDB] = dcp_absolute_y          #DCP Absolute, Y
+opcode_table[0xDC] = top_absolute_x          #TOP Absolute, X
+opcode_table[0xDD] = cmp_absolute_x          #CMP Absolute, X
+opcode_table[0xDE] = dec_absolute_x          #DEC Absolute, X
+opcode_table[0xDF] = dcp_absolute_x          #DCP Absolute, X
+opcode_table[0xE0] = cpx_immediate           #CPX Immediate
+opcode_table[0xE1] = sbc_indirect_x          #SBC Indirect, X
+opcode_table[0xE2] = dop                     #DOP Immediate
+opcode_table[0xE3] = isc_indirect_x          #ISC Indirect, X
+opcode_table[0xE4] = cpx_zero_page           #CPX Zero Page
+opcode_table[0xE5] = sbc_zero_page           #SBC Zero Page
+opcode_table[0xE6] = inc_zero_page           #INC Zero Page
+opcode_table[0xE7] = isc_zero_page           #ISC Zero Page
+opcode_table[0xE8] = inx                     #INX (Increment X)
+opcode_table[0xE9] = sbc_immediate           #SBC Immediate
+opcode_table[0xEA] = nop                     #NOP Implied
+opcode_table[0xEB] = sbc_immediate           #SBC Immediate (undocumented copy)
+opcode_table[0xEC] = cpx_absolute            #CPX Absolute
+opcode_table[0xED] = sbc_absolute            #SBC Absolute
+opcode_table[0xEE] = inc_absolute            #INC Absolute
+opcode_table[0xEF] = isc_absolute            #ISC Absolute
+opcode_table[0xF0] = beq                     #BEQ (Branch on Equal)
+opcode_table[0xF1] = sbc_indirect_y          #SBC Indirect, Y
+opcode_table[0xF2] = kil                     #KIL (Jam)
+opcode_table[0xF3] = isc_indirect_y          #ISC Indirect, Y
+opcode_table[0xF4] = dop                     #DOP Zero Page, X
+opcode_table[0xF5] = sbc_zero_page_x         #SBC Zero Page, X
+opcode_table[0xF6] = inc_zero_page_x         #INC Zero Page, X
+opcode_table[0xF7] = isc_zero_page_x         #ISC Zero Page, X
+opcode_table[0xF8] = sed                     #SED (Set Decimal)
+opcode_table[0xF9] = sbc_absolute_y          #SBC Absolute, Y
+opcode_table[0xFA] = nop                     #NOP Implied (undocumented)
+opcode_table[0xFB] = isc_absolute_y          #ISC Absolute, Y
+opcode_table[0xFC] = top_absolute_x          #TOP Absolute, X
+opcode_table[0xFD] = sbc_absolute_x          #SBC Absolute, X
+opcode_table[0xFE] = inc_absolute_x          #INC Absolute, X
+opcode_table[0xFF] = isc_absolute_x          #ISC Absolute, X
+
+
+
+#Opcode Lengths and Timing
+#
+# One place for the size and timing of every opcode (NMOS 6502, undocumented opcodes included),
+# for the dispatch loop, the block translator and anything that traces or disassembles code.
+# The dispatch loop adds OPCODE_CYCLES before calling the handler; the handlers only add the
+# extra cycles listed in OPCODE_PENALTIES, since only they know the address or branch target.
+# tests/test_mos_6502_cpu.py runs every handler to check it adds what OPCODE_PENALTIES says.
+
+# Bytes taken by each opcode, NMOS 6502 (undocumented opcodes included)
+OPCODE_LENGTHS = [
+#   x0  x1  x2  x3  x4  x5  x6  x7  x8  x9  xA  xB  xC  xD  xE  xF
+     1,  2,  1,  2,  2,  2,  2,  2,  1,  2,  1,  2,  3,  3,  3,  3, #0x
+     2,  2,  1,  2,  2,  2,  2,  2,  1,  3,  1,  3,  3,  3,  3,  3, #1x
+     3,  2,  1,  2,  2,  2,  2,  2,  1,  2,  1,  2,  3,  3,  3,  3, #2x
+     2,  2,  1,  2,  2,  2,  2,  2,  1,  3,  1,  3,  3,  3,  3,  3, #3x
+     1,  2,  1,  2,  2,  2,  2,  2,  1,  2,  1,  2,  3,  3,  3,  3, #4x
+     2,  2,  1,  2,  2,  2,  2,  2,  1,  3,  1,  3,  3,  3,  3,  3, #5x
+     1,  2,  1,  2,  2,  2,  2,  2,  1,  2,  1,  2,  3,  3,  3,  3, #6x
+     2,  2,  1,  2,  2,  2,  2,  2,  1,  3,  1,  3,  3,  3,  3,  3, #7x
+     2,  2,  2,  2,  2,  2,  2,  2,  1,  2,  1,  2,  3,  3,  3,  3, #8x
+     2,  2,  1,  2,  2,  2,  2,  2,  1,  3,  1,  3,  3,  3,  3,  3, #9x
+     2,  2,  2,  2,  2,  2,  2,  2,  1,  2,  1,  2,  3,  3,  3,  3, #Ax
+     2,  2,  1,  2,  2,  2,  2,  2,  1,  3,  1,  3,  3,  3,  3,  3, #Bx
+     2,  2,  2,  2,  2,  2,  2,  2,  1,  2,  1,  2,  3,  3,  3,  3, #Cx
+     2,  2,  1,  2,  2,  2,  2,  2,  1,  3,  1,  3,  3,  3,  3,  3, #Dx
+     2,  2,  2,  2,  2,  2,  2,  2,  1,  2,  1,  2,  3,  3,  3,  3, #Ex
+     2,  2,  1,  2,  2,  2,  2,  2,  1,  3,  1,  3,  3,  3,  3,  3, #Fx
+]
+
+# Base cycles of each opcode
+OPCODE_CYCLES = [
+#   x0  x1  x2  x3  x4  x5  x6  x7  x8  x9  xA  xB  xC  xD  xE  xF
+     7,  6,  2,  8,  3,  3,  5,  5,  3,  2,  2,  2,  4,  4,  6,  6, #0x
+     2,  5,  2,  8,  4,  4,  6,  6,  2,  4,  2,  7,  4,  4,  7,  7, #1x
+     6,  6,  2,  8,  3,  3,  5,  5,  4,  2,  2,  2,  4,  4,  6,  6, #2x
+     2,  5,  2,  8,  4,  4,  6,  6,  2,  4,  2,  7,  4,  4,  7,  7, #3x
+     6,  6,  2,  8,  3,  3,  5,  5,  3,  2,  2,  2,  3,  4,  6,  6, #4x
+     2,  5,  2,  8,  4,  4,  6,  6,  2,  4,  2,  7,  4,  4,  7,  7, #5x
+     6,  6,  2,  8,  3,  3,  5,  5,  4,  2,  2,  2,  5,  4,  6,  6, #6x
+     2,  5,  2,  8,  4,  4,  6,  6,  2,  4,  2,  7,  4,  4,  7,  7, #7x
+     2,  6,  2,  6,  3,  3,  3,  3,  2,  2,  2,  2,  4,  4,  4,  4, #8x
+     2,  6,  2,  6,  4,  4,  4,  4,  2,  5,  2,  5,  5,  5,  5,  5, #9x
+     2,  6,  2,  6,  3,  3,  3,  3,  2,  2,  2,  2,  4,  4,  4,  4, #Ax
+     2,  5,  2,  5,  4,  4,  4,  4,  2,  4,  2,  4,  4,  4,  4,  4, #Bx
+     2,  6,  2,  8,  3,  3,  5,  5,  2,  2,  2,  2,  4,  4,  6,  6, #Cx
+     2,  5,  2,  8,  4,  4,  6,  6,  2,  4,  2,  7,  4,  4,  7,  7, #Dx
+     2,  6,  2,  8,  3,  3,  5,  5,  2,  2,  2,  2,  4,  4,  6,  6, #Ex
+     2,  5,  2,  8,  4,  4,  6,  6,  2,  4,  2,  7,  4,  4,  7,  7, #Fx
+]
+
+NO_PENALTY = 0
+PAGE_PENALTY = 1   #+1 cycle when the indexed address is in another page than the base address
+BRANCH_PENALTY = 2 #+1 cycle when the branch is taken, +1 more when the target is in another page
+
+OPCODE_PENALTIES = [
+#   x0  x1  x2  x3  x4  x5  x6  x7  x8  x9  xA  xB  xC  xD  xE  xF
+     0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, #0x
+     2,  1,  0,  0,  0,  0,  0,  0,  0,  1,  0,  0,  1,  1,  0,  0, #1x
+     0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, #2x
+     2,  1,  0,  0,  0,  0,  0,  0,  0,  1,  0,  0,  1,  1,  0,  0, #3x
+     0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, #4x
+     2,  1,  0,  0,  0,  0,  0,  0,  0,  1,  0,  0,  1,  1,  0,  0, #5x
+     0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, #6x
+     2,  1,  0,  0,  0,  0,  0,  0,  0,  1,  0,  0,  1,  1,  0,  0, #7x
+     0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, #8x
+     2,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, #9x
+     0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, #Ax
+     2,  1,  0,  1,  0,  0,  0,  0,  0,  1,  0,  1,  1,  1,  1,  1, #Bx
+     0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, #Cx
+     2,  1,  0,  0,  0,  0,  0,  0,  0,  1,  0,  0,  1,  1,  0,  0, #Dx
+     0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, #Ex
+     2,  1,  0,  0,  0,  0,  0,  0,  0,  1,  0,  0,  1,  1,  0,  0, #Fx
+]
+
+
+
+#Lazy Flags
+#
+# The lazy table is made from the handlers above: every
+#   sr = (sr & 0x7D) | NZ_FLAGS[value]
+# becomes
+#   cpu.nz = value
+# and a handler left with nothing else to do with sr stops loading and storing it.
+# The few handlers that read N/Z or replace the whole status register are written out below.
+
+def lazy_bpl(cpu, pc, operand_lower, operand_higher): #BPL (Branch on Plus)
+    offset = operand_lower
+    if offset & 0x80:
+        offset -= 0x100
+
+    pc += 2
+    if not (cpu.nz & 0x180):
+        target = (pc + offset) & 0xFFFF
+
+        #Branch Taken (+1 cycle, +1 more into another page)
+        cpu.cycle_count += 1 + (((pc ^ target) >> 8) & 1)
+        pc = target
+
+    return pc
+
+
+def lazy_bmi(cpu, pc, operand_lower, operand_higher): #BMI (Branch on Minus)
+    offset = operand_lower
+    if offset & 0x80:
+        offset -= 0x100
+
+    pc += 2
+    if cpu.nz & 0x180:
+        target = (pc + offset) & 0xFFFF
+
+        #Branch Taken (+1 cycle, +1 more into another page)
+        cpu.cycle_count += 1 + (((pc ^ target) >> 8) & 1)
+        pc = target
+
+    return pc
+
+
+def lazy_bne(cpu, pc, operand_lower, operand_higher): #BNE (Branch Not Equal)
+    offset = operand_lower
+    if offset & 0x80:
+        offset -= 0x100
+
+    pc += 2
+    if cpu.nz & 0xFF:
+        target = (pc + offset) & 0xFFFF
+
+        #Branch Taken (+1 cycle, +1 more into another page)
+        cpu.cycle_count += 1 + (((pc ^ target) >> 8) & 1)
+        pc = target
+
+    return pc
+
+
+def lazy_beq(cpu, pc, operand_lower, operand_higher): #BEQ (Branch on Equal)
+    offset = operand_lower
+    if offset & 0x80:
+        offset -= 0x100
+
+    pc += 2
+    if not (cpu.nz & 0xFF):
+        target = (pc + offset) & 0xFFFF
+
+        #Branch Taken (+1 cycle, +1 more into another page)
+        cpu.cycle_count += 1 + (((pc ^ target) >> 8) & 1)
+        pc = target
+
+    return pc
+
+
+def lazy_bit_zero_page(cpu, pc, operand_lower, operand_higher): #BIT Zero Page
+    ram_64KB = cpu.ram_64KB
+
+    value = ram_64KB[operand_lower]
+
+    # V is copied from bit 6 of memory, N from bit 7 (kept in bit 8 of nz) and Z comes from A & M
+    cpu.sr = (cpu.sr & 0xBF) | (value & 0x40)
+    cpu.nz = ((value & 0x80) << 1) | (cpu.ac & value)
+
+    pc += 2
+
+    return pc
+
+
+def lazy_bit_absolute(cpu, pc, operand_lower, operand_higher): #BIT Absolute
+    ram_64KB = cpu.ram_64KB
+
+    value = ram_64KB[(operand_higher << 8) | operand_lower]
+
+    # V is copied from bit 6 of memory, N from bit 7 (kept in bit 8 of nz) and Z comes from A & M
+    cpu.sr = (cpu.sr & 0xBF) | (value & 0x40)
+    cpu.nz = ((value & 0x80) << 1) | (cpu.ac & value)
+
+    pc += 3
+
+    return pc
+
+
+def lazy_php(cpu, pc, operand_lower, operand_higher): #PHP (Push Processor Status)
+    cpu.sync_flags()
+    cpu.push_byte(cpu.sr)
+    pc += 1
+
+    return pc
+
+
+def lazy_plp(cpu, pc, operand_lower, operand_higher): #PLP (Pull Processor Status)
+    pc = plp(cpu, pc, operand_lower, operand_higher)
+
+    sr = cpu.sr
+    cpu.nz = ((sr & 0x80) << 1) | (0x00 if sr & 0x02 else 0x01)
+
+    return pc
+
+
+def lazy_rti(cpu, pc, operand_lower, operand_higher): #RTI Implied
+    pc = rti(cpu, pc, operand_lower, operand_higher)
+
+    sr = cpu.sr
+    cpu.nz = ((sr & 0x80) << 1) | (0x00 if sr & 0x02 else 0x01)
+
+    return pc
+
+
+lazy_overrides = {
+    bpl: lazy_bpl,
+    bmi: lazy_bmi,
+    bne: lazy_bne,
+    beq: lazy_beq,
+    bit_zero_page: lazy_bit_zero_page,
+    bit_absolute: lazy_bit_absolute,
+    php: lazy_php,
+    plp: lazy_plp,
+    rti: lazy_rti,
+}
+
+
+class LazyFlagsTransformer(ast.NodeTransformer):
+    # sr = (sr & 0x7D) | NZ_FLAGS[value]  ->  cpu.nz = value
+    # (and the same for LAZY_NZ_FLAGS, where value is already in the nz form)
+
+    def visit_Assign(self, node):
+        value = node.value
+        if (len(node.targets) == 1 and isinstance(node.targets[0], ast.Name) and node.targets[0].id == "sr"
+                and isinstance(value, ast.BinOp) and isinstance(value.op, ast.BitOr)
+                and isinstance(value.left, ast.BinOp) and isinstance(value.left.op, ast.BitAnd)
+                and isinstance(value.left.left, ast.Name) and value.left.left.id == "sr"
+                and isinstance(value.left.right, ast.Constant) and value.left.right.value == 0x7D
+                and isinstance(value.right, ast.Subscript)
+                and isinstance(value.right.value, ast.Name) and value.right.value.id in ("NZ_FLAGS", "LAZY_NZ_FLAGS")):
+            target = ast.Attribute(value=ast.Name(id="cpu", ctx=ast.Load()), attr="nz", ctx=ast.Store())
+            return ast.copy_location(ast.Assign(targets=[target], value=value.right.slice), node)
+        return node
+
+
+def is_register_load(statement, register):
+    # <register> = cpu.<register>
+    return (isinstance(statement, ast.Assign) and len(statement.targets) == 1
+            and isinstance(statement.targets[0], ast.Name) and statement.targets[0].id == register
+            and isinstance(statement.value, ast.Attribute) and statement.value.attr == register)
+
+def is_register_store(statement, register):
+    # cpu.<register> = <register>
+    return (isinstance(statement, ast.Assign) and len(statement.targets) == 1
+            and isinstance(statement.targets[0], ast.Attribute) and statement.targets[0].attr == register
+            and isinstance(statement.value, ast.Name) and statement.value.id == register)
+
+
+def handler_ast(handler):
+    # Syntax tree of a handler, with the line numbers it has in this file
+    # (handlers made from a syntax tree keep it in .tree)
+    if hasattr(handler, "tree"):
+        return copy.deepcopy(handler.tree)
+    lines, first_line = inspect.getsourcelines(handler)
+    tree = ast.parse("".join(lines).lstrip())
+    ast.increment_lineno(tree, first_line - 1)
+    return tree
+
+
+def make_lazy_handler(handler):
+    tree = handler_ast(handler)
+    function = tree.body[0]
+
+    LazyFlagsTransformer().visit(function)
+
+    # Drop the sr = cpu.sr / cpu.sr = sr pair when nothing in between uses sr any more
+    body = function.body
+    other_uses = [
+        node for statement in body
+        if not (is_register_load(statement, "sr") or is_register_store(statement, "sr"))
+        for node in ast.walk(statement) if isinstance(node, ast.Name) and node.id == "sr"
+    ]
+    if not other_uses:
+        function.body = [
+            statement for statement in body
+            if not (is_register_load(statement, "sr") or is_register_store(statement, "sr"))
+        ]
+
+    for node in ast.walk(function):
+        if isinstance(node, ast.Name) and node.id in ("NZ_FLAGS", "LAZY_NZ_FLAGS"):
+            raise ValueError(f"{handler.__name__} reads N/Z in a way the lazy flags can't rewrite")
+
+    ast.fix_missing_locations(tree)
+    return compile_handler(tree, handler)
+
+
+def compile_handler(tree, handler):
+    # The function defined by tree, a changed copy of handler's syntax tree
+    namespace = {}
+    exec(compile(tree, inspect.getsourcefile(handler), "exec"), handler.__globals__, namespace)
+    function = namespace[handler.__name__]
+    function.tree = tree
+    return function
+
+
+lazy_opcode_table = None
+
+def build_lazy_opcode_table():
+    # Built the first time a lazy flags CPU is made, so it costs nothing otherwise
+    global lazy_opcode_table
+    if lazy_opcode_table is None:
+        lazy_handlers = {}
+        for handler in opcode_table:
+            if handler not in lazy_handlers:
+                if handler in lazy_overrides:
+                    lazy_handlers[handler] = lazy_overrides[handler]
+                else:
+                    lazy_handlers[handler] = make_lazy_handler(handler)
+        lazy_opcode_table = [lazy_handlers[handler] for handler in opcode_table]
+    return lazy_opcode_table
+
+
+
+#Block Translator
+#
+# A block is a straight run of instructions from a start address up to the first branch, jump,
+# RTS/RTI or BRK. The handler bodies of the run are copied one after another into a single
+# generated Python function, with the operands put in as constants, the registers kept in
+# locals for the whole block and the cycle counts added up:
+#
+#   def block_0202(cpu):                    INY
+#       x = cpu.x                           DEX
+#       y = cpu.y                           BNE $0202
+#       sr = cpu.sr
+#       y = (y + 1) & 0xFF                  (INY's N/Z update is dropped, DEX overwrites it)
+#       x = (x - 1) & 0xFF
+#       sr = (sr & 0x7D) | NZ_FLAGS[x]
+#       pc = 0x0204
+#       ...BNE...
+#
+# Blocks are compiled once and kept by start address. Every store checks cpu.code_bytes, which
+# counts the blocks translated from each address, so writing over translated code drops those
+# blocks (ending the block doing the write) and the new bytes are translated when they next run.
+# Instructions a block can't hold (BRK) are called through the CPU's handler table at the end of the block.
+
+REGISTERS = ("ac", "x", "y", "sr", "sp")
+
+MAX_BLOCK_INSTRUCTIONS = 32
+MAX_BLOCK_BYTES = MAX_BLOCK_INSTRUCTIONS * 3
+
+class InlineHandler:
+    # A handler body ready to be copied into a block
+    __slots__ = ("body", "length", "ends_block")
+
+    def __init__(self, body, length, ends_block):
+        self.body = body             #Statements, without the register loads and stores
+        self.length = length         #How far the handler moves pc (None when ends_block)
+        self.ends_block = ends_block #Sets pc itself, so body keeps its pc code and returns
+
+
+def names_in(statements):
+    return [node for statement in statements for node in ast.walk(statement) if isinstance(node, ast.Name)]
+
+def is_pc_advance(statement):
+    # pc += <constant>
+    return (isinstance(statement, ast.AugAssign) and isinstance(statement.op, ast.Add)
+            and isinstance(statement.target, ast.Name) and statement.target.id == "pc"
+            and isinstance(statement.value, ast.Constant))
+
+def is_nz_update(statement):
+    # sr = (sr & 0x7D) | NZ_FLAGS[value]
+    return (isinstance(statement, ast.Assign) and isinstance(statement.targets[0], ast.Name)
+            and statement.targets[0].id == "sr" and isinstance(statement.value, ast.BinOp)
+            and isinstance(statement.value.right, ast.Subscript)
+            and isinstance(statement.value.right.value, ast.Name)
+            and statement.value.right.value.id in ("NZ_FLAGS", "LAZY_NZ_FLAGS")
+            and ast.unparse(statement.value.left) == "sr & 125")
+
+
+inline_handlers = {}
+
+def inline_handler(handler):
+    # InlineHandler for handler, or None if its body does more than registers, memory and cycles
+    # (base cycles come from OPCODE_CYCLES, only page crossing and branch penalties are in the body)
+    if handler in inline_handlers:
+        return inline_handlers[handler]
+
+    function = handler_ast(handler).body[0]
+
+    stored = set()
+    kept = []
+    for statement in function.body:
+        if any(is_register_load(statement, register) for register in REGISTERS + ("ram_64KB",)):
+            continue
+        register = next((register for register in REGISTERS if is_register_store(statement, register)), None)
+        if register is not None:
+            stored.add(register)
+            continue
+        kept.append(statement)
+
+    body = []
+    length = None
+    for statement in kept:
+        if is_pc_advance(statement) and length is None:
+            length = statement.value.value
+        else:
+            body.append(statement)
+    if body and isinstance(body[-1], ast.Return) and ast.unparse(body[-1]) == "return pc":
+        body.pop()
+
+    names = names_in(body)
+    ends_block = length is None or any(name.id == "pc" for name in names) or any(
+        isinstance(node, ast.Return) for statement in body for node in ast.walk(statement))
+    if ends_block:
+        body = kept
+        names = names_in(body)
+        length = None
+
+    info = InlineHandler(body, length, ends_block)
+
+    # Anything else done through cpu (interrupts, halting) has to go through the handler itself
+    cpu_uses = sum(1 for name in names if name.id == "cpu")
+    cycle_uses = sum(1 for statement in body for node in ast.walk(statement)
+                     if isinstance(node, ast.Attribute) and node.attr == "cycle_count")
+    if cpu_uses != cycle_uses:
+        info = None
+
+    # A register name used as a scratch variable would clobber the block's register
+    for name in names:
+        if isinstance(name.ctx, ast.Store) and (
+                (name.id in REGISTERS and name.id not in stored) or name.id.startswith("operand_")):
+            info = None
+
+    inline_handlers[handler] = info
+    return info
+
+
+class OperandInliner(ast.NodeTransformer):
+    # operand_lower/operand_higher -> the bytes that follow the opcode
+
+    def __init__(self, operand_lower, operand_higher):
+        self.operands = {"operand_lower": operand_lower, "operand_higher": operand_higher}
+
+    def visit_Name(self, node):
+        if node.id in self.operands:
+            return ast.copy_location(ast.Constant(self.operands[node.id]), node)
+        return node
+
+
+class StoreChecker(ast.NodeTransformer):
+    # ram_64KB[addr] = value  ->  the same, then drop any translated code at addr
+
+    def __init__(self):
+        self.stores = 0
+
+    def visit_Assign(self, node):
+        target = node.targets[0]
+        if not (isinstance(target, ast.Subscript) and isinstance(target.value, ast.Name)
+                and target.value.id == "ram_64KB"):
+            return node
+
+        self.stores += 1
+        statements = []
+        if not isinstance(target.slice, (ast.Name, ast.Constant)):
+            statements.append(ast.Assign(targets=[ast.Name(id="write_addr", ctx=ast.Store())], value=target.slice))
+            target.slice = ast.Name(id="write_addr", ctx=ast.Load())
+        addr = ast.unparse(target.slice)
+        statements.append(node)
+        statements += ast.parse(
+            f"if code_bytes[{addr}]:\n"
+            f"    cpu.invalidate_code({addr})\n"
+            f"    code_written = True\n"
+        ).body
+        return statements
+
+
+class ReturnExits(ast.NodeTransformer):
+    # return pc  ->  write the registers back, add the cycles so far, return pc
+
+    def __init__(self, exit_statements):
+        self.exit_statements = exit_statements
+
+    def visit_Return(self, node):
+        return self.exit_statements() + [node]
+
+
+def drop_dead_nz_updates(statements):
+    # An N/Z update is dead when a later one replaces it before anything reads sr
+    live = True
+    kept = []
+    for statement in reversed(statements):
+        if is_nz_update(statement):
+            if not live:
+                continue
+            live = False
+        elif any(name.id == "sr" for name in names_in([statement])):
+            live = True
+        kept.append(statement)
+    kept.reverse()
+    return kept
+
+
+def translate_block(ram_64KB, start, max_instructions=MAX_BLOCK_INSTRUCTIONS, bus_layout=None):
+    # Compile the block at start (for the memory map bus_layout, see #Memory Bus). Returns the
+    # block function, with .start and .end (the bytes it was translated from) set on it.
+    code, end = compile_block(ram_64KB, start, max_instructions, bus_layout)
+    return make_block(code, start, end)
+
+
+def make_block(code, start, end):
+    # Block function from the code compile_block made (or the block cache loaded)
+    namespace = {}
+    exec(code, globals(), namespace)
+    block = namespace[f"block_{start:04X}"]
+    block.start = start
+    block.end = end
+    block.code = code
+    return block
+
+
+def compile_block(ram_64KB, start, max_instructions, bus_layout=None):
+    # Generate and compile the source for the block at start
+    # Returns the compiled module (defining block_XXXX) and the end of the bytes it covers
+    instructions = [] #(statements, ends, next pc, cycles up to here not yet in cpu.cycle_count)
+    pc = start
+    end = start
+    cycles = 0
+    synced = 0 #Cycles already added to cpu.cycle_count
+    stores = 0
+    idle_loop = False #The block is a loop back to start that only reads memory
+    for count in range(max_instructions):
+        opcode = ram_64KB[pc]
+        operand_lower = ram_64KB[(pc + 1) & 0xFFFF]
+        operand_higher = ram_64KB[(pc + 2) & 0xFFFF]
+        handler = opcode_table[opcode]
+        info = inline_handler(handler)
+
+        length = OPCODE_LENGTHS[opcode]
+        if info is not None and info.length is not None:
+            length = max(length, info.length)
+        end = max(end, min(pc + length, 0x10000))
+        cycles += OPCODE_CYCLES[opcode]
+
+        if info is None or pc + length > 0xFFFF:
+            # Leave it to the handler (wrapping pc if it runs off the end of memory)
+            call = f"return cpu.opcode_table[{opcode:#04x}](cpu, {pc:#06x}, {operand_lower:#04x}, {operand_higher:#04x})"
+            if pc + length > 0xFFFF:
+                call += " & 0xFFFF"
+            instructions.append((ast.parse(call).body, "call", pc, cycles - synced))
+            break
+
+        body = [OperandInliner(operand_lower, operand_higher).visit(statement) for statement in copy.deepcopy(info.body)]
+        if bus_layout is not None:
+            body = bus_accesses(body, bus_layout)
+            if any(name.id in ("read_pages", "write_pages") for name in names_in(body)):
+                # A device may look at cpu.cycle_count, so it counts up to this instruction
+                # (as in the dispatch loop, which adds the cycles before calling the handler)
+                body = ast.parse(f"cpu.cycle_count += {cycles - synced}").body + body
+                synced = cycles
+        checker = StoreChecker()
+        body = [new for statement in body for new in listify(checker.visit(statement))]
+        stores += checker.stores
+
+        if info.ends_block:
+            body = ast.parse(f"pc = {pc:#06x}").body + body
+            instructions.append((body, "return", pc, cycles - synced))
+            if opcode == 0x4C: #JMP Absolute
+                target = (operand_higher << 8) | operand_lower
+            elif opcode & 0x1F == 0x10: #Branches
+                target = (pc + 2 + operand_lower - ((operand_lower & 0x80) << 1)) & 0xFFFF
+            else:
+                target = None
+            idle_loop = target == start and stores == 0
+            break
+
+        pc += info.length
+        instructions.append((body, "check" if checker.stores else None, pc, cycles - synced))
+    else:
+        instructions.append(([], "end", pc, cycles - synced))
+
+    statements = [statement for body, ends, next_pc, cycles in instructions for statement in body]
+    names = names_in(statements)
+    used = [register for register in REGISTERS if any(name.id == register for name in names)]
+    written = [register for register in REGISTERS if any(
+        name.id == register and isinstance(name.ctx, ast.Store) for name in names)]
+
+    def exit_statements(cycles, idle_check=False):
+        source = "".join(f"cpu.{register} = {register}\n" for register in written)
+        if cycles:
+            source += f"cpu.cycle_count += {cycles}\n"
+        if idle_check:
+            # Back at the start with the registers it started with: every pass from here on is the same
+            source += (f"if pc == {start:#06x} and ({''.join(register + ', ' for register in used)}) == idle_state:\n"
+                       f"    cpu.skip_idle(cpu.cycle_count - idle_cycle)\n")
+        return ast.parse(source).body
+
+    body = []
+    for statements, ends, next_pc, cycles in instructions:
+        if ends in ("call", "return"):
+            statements = [new for statement in statements
+                          for new in listify(ReturnExits(lambda: exit_statements(cycles, idle_loop)).visit(statement))]
+        body += statements
+        if ends == "check":
+            body += ast.parse(f"if code_written:\n    pass").body
+            body[-1].body = exit_statements(cycles) + ast.parse(f"return {next_pc:#06x}").body
+        elif ends == "end":
+            body += exit_statements(cycles) + ast.parse(f"return {next_pc:#06x}").body
+
+    prologue = ""
+    if any(name.id == "ram_64KB" for name in names):
+        prologue += "ram_64KB = cpu.ram_64KB\n"
+    prologue += "".join(f"{pages} = cpu.{pages}\n" for pages in BUS_TABLES
+                        if any(name.id == pages for name in names))
+    if stores:
+        prologue += "code_bytes = cpu.code_bytes\ncode_written = False\n"
+    prologue += "".join(f"{register} = cpu.{register}\n" for register in used)
+    if idle_loop:
+        prologue += f"idle_cycle = cpu.cycle_count\nidle_state = ({''.join(register + ', ' for register in used)})\n"
+
+    name = f"block_{start:04X}"
+    function = ast.parse(f"def {name}(cpu):\n    pass").body[0]
+    function.body = ast.parse(prologue).body + drop_dead_nz_updates(body)
+    tree = ast.Module(body=[function], type_ignores=[])
+    ast.fix_missing_locations(tree)
+
+    source = ast.unparse(tree)
+    return compile(source, f"<{name}>", "exec"), end
+
+
+def listify(node):
+    # NodeTransformer.visit on a statement gives back a node or a list of them
+    return node if isinstance(node, list) else [node]
+
+
+
+#Block Cache
+#
+# Translating the same ROM code every time the emulator starts is wasted work, so the blocks of
+# mapped ROMs (CPU.map_rom) are marshalled to BLOCK_CACHE_DIR. One file per ROM, named after a hash
+# of the ROM bytes and of the emulator itself (this file and the Python bytecode version), so a
+# changed ROM or a changed translator never picks up old blocks. The file is only read when the
+# first block from that ROM is needed, and that is when files left by other versions are deleted.
+# Regions are saved when they are dropped, and the ones still around at exit by one exit hook.
+# The cache is per user (MOS_6502_BLOCK_CACHE sets another directory, and so does
+# CPU.map_rom(cache_dir=...)). It is only a cache: if it can't be read or written the blocks are
+# translated again.
+
+def user_cache_dir():
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "mos_6502_cpu"
+
+BLOCK_CACHE_DIR = Path(os.environ.get("MOS_6502_BLOCK_CACHE") or user_cache_dir() / "Block Cache")
+
+emulator_version_key = None
+pruned_cache_dirs = set()
+unsaved_rom_regions = weakref.WeakSet()
+exit_hook_registered = False
+
+
+def emulator_version():
+    # Anything that changes the generated code changes this (hex, it goes in the cache file names)
+    global emulator_version_key
+    if emulator_version_key is None:
+        version = importlib.util.MAGIC_NUMBER + Path(__file__).read_bytes()
+        emulator_version_key = hashlib.sha256(version).hexdigest()[:16]
+    return emulator_version_key
+
+
+def prune_block_cache(cache_dir):
+    # Delete the cache files of other emulator versions, they can never be used again
+    if cache_dir in pruned_cache_dirs:
+        return
+    pruned_cache_dirs.add(cache_dir)
+    version = emulator_version()
+    try:
+        for path in cache_dir.glob("*.blocks"):
+            if not path.stem.endswith(" " + version):
+                path.unlink(missing_ok=True)
+    except OSError as error:
+        log.debug("Can't prune the block cache in %s: %s", cache_dir, error)
+
+
+def save_on_exit(region):
+    # One exit hook for all the regions, held weakly so the CPUs they belong to can still go away
+    global exit_hook_registered
+    if not exit_hook_registered:
+        atexit.register(save_rom_regions)
+        exit_hook_registered = True
+    unsaved_rom_regions.add(region)
+
+
+def save_rom_regions():
+    for region in list(unsaved_rom_regions):
+        region.save()
+
+
+class RomRegion:
+    # A mapped ROM and its cached blocks
+    __slots__ = ("start", "end", "rom", "path", "blocks", "new_blocks", "__weakref__")
+
+    def __init__(self, ram_64KB, start, end, cache_dir):
+        self.start = start
+        self.end = end
+        self.rom = array('B', ram_64KB[start:end]) #The bytes as mapped, blocks are only cached while memory still matches
+
+        rom_key = hashlib.sha256(self.rom.tobytes()).hexdigest()[:16]
+        self.path = Path(cache_dir) / f"{start:04X}-{end - 1:04X} {rom_key} {emulator_version()}.blocks"
+
+        self.blocks = None #(start, max_instructions, memory map) -> (code, end), read from path on first use
+        self.new_blocks = 0
+
+    def matches(self, ram_64KB, start, end):
+        # Are start..end-1 all inside the ROM and unchanged since it was mapped?
+        return end <= self.end and ram_64KB[start:end] == self.rom[start - self.start:end - self.start]
+
+    def block(self, ram_64KB, pc, max_instructions, bus_layout=None):
+        if self.blocks is None:
+            self.blocks = self.load()
+
+        key = (pc, max_instructions, bus_layout and hashlib.sha256(bus_layout).hexdigest()[:16])
+        if key in self.blocks:
+            code, end = self.blocks[key]
+            if self.matches(ram_64KB, pc, end):
+                return make_block(code, pc, end)
+
+        code, end = compile_block(ram_64KB, pc, max_instructions, bus_layout)
+        if self.matches(ram_64KB, pc, end):
+            self.blocks[key] = (code, end)
+            self.new_blocks += 1
+        return make_block(code, pc, end)
+
+    def __del__(self):
+        self.save()
+
+    def load(self):
+        prune_block_cache(self.path.parent)
+        try:
+            blocks = marshal.loads(self.path.read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            return {}
+        if not isinstance(blocks, dict):
+            return {}
+        return blocks
+
+    def save(self):
+        if not self.new_blocks:
+            return
+        self.new_blocks = 0
+        temp_path = self.path.with_suffix(".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_bytes(marshal.dumps(self.blocks))
+            temp_path.replace(self.path)
+        except OSError as error:
+            # Runs at exit, where raising would only print a traceback
+            log.debug("Can't save the block cache to %s: %s", self.path, error)
+
+
+
+#Superinstructions
+#
+# Short instruction sequences that show up everywhere (DEX; BNE loops, CMP #imm; BEQ tests, ...)
+# can run as one fused handler: the handler table entry of the first opcode executes it, looks at
+# the opcode that follows and, if it continues one of the fused sequences, executes that one too
+# without going back through the dispatch loop. The bodies are the handler bodies themselves (as in
+# the block translator), so cycles and flags are exactly those of the separate instructions.
+# Sequences come from COMMON_FUSIONS or from CPU.profile_sequences() on the program being run.
+
+COMMON_FUSIONS = [
+    (0xCA, 0xD0), #DEX; BNE
+    (0x88, 0xD0), #DEY; BNE
+    (0xE8, 0xD0), #INX; BNE
+    (0xC8, 0xD0), #INY; BNE
+    (0xC9, 0xF0), #CMP #imm; BEQ
+    (0xC9, 0xD0), #CMP #imm; BNE
+    (0xE0, 0xD0), #CPX #imm; BNE
+    (0xC0, 0xD0), #CPY #imm; BNE
+    (0xA5, 0x8D), #LDA zp; STA abs
+    (0xA5, 0x85), #LDA zp; STA zp
+    (0xB1, 0x91), #LDA (zp),Y; STA (zp),Y
+    (0xC8, 0xB1), #INY; LDA (zp),Y
+]
+
+
+def can_fuse(sequence):
+    # Every instruction but the last has to carry on to the next one
+    infos = [inline_handler(opcode_table[opcode]) for opcode in sequence]
+    return (len(sequence) > 1 and all(info is not None for info in infos)
+            and not any(info.ends_block for info in infos[:-1]))
+
+
+def fusion_name(sequence):
+    return "; ".join(opcode_table[opcode].__name__ for opcode in sequence)
+
+
+def build_fused_handler(head, tails, fusion_index, bus_layout=None):
+    # Handler for opcode head that also runs any of the sequences in tails that follows it
+    # (tails: tuples of the opcodes after head, fusion_index: sequence -> slot in cpu.fusion_counts,
+    # bus_layout: the memory map, see #Memory Bus)
+    trie = {}
+    for tail in tails:
+        node = trie
+        for opcode in tail:
+            node = node.setdefault(opcode, {})
+        node[None] = fusion_index[(head,) + tail]
+
+    opcodes = {head} | {opcode for tail in tails for opcode in tail}
+    names = names_in([statement for opcode in opcodes for statement in inline_handler(opcode_table[opcode]).body])
+    used = [register for register in REGISTERS if any(name.id == register for name in names)]
+    written = [register for register in REGISTERS if any(
+        name.id == register and isinstance(name.ctx, ast.Store) for name in names)]
+
+    def exit_statements(count_slot):
+        # Write the registers back (and count the fusion that got this far)
+        source = "".join(f"cpu.{register} = {register}\n" for register in written)
+        if count_slot is not None:
+            source += f"cpu.fusion_counts[{count_slot}] += 1\n"
+        return ast.parse(source).body
+
+    def instruction(opcode, first):
+        # Body of one instruction, leaving pc on the next one
+        info = inline_handler(opcode_table[opcode])
+        body = copy.deepcopy(info.body)
+        if bus_layout is not None:
+            body = bus_accesses(body, bus_layout)
+        statements = []
+        if not first:
+            # The dispatch loop only counted the head
+            statements += ast.parse(f"cpu.cycle_count += {OPCODE_CYCLES[opcode]}").body
+            operands = {name.id for name in names_in(body)}
+            if "operand_lower" in operands:
+                statements += ast.parse("operand_lower = ram_64KB[pc + 1 & 0xFFFF]").body
+            if "operand_higher" in operands:
+                statements += ast.parse("operand_higher = ram_64KB[pc + 2 & 0xFFFF]").body
+        statements += body
+        if not info.ends_block:
+            statements += ast.parse(f"pc += {info.length}").body
+        return statements, info.ends_block
+
+    def follow(node):
+        # Statements that carry on from pc according to node
+        statements = []
+        chain = None
+        for opcode, child in node.items():
+            if opcode is None:
+                continue
+            body, ends = instruction(opcode, False)
+            if ends:
+                body = [new for statement in body
+                        for new in listify(ReturnExits(lambda: exit_statements(child[None])).visit(statement))]
+            else:
+                body += follow(child)
+            test = ast.parse(f"if opcode == {opcode:#04x}:\n    pass").body[0]
+            test.body = body
+            if chain is None:
+                statements += ast.parse("opcode = ram_64KB[pc & 0xFFFF]").body
+                statements.append(test)
+            else:
+                chain.orelse = [test]
+            chain = test
+        return statements + exit_statements(node.get(None)) + ast.parse("return pc").body
+
+    body, ends = instruction(head, True)
+    body += follow(trie)
+
+    prologue = "ram_64KB = cpu.ram_64KB\n"
+    prologue += "".join(f"{pages} = cpu.{pages}\n" for pages in BUS_TABLES
+                        if any(name.id == pages for name in names_in(body)))
+    prologue += "".join(f"{register} = cpu.{register}\n" for register in used)
+
+    name = f"fused_{opcode_table[head].__name__}"
+    function = ast.parse(f"def {name}(cpu, pc, operand_lower, operand_higher):\n    pass").body[0]
+    function.body = ast.parse(prologue).body + body
+    tree = ast.Module(body=[function], type_ignores=[])
+    ast.fix_missing_locations(tree)
+
+    namespace = {}
+    exec(compile(ast.unparse(tree), f"<{name}>", "exec"), globals(), namespace)
+    return namespace[name]
+
+
+
+#Idle Loops
+#
+# Polling loops (LDA $D011; BPL back, JMP to itself) spend their time re-reading memory that nothing
+# changes until the machine around the CPU does something, which only happens between run() batches.
+# Once such a loop has gone round with the same registers twice, the CPU credits the cycles of all
+# the passes that fit before cycle_limit (the next event) in one go. Memory reads are taken to
+# have no side effects here. Translated blocks check for this themselves; with the handler table
+# the branch and JMP handlers are wrapped.
+
+MAX_IDLE_LOOP_BYTES = 16
+
+IDLE_BRANCH_OPCODES = (0x10, 0x30, 0x50, 0x70, 0x90, 0xB0, 0xD0, 0xF0, 0x4C) #Branches, JMP Absolute
+
+
+def stores_memory(statements):
+    return any(isinstance(node, ast.Subscript) and isinstance(node.ctx, ast.Store)
+               and isinstance(node.value, ast.Name) and node.value.id == "ram_64KB"
+               for statement in statements for node in ast.walk(statement))
+
+
+pure_loops = {}
+
+def is_pure_loop(ram_64KB, start, end):
+    # Does the loop from start to the branch/JMP back at end only read memory and set registers?
+    key = (start, bytes(ram_64KB[start:end + 3]))
+    if key not in pure_loops:
+        pc = start
+        while pc < end:
+            info = inline_handler(opcode_table[ram_64KB[pc]])
+            if info is None or info.ends_block or stores_memory(info.body):
+                break
+            pc += info.length
+        pure_loops[key] = pc == end
+    return pure_loops[key]
+
+
+def make_idle_branch(handler):
+    # handler, also telling the CPU when it closes a short loop
+    def idle_branch(cpu, pc, operand_lower, operand_higher):
+        target = handler(cpu, pc, operand_lower, operand_higher)
+        if target <= pc and pc - target <= MAX_IDLE_LOOP_BYTES:
+            state = (target, cpu.ac, cpu.x, cpu.y, cpu.sr, cpu.sp, cpu.nz)
+            if state == cpu.idle_state:
+                cpu.idle_loop(target, pc)
+            else:
+                cpu.idle_state = state
+                cpu.idle_cycle = cpu.cycle_count
+        else:
+            cpu.idle_state = None
+        return target
+
+    idle_branch.__name__ = handler.__name__
+    return idle_branch
+
+
+def wrap_idle_branches(table):
+    table = list(table)
+    for opcode in IDLE_BRANCH_OPCODES:
+        table[opcode] = make_idle_branch(table[opcode])
+    return table
+
+
+
+#Memory Bus
+#
+# Each 256-byte page of the address space is RAM, ROM or I/O, as set in cpu.read_pages and
+# cpu.write_pages (one entry per page, see CPU.map_rom and CPU.map_io):
+#   None                  : read or written straight in ram_64KB (RAM, and reads of ROM)
+#   function(addr)        : read_pages entry of an I/O page, returns the byte read
+#   function(addr, value) : write_pages entry of an I/O page, or rom_write for a ROM page
+#
+# While every page is plain memory the handlers are used as they are. Otherwise the opcode table
+# is made from the handlers (as for the lazy flags) with their memory accesses rewritten:
+#   ram_64KB[addr]          ->  (ram_64KB[addr] if read_pages[addr >> 8] is None else read_pages[addr >> 8](addr))
+#   ram_64KB[addr] = value  ->  if write_pages[addr >> 8] is None: ram_64KB[addr] = value
+#                               else: write_pages[addr >> 8](addr, value)
+# An access whose page is known up front is not checked at all: zero page and stack accesses
+# (while those pages are plain memory, the usual case) stay as they were, and so do accesses to
+# a constant address in translated blocks (absolute addressing). Only I/O pages pay for a call.
+# Instruction fetches always go straight to ram_64KB. Stack accesses (0x0100 + sp) are known to
+# be in page 1, so they are only checked when page 1 is mapped; push_byte and pull_byte (used for
+# interrupts) check it too.
+#
+# With track_dirty on, the handlers are rewritten even while every page is plain memory, and each
+# store into ram_64KB also sets its page in cpu.dirty_pages:
+#   ram_64KB[addr] = value  ->  ram_64KB[addr] = value; dirty_pages[addr >> 8] = 1
+# Writes to ROM and I/O pages don't change ram_64KB, so they don't mark anything.
+#
+# cpu.bus_layout describes the map to the code generators: 256 bytes for read_pages, 256 for
+# write_pages (1 where the page is plain memory), then 1 if stores mark dirty pages.
+
+# Tables the rewritten code loads from the cpu when it uses them
+BUS_TABLES = ("read_pages", "write_pages", "dirty_pages")
+
+def rom_write(addr, value):
+    # Writes to ROM are dropped
+    pass
+
+
+# Names that always hold a byte, so an address made of one of them is in page 0
+BYTE_NAMES = ("operand_lower", "operand_higher", "ac", "x", "y", "sp")
+
+def known_page(expression, pages):
+    # The page an address expression always falls in, or None
+    # (pages: the known page of local names, from known_pages())
+    if isinstance(expression, ast.Constant) and isinstance(expression.value, int):
+        return expression.value >> 8
+    if isinstance(expression, ast.Name):
+        if expression.id in BYTE_NAMES:
+            return 0
+        return pages.get(expression.id)
+    if isinstance(expression, ast.BinOp):
+        if not any(isinstance(node, ast.Name) for node in ast.walk(expression)):
+            #Constant address (operands put in by the block translator)
+            return eval(compile(ast.Expression(expression), "<address>", "eval")) >> 8
+        if isinstance(expression.op, ast.BitAnd):
+            for side in (expression.left, expression.right):
+                if isinstance(side, ast.Constant) and side.value <= 0xFF:
+                    return 0
+        if isinstance(expression.op, ast.Add):
+            #0x0100 + sp
+            for base, offset in ((expression.left, expression.right), (expression.right, expression.left)):
+                if (isinstance(base, ast.Constant) and not base.value & 0xFF
+                        and known_page(offset, pages) == 0):
+                    return (base.value >> 8) & 0xFF
+    return None
+
+def known_pages(statements):
+    # Page of every local name assigned in statements that always holds an address in one page
+    assignments = {}
+    for statement in statements:
+        for node in ast.walk(statement):
+            if isinstance(node, ast.Assign):
+                for target in node.targets:
+                    for name in ast.walk(target):
+                        if isinstance(name, ast.Name):
+                            values = assignments.setdefault(name.id, [])
+                            values.append(node.value if target is name else None)
+            elif isinstance(node, (ast.AugAssign, ast.NamedExpr)) and isinstance(node.target, ast.Name):
+                assignments.setdefault(node.target.id, []).append(None)
+
+    pages = {}
+    for rounds in range(3): #Names made from other names
+        for name, values in assignments.items():
+            found = {known_page(value, pages) if value is not None else None for value in values}
+            if len(found) == 1 and None not in found:
+                pages[name] = found.pop()
+    return pages
+
+
+class BusTransformer(ast.NodeTransformer):
+    # ram_64KB accesses -> accesses through the page table, see above
+
+    def __init__(self, pages, bus_layout):
+        self.pages = pages
+        self.read_plain = bus_layout[:256]
+        self.write_plain = bus_layout[256:512]
+        self.all_reads_plain = all(self.read_plain) #Only ROM or dirty tracking, reads stay as they are
+        self.all_writes_plain = all(self.write_plain)
+        self.mark_dirty = bus_layout[512]
+
+    def dirty(self, page):
+        # Statements marking page (an expression) dirty
+        if not self.mark_dirty:
+            return []
+        return ast.parse(f"dirty_pages[{page}] = 1").body
+
+    def visit_Subscript(self, node):
+        self.generic_visit(node)
+        if not (isinstance(node.value, ast.Name) and node.value.id == "ram_64KB" and isinstance(node.ctx, ast.Load)):
+            return node
+        if self.all_reads_plain:
+            return node
+
+        address = node.slice
+        page = known_page(address, self.pages)
+        if page is not None:
+            if self.read_plain[page]:
+                return node
+            return ast.copy_location(ast.parse(f"read_pages[{page}]({ast.unparse(address)})", mode="eval").body, node)
+
+        if isinstance(address, ast.Name):
+            name = address.id
+            source = f"(ram_64KB[{name}] if read_pages[{name} >> 8] is None else read_pages[{name} >> 8]({name}))"
+        else:
+            source = (f"(ram_64KB[read_addr] if read_pages[(read_addr := {ast.unparse(address)}) >> 8] is None"
+                      f" else read_pages[read_addr >> 8](read_addr))")
+        return ast.copy_location(ast.parse(source, mode="eval").body, node)
+
+    def visit_Assign(self, node):
+        target = node.targets[0]
+        if not (isinstance(target, ast.Subscript) and isinstance(target.value, ast.Name)
+                and target.value.id == "ram_64KB"):
+            self.generic_visit(node)
+            return node
+
+        node.value = self.visit(node.value)
+        target.slice = self.visit(target.slice)
+        address = target.slice
+        value = ast.unparse(node.value)
+        page = known_page(address, self.pages)
+        if page is not None:
+            if self.write_plain[page]:
+                return [node] + self.dirty(page)
+            return ast.parse(f"write_pages[{page}]({ast.unparse(address)}, {value})").body
+
+        statements = []
+        if not isinstance(address, ast.Name):
+            statements += ast.parse(f"write_addr = {ast.unparse(address)}").body
+            target.slice = ast.Name(id="write_addr", ctx=ast.Load())
+        name = ast.unparse(target.slice)
+        store = [node] + self.dirty(f"{name} >> 8")
+        if self.all_writes_plain:
+            return statements + store
+        check = ast.parse(f"if write_pages[{name} >> 8] is None:\n    pass\n"
+                          f"else:\n    write_pages[{name} >> 8]({name}, {value})").body[0]
+        check.body = store
+        return statements + [check]
+
+
+def bus_accesses(statements, bus_layout):
+    # statements (one handler body) with their memory accesses going through the page table
+    transformer = BusTransformer(known_pages(statements), bus_layout)
+    return [new for statement in statements for new in listify(transformer.visit(statement))]
+
+
+def make_bus_handler(handler, bus_layout):
+    tree = handler_ast(handler)
+    function = tree.body[0]
+    function.body = bus_accesses(function.body, bus_layout)
+
+    names = {name.id for name in names_in(function.body)}
+    function.body = [statement for pages in BUS_TABLES if pages in names
+                     for statement in ast.parse(f"{pages} = cpu.{pages}").body] + function.body
+
+    ast.fix_missing_locations(tree)
+    return compile_handler(tree, handler)
+
+
+bus_opcode_tables = {}
+
+def bus_opcode_table(lazy_flags, bus_layout):
+    # Handler table for a memory map (None: every page is plain memory), made once per map
+    table = build_lazy_opcode_table() if lazy_flags else opcode_table
+    if bus_layout is None:
+        return table
+
+    key = (lazy_flags, bus_layout)
+    if key not in bus_opcode_tables:
+        bus_handlers = {}
+        for handler in table:
+            if handler not in bus_handlers:
+                bus_handlers[handler] = make_bus_handler(handler, bus_layout)
+        bus_opcode_tables[key] = [bus_handlers[handler] for handler in table]
+    return bus_opcode_tables[key]
+
+
+
+
+
+#----------Command Line----------
+#   python -m mos_6502_cpu apple1|atari2600|raw [--rom PATH] [--headless] [--turbo] [--frames N] [--core CORE]
+#
+# Importing this module only sets up the core. Each machine (with its frontend) is a module in
+# Machines, imported when it is run.
+
+base_path = Path(__file__).parent
+
+MACHINES = {
+    "apple1": "apple_i_machine",
+    "atari2600": "atari_2600_machine",
+    "raw": "raw_6502asm_machine",
+}
+
+# How the machine's CPU executes code. These can't be combined, so each is a separate choice:
+#   blocks : translated blocks (see #Block Translator), the fastest
+#   fused  : the handler table with COMMON_FUSIONS (see #Superinstructions)
+#   lazy   : the handler table with lazy N/Z flags (see #Lazy Flags)
+CORES = ("blocks", "fused", "lazy")
+
+def machine_cpu(ram_64KB, pc, core="blocks"):
+    # The CPU a machine runs on, for the core picked with --core
+    if core not in CORES:
+        raise ValueError(f"core must be one of {', '.join(CORES)}, not {core!r}")
+    cpu = CPU(ram_64KB, pc, lazy_flags=core == "lazy", translate_blocks=core == "blocks", skip_idle=True)
+    if core == "fused":
+        cpu.fuse(COMMON_FUSIONS)
+    return cpu
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m mos_6502_cpu", description="MOS 6502 emulator")
+    parser.add_argument("machine", choices=MACHINES, help="Machine to run")
+    parser.add_argument("--rom", type=Path,
+                        help="apple1: folder holding the Woz Monitor and BASIC ROMs, atari2600: cartridge .bin, "
+                             "raw: binary to load instead of the built-in program")
+    parser.add_argument("--start", type=lambda text: int(text, 16), default=0x0000,
+                        help="raw: hex address the binary is loaded at and run from (default 0000)")
+    parser.add_argument("--headless", action="store_true",
+                        help="No window and no graphics imports, the screen is only kept in arrays")
+    parser.add_argument("--terminal", action="store_true",
+                        help="apple1: keyboard from stdin and display to stdout, no window and no speed limit "
+                             "(pipe in a BASIC program or Woz Monitor commands)")
+    parser.add_argument("--turbo", action="store_true", help="Don't wait for vsync, run as fast as the core goes")
+    parser.add_argument("--frames", type=int, help="Stop after this many frames")
+    parser.add_argument("--core", choices=CORES, default="blocks",
+                        help="blocks: translated blocks (default), fused: handler table with the common "
+                             "instruction pairs fused, lazy: handler table with lazy N/Z flags")
+    args = parser.parse_args(argv)
+
+    if args.machine == "atari2600" and args.rom is None:
+        parser.error("atari2600 needs --rom (the cartridge .bin)")
+
+    # Only the machine being run (and its ROM loader and frontend) is imported. Returns what the
+    # machine's main() returns: the CPU, and the screen for apple1 and atari2600
+    sys.path[:0] = [str(base_path / "Machines"), str(base_path / "Rom Loaders")]
+    return importlib.import_module(MACHINES[args.machine]).main(args)
+
+
+if __name__ == "__main__":
+    # The machines import the core as mos_6502_cpu, make that this module rather than a second copy
+    sys.modules["mos_6502_cpu"] = sys.modules["__main__"]
+    main()
@@ -0,0 +1,131 @@
+#----------CPU Core Tests----------
+#   python -m pytest tests
+from array import array
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from mos_6502_cpu import BRANCH_PENALTY, CORES, CPU, OPCODE_PENALTIES, PAGE_PENALTY, machine_cpu
+
+
+
+def load(*pieces):
+    # 64KB of RAM with each (address, bytes) piece copied in
+    ram_64KB = array('B', bytes(0x10000))
+    for address, data in pieces:
+        ram_64KB[address:address + len(data)] = array('B', data)
+    return ram_64KB
+
+
+
+# LDA #$FF; PHA; PHA; RTS  ->  returns to $FFFF + 1 = $0000
+# $0000: LDA #$42; STA $10; JMP $0004
+RTS_TO_ZERO = [0xA9, 0xFF, 0x48, 0x48, 0x60]
+AT_ZERO = [0xA9, 0x42, 0x85, 0x10, 0x4C, 0x04, 0x00]
+
+@pytest.mark.parametrize("core", CORES)
+def test_rts_wraps_to_0000_run(core):
+    ram_64KB = load((0x0200, RTS_TO_ZERO), (0x0000, AT_ZERO))
+    cpu = machine_cpu(ram_64KB, 0x0200, core)
+    cpu.run(200)
+    assert ram_64KB[0x10] == 0x42
+    assert cpu.pc == 0x0004
+
+@pytest.mark.parametrize("options", [{}, {"lazy_flags": True}, {"translate_blocks": True}])
+def test_rts_wraps_to_0000_step(options):
+    ram_64KB = load((0x0200, RTS_TO_ZERO), (0x0000, AT_ZERO))
+    cpu = CPU(ram_64KB, 0x0200, **options)
+    for count in range(4):
+        cpu.step()
+    assert cpu.pc == 0x0000
+    for count in range(3):
+        cpu.step()
+    assert ram_64KB[0x10] == 0x42
+    assert cpu.pc == 0x0004
+
+
+
+# LDX #1; NOP; NOP; LDA $D000; INX; STA $D001; LDA $D000,X; LDY #0; STA ($10),Y; STA $F000; JMP $0202
+DEVICE_LOOP = [0xA2, 0x01, 0xEA, 0xEA, 0xAD, 0x00, 0xD0, 0xE8, 0x8D, 0x01, 0xD0, 0xBD, 0x00, 0xD0,
+               0xA0, 0x00, 0x91, 0x10, 0x8D, 0x00, 0xF0, 0x4C, 0x02, 0x02]
+
+def device_cycles(options):
+    # cycle_count as seen by the device at each access
+    ram_64KB = load((0x0200, DEVICE_LOOP), (0x0010, [0x05, 0xD0]))
+    cpu = CPU(ram_64KB, 0x0200, **options)
+    seen = []
+    def read(addr):
+        seen.append(cpu.cycle_count)
+        return 0
+    def write(addr, value):
+        seen.append(cpu.cycle_count)
+    cpu.map_io(0xD000, 0xD100, read, write)
+    cpu.map_io(0xF000, 0xF100, write=write)
+    cpu.run(200)
+    return seen
+
+def test_devices_see_the_same_cycles_in_blocks():
+    handler_table = device_cycles({})
+    blocks = device_cycles({"translate_blocks": True})
+    assert blocks[:len(handler_table)] == handler_table
+    assert device_cycles({"lazy_flags": True}) == handler_table
+
+
+
+def handler_penalties(options, opcode, pc, index):
+    # Cycles the handler for opcode adds by itself (operands $10 $30, ($10) -> $3010),
+    # with flags set and clear so that branches are taken and not taken
+    found = set()
+    for sr, nz in ((0x00, 0x01), (0xFF, 0x00), (0xFF, 0x80)):
+        ram_64KB = load((0x0010, [0x10, 0x30]))
+        cpu = CPU(ram_64KB, pc, **options)
+        cpu.x = cpu.y = index
+        cpu.sr = sr
+        cpu.nz = nz
+        cpu.cycle_count = 0
+        cpu.opcode_table[opcode](cpu, pc, 0x10, 0x30)
+        found.add(cpu.cycle_count)
+    return found
+
+@pytest.mark.parametrize("options", [{}, {"lazy_flags": True}])
+def test_handlers_add_the_penalties_in_the_table(options):
+    for opcode in range(256):
+        same_page = handler_penalties(options, opcode, 0x2000, 0x00)
+        crossed = handler_penalties(options, opcode, 0x2000, 0xFF) #$3010 + $FF
+        far_branch = handler_penalties(options, opcode, 0x20F0, 0x00) #$20F2 + $10
+        penalty = OPCODE_PENALTIES[opcode]
+        if penalty == BRANCH_PENALTY:
+            expected = ({0, 1}, {0, 1}, {0, 2})
+        elif penalty == PAGE_PENALTY:
+            expected = ({0}, {1}, {0})
+        else:
+            expected = ({0}, {0}, {0})
+        assert (same_page, crossed, far_branch) == expected, f"opcode {opcode:02X}"
+
+
+
+# CLI; KIL at $0200, reset vector -> $0300: LDA #$42; STA $10; JMP $0305
+JAM = [0x58, 0x02]
+AFTER_RESET = [0xA9, 0x42, 0x85, 0x10, 0x4C, 0x05, 0x03]
+
+@pytest.mark.parametrize("core", CORES)
+def test_only_reset_clears_a_jam(core):
+    ram_64KB = load((0x0200, JAM), (0x0300, AFTER_RESET), (0xFFFA, [0x00, 0x04, 0x00, 0x03, 0x00, 0x04]))
+    cpu = machine_cpu(ram_64KB, 0x0200, core)
+    assert cpu.run(100) >= 100
+    assert cpu.jammed and cpu.pc == 0x0201
+
+    cpu.set_irq(True)
+    cpu.set_nmi(True)
+    assert cpu.run(100) >= 100
+    cpu.step()
+    assert cpu.jammed and cpu.pc == 0x0201
+
+    cpu.set_irq(False)
+    cpu.reset()
+    assert not cpu.jammed and cpu.pc == 0x0300
+    cpu.run(100)
+    assert ram_64KB[0x10] == 0x42